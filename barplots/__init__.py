@@ -2,5 +2,24 @@
 
 from barplots.barplots import barplots
 from barplots.barplot import barplot
+from barplots.update_barplot import update_barplot
+from barplots.animated_barplot import animated_barplot
+from barplots.abarplot import abarplot
+from barplots.abarplots import abarplots
+from barplots.plot_spec import PlotSpec
+from barplots.render_pool import RenderPool
+from barplots.watch_barplots import watch_barplots
+from barplots.sql_barplots import sql_barplots
 
-__all__ = ["barplots", "barplot"]
+__all__ = [
+    "barplots",
+    "barplot",
+    "update_barplot",
+    "animated_barplot",
+    "abarplot",
+    "abarplots",
+    "PlotSpec",
+    "RenderPool",
+    "watch_barplots",
+    "sql_barplots",
+]
@@ -0,0 +1,53 @@
+"""Module implementing the asynchronous plotting of a barplot."""
+
+from typing import Any, Tuple
+import pandas as pd
+import matplotlib.pyplot as plt
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+from barplots.barplot import barplot
+from barplots.utils import run_in_render_executor
+
+
+def render_barplot(df: pd.DataFrame, **kwargs: Any) -> Tuple[Figure, Axes]:
+    """Plot barplot and close its figure, unless it is a template.
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        Dataframe from which to extract data for plotting barplot.
+    kwargs: Any
+        Parameters to be passed to barplot.
+    """
+    figure, axes = barplot(df, **kwargs)
+    if kwargs.get("template") is None:
+        plt.close(figure)
+    return figure, axes
+
+
+async def abarplot(df: pd.DataFrame, **kwargs: Any) -> Tuple[Figure, Axes]:
+    """Plot barplot in the managed render executor, without blocking the event loop.
+
+    The renderings in flight are limited, so that the following ones wait
+    before being submitted to the executor. When the awaiting task is
+    cancelled, the rendering stops before its following stage, either
+    drawing, layout or encoding. The returned figure is closed, so that
+    it is not kept by pyplot, but it can still be saved.
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        Dataframe from which to extract data for plotting barplot.
+    kwargs: Any
+        Parameters to be passed to barplot.
+
+    Raises
+    ------
+    ValueError
+        If the parameters are not valid for barplot.
+
+    Returns
+    -------
+    Tuple containing Figure and Axes of created barplot.
+    """
+    return await run_in_render_executor(render_barplot, df=df, **kwargs)
@@ -0,0 +1,104 @@
+"""Module implementing the asynchronous plotting of multiple barplots."""
+
+import asyncio
+import threading
+from typing import Any, AsyncIterator, Tuple
+import pandas as pd
+import matplotlib.pyplot as plt
+from matplotlib.axis import Axis
+from matplotlib.figure import Figure
+from barplots.barplots import barplots
+from barplots.utils import run_in_render_executor
+
+
+async def abarplots(
+    df: pd.DataFrame, max_pending: int = 2, **kwargs: Any
+) -> AsyncIterator[Tuple[Figure, Axis]]:
+    """Yield the barplots of each feature as soon as they are rendered.
+
+    The barplots are rendered by barplots in the managed render executor,
+    which hands each barplot to the event loop and renders the following
+    ones until the given number of barplots is waiting to be consumed, so
+    that a slow consumer neither holds the executor after each barplot
+    nor piles up all of them in memory. The yielded figures are closed,
+    so that they are not kept by pyplot, but they can still be saved. As
+    each figure is yielded while the following ones are rendered, the
+    figures cannot be reused as templates. When the
+    iteration is stopped, the rendering stops before its following stage,
+    either aggregation, drawing, layout or encoding. To stop it as soon
+    as the iteration is interrupted, close the iterator, for instance
+    with contextlib.aclosing.
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        Dataframe from which to extract data for plotting barplots.
+    max_pending: int = 2
+        Maximum number of rendered barplots waiting to be consumed,
+        beyond which the rendering waits for the consumer.
+    kwargs: Any
+        Parameters to be passed to barplots.
+
+    Raises
+    ------
+    ValueError
+        If the maximum number of pending barplots is not positive.
+    ValueError
+        If a template is requested.
+    ValueError
+        If the parameters are not valid for barplots.
+    """
+    if max_pending < 1:
+        raise ValueError(
+            "The maximum number of pending barplots must be positive, "
+            f"but {max_pending} was given."
+        )
+
+    if kwargs.get("template"):
+        raise ValueError(
+            "It is not possible to use a template with abarplots, as the "
+            "yielded figures would be updated while they are consumed."
+        )
+
+    loop = asyncio.get_running_loop()
+    rendered: "asyncio.Queue[Tuple[Figure, Axis]]" = asyncio.Queue()
+    # The rendering waits while the pending barplots are not consumed.
+    pending = threading.Semaphore(max_pending)
+    stopped = threading.Event()
+
+    def on_render(figure: Figure, axes: Axis):
+        plt.close(figure)
+        pending.acquire()
+        if not stopped.is_set():
+            loop.call_soon_threadsafe(rendered.put_nowait, (figure, axes))
+
+    rendering = asyncio.ensure_future(
+        run_in_render_executor(barplots, df=df, on_render=on_render, **kwargs)
+    )
+
+    getter = None
+
+    try:
+        while True:
+            getter = asyncio.ensure_future(rendered.get())
+            await asyncio.wait([getter, rendering], return_when=asyncio.FIRST_COMPLETED)
+            if getter.done():
+                pending.release()
+                yield getter.result()
+                continue
+            getter.cancel()
+            # The barplots are put in the queue before the rendering completes.
+            while not rendered.empty():
+                pending.release()
+                yield rendered.get_nowait()
+            rendering.result()
+            return
+    finally:
+        if getter is not None:
+            getter.cancel()
+        if not rendering.done():
+            rendering.cancel()
+            # The rendering may be waiting for a pending barplot to be consumed.
+            stopped.set()
+            pending.release()
+            await asyncio.wait([rendering])
@@ -0,0 +1,263 @@
+"""Module implementing the export of animated barplots."""
+
+import io
+import os
+from itertools import chain
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+import matplotlib as mpl
+import pandas as pd
+from PIL import GifImagePlugin, Image
+from matplotlib import animation
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+from sanitize_ml_labels import is_normalized_metric, is_absolutely_normalized_metric
+from barplots.barplot import barplot
+from barplots.update_barplot import update_barplot
+from barplots.utils import get_value_limits
+
+# Options of barplot which are also needed to update the bars.
+UPDATE_OPTIONS = ("bar_width", "space_width", "min_std", "orientation", "subplots")
+
+
+def render_frames(
+    figure: Figure,
+    axes: Axes,
+    frames: Sequence[pd.DataFrame],
+    frame_labels: Optional[Sequence[str]],
+    update_options: Dict,
+) -> Iterator[Figure]:
+    """Yield the figure updated with each of the given frames in turn.
+
+    Parameters
+    ----------
+    figure: Figure
+        The figure of the barplot.
+    axes: Axes
+        The axes of the barplot.
+    frames: Sequence[pd.DataFrame]
+        The dataframes of the frames.
+    frame_labels: Optional[Sequence[str]]
+        The labels to show on the top right of the figure for each frame.
+    update_options: Dict
+        The options to be passed to update_barplot.
+    """
+    label = None
+    if frame_labels is not None:
+        label = figure.text(
+            0.99,
+            0.99,
+            "",
+            horizontalalignment="right",
+            verticalalignment="top",
+            weight="bold",
+        )
+
+    for i, frame in enumerate(frames):
+        update_barplot(figure, axes, frame, **update_options)
+        if label is not None:
+            label.set_text(frame_labels[i])
+        yield figure
+
+
+def write_gif(path: str, figures: Iterator[Figure], fps: float):
+    """Write the given figures as the frames of a GIF, one frame at a time.
+
+    Each figure is rendered, quantized to its own palette and appended to
+    the GIF, so that only the frame being written is kept in memory. All
+    the frames are cropped to the content of the first one, as the saved
+    pictures, so that they share the same size.
+
+    Parameters
+    ----------
+    path: str
+        Path where to save the GIF.
+    figures: Iterator[Figure]
+        The figures to be rendered as frames.
+    fps: float
+        Number of frames per second.
+    """
+
+    figure = next(figures)
+    bbox = figure.get_tightbbox(figure.canvas.get_renderer()).padded(
+        mpl.rcParams["savefig.pad_inches"]
+    )
+
+    def render(figure: Figure) -> Image.Image:
+        buffer = io.BytesIO()
+        figure.savefig(buffer, format="png", bbox_inches=bbox)
+        buffer.seek(0)
+        return Image.open(buffer).quantize(method=Image.Quantize.FASTOCTREE)
+
+    with open(path, "wb") as file:
+        first = render(figure)
+        header, _ = GifImagePlugin.getheader(first, info={"loop": 0})
+        file.writelines(header)
+        for frame in chain([first], map(render, figures)):
+            # Every frame has its own palette, which may differ from the global one.
+            file.writelines(
+                GifImagePlugin.getdata(
+                    frame, duration=1000 / fps, include_color_table=True
+                )
+            )
+        # The trailer of the GIF.
+        file.write(b";")
+
+
+def write_video(path: str, figures: Iterator[Figure], fps: float, figure: Figure):
+    """Write the given figures as the frames of a video, piping them to ffmpeg.
+
+    Parameters
+    ----------
+    path: str
+        Path where to save the video.
+    figures: Iterator[Figure]
+        The figures to be rendered as frames.
+    fps: float
+        Number of frames per second.
+    figure: Figure
+        The figure to be rendered.
+    """
+    # The frames piped to ffmpeg cannot be cropped, so they show the whole figure.
+    writer = animation.FFMpegWriter(fps=fps)
+    with writer.saving(figure, path, dpi=figure.dpi):
+        for _ in figures:
+            writer.grab_frame()
+
+
+def animated_barplot(
+    frames: Sequence[pd.DataFrame],
+    path: str,
+    fps: float = 2,
+    frame_labels: Optional[Sequence[str]] = None,
+    writer: str = "auto",
+    **kwargs: Dict,
+) -> Tuple[Figure, Axes]:
+    """Save animation of the barplots of the given frames, sharing the same index.
+
+    The barplot is built once for the first frame and its bars are then
+    updated in place for each frame, which is then rendered. The frames
+    are written as they are rendered, either piped to ffmpeg or appended
+    to the GIF, so that they are not kept in memory. The limits of the
+    value axis are fixed to the extremes across all the frames, unless
+    they are provided.
+
+    Parameters
+    ----------
+    frames: Sequence[pd.DataFrame]
+        The dataframes of the frames, with the same index and columns.
+    path: str
+        Path where to save the animation.
+    fps: float = 2
+        Number of frames per second.
+    frame_labels: Optional[Sequence[str]] = None
+        The labels to show on the top right of the figure for each frame,
+        for instance the epochs.
+    writer: str = "auto"
+        The writer to use, either "pillow" for GIFs or "ffmpeg" for videos.
+        With "auto", the writer is chosen from the extension of the path.
+    kwargs: Dict
+        Parameters to be passed to barplot. Facets are not supported.
+
+    Raises
+    ------
+    ValueError
+        If no frames are provided.
+    ValueError
+        If the frames do not have the same columns of a single metric.
+    ValueError
+        If the frame labels are not as many as the frames.
+    ValueError
+        If the writer is not supported.
+    ValueError
+        If the ffmpeg writer is required but ffmpeg is not available.
+    ValueError
+        If facets are requested.
+
+    Returns
+    -------
+    Tuple containing Figure and Axes of the barplot, showing the last frame.
+    """
+    if len(frames) == 0:
+        raise ValueError("No frames were provided.")
+
+    columns = frames[0].columns
+    if not isinstance(columns, pd.MultiIndex) or len(columns.levels[0]) != 1:
+        raise ValueError(
+            "The frames must have the statistics of a single metric, "
+            "as the multi-index columns returned by the aggregation."
+        )
+    for i, frame in enumerate(frames):
+        if not frame.columns.equals(columns):
+            raise ValueError(
+                f"The columns of the frame {i} differ from the ones "
+                "of the first frame."
+            )
+
+    if frame_labels is not None and len(frame_labels) != len(frames):
+        raise ValueError(
+            f"{len(frame_labels)} frame labels were provided "
+            f"for {len(frames)} frames."
+        )
+
+    if writer == "auto":
+        writer = "pillow" if path.lower().endswith(".gif") else "ffmpeg"
+
+    if writer not in ("pillow", "ffmpeg"):
+        raise ValueError(f'Given writer "{writer}" is not supported.')
+
+    if writer == "ffmpeg" and not animation.writers.is_available("ffmpeg"):
+        raise ValueError(
+            "The ffmpeg writer is not available, please install ffmpeg "
+            "or export the animation as a GIF."
+        )
+
+    if kwargs.get("facets", False):
+        raise ValueError("Animated barplots with facets are not supported.")
+
+    metric = columns[0][0]
+    title = kwargs.get("title", None)
+    auto_normalize_metrics = kwargs.get("auto_normalize_metrics", True)
+    min_value, max_value = get_value_limits(
+        pd.concat(frames),
+        kwargs.get("bar_width", 0.3),
+        kwargs.get("space_width", 0.2),
+        kwargs.pop("min_value", None),
+        kwargs.pop("max_value", None),
+        auto_normalize_metrics
+        and (is_normalized_metric(metric) or is_normalized_metric(title)),
+        auto_normalize_metrics
+        and (
+            is_absolutely_normalized_metric(metric)
+            or is_absolutely_normalized_metric(title)
+        ),
+    )
+
+    figure, axes = barplot(
+        frames[0],
+        min_value=min_value,
+        max_value=max_value,
+        **kwargs,
+    )
+
+    figures = render_frames(
+        figure,
+        axes,
+        frames,
+        frame_labels,
+        {
+            "min_value": min_value,
+            "max_value": max_value,
+            **{key: kwargs[key] for key in UPDATE_OPTIONS if key in kwargs},
+        },
+    )
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    if writer == "pillow":
+        write_gif(path, figures, fps)
+    else:
+        write_video(path, figures, fps, figure)
+
+    return figure, axes
@@ -1,6 +1,6 @@
 """Module implementing plotting of a barplot."""
 
-from typing import List, Tuple, Dict, Union, Callable, Optional
+from typing import List, Tuple, Dict, Union, Callable, Optional, TYPE_CHECKING
 import pandas as pd
 from matplotlib.figure import Figure
 from matplotlib.axes import Axes
@@ -8,13 +8,26 @@ from sanitize_ml_labels import is_normalized_metric, is_absolutely_normalized_me
 from barplots.utils import (
     get_axes,
     get_levels,
-    remove_duplicated_legend_labels,
-    get_max_bar_length,
+    plot_legend,
+    get_value_limits,
+    get_subplot_partitions,
     save_picture,
+    apply_single_pass_layout,
+    validate_barplot_options,
     plot_bars,
+    plot_boxplots,
+    CompactTable,
     plot_bar_labels,
+    update_bars,
+    update_data_label,
+    format_value_axis,
+    sanitize_labels,
+    get_closing_checkpoint,
 )
 
+if TYPE_CHECKING:
+    from barplots.plot_spec import PlotSpec
+
 # List of 10 distinct colors from the Tableau palette.
 TABLEAU_COLORS = [
     "#4e79a7",
@@ -91,6 +104,7 @@ def barplot(
     facecolors: Optional[Dict[str, str]] = None,
     orientation: str = "vertical",
     subplots: bool = False,
+    facets: bool = False,
     plots_per_row: Union[int, str] = "auto",
     minor_rotation: Union[float, str] = "auto",
     major_rotation: Union[float, str] = "auto",
@@ -101,7 +115,7 @@ def barplot(
     placeholder: bool = False,
     scale: str = "linear",
     sanitize_metrics: bool = True,
-    unit: Optional[str] = None,
+    unit: Optional[Union[str, Dict[str, str]]] = None,
     legend_entries_size: float = 8,
     legend_title_size: float = 9,
     letter_per_subplot: Optional[List[str]] = None,
@@ -111,6 +125,12 @@ def barplot(
     letter: Optional[str] = None,
     letter_font_size: int = 20,
     ncol: Optional[int] = None,
+    shared_legend: bool = False,
+    boxplot: bool = False,
+    layout: str = "tight",
+    template: Optional[Tuple[Figure, Axes]] = None,
+    checkpoint: Optional[Callable[[str], None]] = None,
+    spec: Optional["PlotSpec"] = None,
 ) -> Tuple[Figure, Axes]:
     """Plot barplot corresponding to given dataframe, containing y value and optionally std.
 
@@ -165,6 +185,11 @@ def barplot(
         Can either be "vertical" of "horizontal".
     subplots: bool = False,
         Whetever to slit the top indexing layer to multiple subplots.
+    facets: bool = False,
+        Whether the top indexing layer contains the names of different metrics,
+        to be shown as the facets of a single figure. When enabled, the
+        subplots are used and the automatic normalization of the metrics
+        is determined for each facet independently.
     plots_per_row: Union[int, str] = "auto",
         If subplots is True, specifies the number of plots for row.
         If "auto" is used, for vertical the default is 2 plots per row,
@@ -197,8 +222,10 @@ def barplot(
         Can either be "linear" or "log".
     sanitize_metrics: bool = True,
         Whetever to sanitize the metrics names.
-    unit: Optional[str] = None
+    unit: Optional[Union[str, Dict[str, str]]] = None
         The unit to show in the value axis of the plot.
+        When using facets, a dictionary of the form {metric: unit}
+        can be provided to show a different unit for each facet.
     legend_entries_size: float = 8
         Size for the legend entries font.
     legend_title_size: float = 9
@@ -220,35 +247,98 @@ def barplot(
         if provided.
     ncol: Optional[int] = None
         The number of columns to show in the barplot.
+    shared_legend: bool = False
+        Whether to show a single legend on top of the figure, with the
+        entries of all the subplots, instead of a legend for each subplot.
+        When enabled, the legend position is not used.
+    boxplot: bool = False
+        Whether to plot boxplots instead of bars, in the same positions
+        and with the same styles. The dataframe must have the whiskers
+        "whislo" and "whishi", the quartiles "q1" and "q3", the median
+        "med" and optionally the "mean" sub-columns, as aggregated by
+        barplots with boxplot set to True.
+    layout: str = "tight"
+        How to lay out the figure.
+        With "tight", the tight layout is applied to the figure and the
+        saved picture is then cropped to its content, which requires
+        measuring the text extents of the figure multiple times.
+        With "single_pass", the tight layout is applied as well, and
+        the extents of the content are then measured once and the
+        figure is resized to them, so that the figure is drawn exactly
+        once when saved, without cropping. The two modes produce
+        pictures that differ by a few pixels.
+    template: Optional[Tuple[Figure, Axes]] = None
+        Figure and axes returned by a previous call with a dataframe
+        with the same index and the same options, to be updated in place
+        instead of building a new figure. The bars, the value axis, the
+        titles, the data label and the letter are updated, while the
+        tick labels, the legend and the styles of the bars are kept.
+    checkpoint: Optional[Callable[[str], None]] = None
+        Callable called with the name of each stage of the rendering,
+        either "drawing", "layout" or "encoding", before it starts.
+        It may raise an exception to stop the rendering, for instance
+        when the rendered barplot is no longer needed, in which case the
+        figure is closed, unless it is a template.
+    spec: Optional[PlotSpec] = None
+        Validated options of the barplot. The options given when
+        building the spec replace the corresponding arguments, while sort_bars, template
+        and checkpoint are always taken from the arguments.
 
     Raises
     ------
     ValueError:
         If the given orientation is nor "vertical" nor "horizontal".
+    ValueError:
+        If the given layout is nor "tight" nor "single_pass".
     ValueError:
         If the given plots_per_row is nor "auto" or a positive integer.
     ValueError:
         If subplots is True and less than a single index level is provided.
+    ValueError:
+        If both a template and sort_bars are provided.
+    ValueError:
+        If boxplot is True and the boxplot sub-columns are missing,
+        or a template is provided.
 
     Returns
     -------
     Tuple containing Figure and Axes of created barplot.
     """
 
-    if orientation not in ("vertical", "horizontal"):
-        raise ValueError(f'Given orientation "{orientation}" is not supported.')
+    if spec is not None:
+        arguments = {
+            name: value
+            for name, value in locals().items()
+            if name not in ("df", "spec")
+        }
+        return barplot(df, **{**arguments, **spec.to_kwargs(only_given=True)})
 
-    if (
-        not isinstance(plots_per_row, int)
-        and plots_per_row != "auto"
-        or isinstance(plots_per_row, int)
-        and plots_per_row < 1
-    ):
+    validate_barplot_options(orientation, plots_per_row, layout)
+
+    if template is not None and sort_bars is not None:
         raise ValueError(
-            f"Given plots_per_row \"{plots_per_row}\" is not 'auto' or a positive integer."
+            "It is not possible to update a template with sorted bars, "
+            "as the bars may be sorted differently from the template ones."
         )
 
+    if boxplot:
+        if template is not None:
+            raise ValueError("It is not possible to update a template of boxplots.")
+        statistics = {
+            column[-1] if isinstance(column, tuple) else column for column in df.columns
+        }
+        missing = {"whislo", "q1", "med", "q3", "whishi"} - statistics
+        if missing:
+            raise ValueError(
+                "The boxplots require the sub-columns whislo, q1, med, q3 and "
+                f"whishi, but {', '.join(sorted(missing))} are missing."
+            )
+
+    if checkpoint is not None:
+        checkpoint("drawing")
+
     vertical = orientation == "vertical"
+    subplots = subplots or facets
 
     levels = get_levels(df)
     expected_levels = len(levels) - int(show_last_level_as_legend) - int(subplots)
@@ -302,61 +392,100 @@ def barplot(
 
     if subplots:
         titles = sorted_level
+        partitions = get_subplot_partitions(df)
     else:
         titles = ("",)
+        partitions = None
 
-    figure, axes = get_axes(
-        df,
-        bar_width,
-        space_width,
-        height,
-        dpi,
-        title,
-        data_label,
-        vertical,
-        subplots,
-        titles,
-        plots_per_row,
-        custom_defaults,
-        expected_levels,
-        scale,
-        sanitize_metrics,
-        facecolors,
-        show_title,
-        show_column_name,
-    )
+    if template is not None:
+        figure, axes = template
+    else:
+        figure, axes = get_axes(
+            df,
+            bar_width,
+            space_width,
+            height,
+            dpi,
+            title,
+            data_label,
+            vertical,
+            subplots,
+            titles,
+            plots_per_row,
+            custom_defaults,
+            expected_levels,
+            scale,
+            sanitize_metrics,
+            facecolors,
+            show_title,
+            show_column_name,
+            partitions,
+        )
+        # The figure of a stopped rendering is closed, as it is not returned.
+        if checkpoint is not None:
+            checkpoint = get_closing_checkpoint(checkpoint, figure)
 
     if letter_per_subplot is None:
         letter_per_subplot = ["" for _ in range(len(axes))]
 
+    # Subplots with the same index structure share the same label layout.
+    label_layout_cache = {}
+    # Styles of the legend entries shared by all the subplots.
+    figure_leaf_styles = {}
+
     for i, (subplot_letter, index, ax) in enumerate(
         zip(letter_per_subplot, titles, axes)
     ):
         if subplots:
-            sub_df = df.loc[index]
+            sub_df = partitions[index]
         else:
             sub_df = df
 
         if sort_bars is not None:
             sub_df = sort_bars(sub_df)
 
-        plot_bars(
-            ax,
-            sub_df,
-            bar_width,
-            space_width,
-            alphas,
-            infer_alphas,
-            colors,
-            infer_colors,
-            edgecolors,
-            infer_edgecolors,
-            hatch,
-            infer_hatch,
-            index,
-            vertical=vertical,
-            min_std=min_std,
-        )
+        # The drawing and the limits of the bars only need the arrays of the table.
+        sub_table = CompactTable.from_dataframe(sub_df)
+
+        if template is not None:
+            update_bars(ax, sub_table, bar_width, space_width, vertical, min_std)
+        elif boxplot:
+            leaf_styles = plot_boxplots(
+                ax,
+                sub_table,
+                bar_width,
+                space_width,
+                alphas,
+                infer_alphas,
+                colors,
+                infer_colors,
+                edgecolors,
+                infer_edgecolors,
+                hatch,
+                infer_hatch,
+                index,
+                vertical=vertical,
+            )
+            figure_leaf_styles.update(leaf_styles)
+        else:
+            leaf_styles = plot_bars(
+                ax,
+                sub_table,
+                bar_width,
+                space_width,
+                alphas,
+                infer_alphas,
+                colors,
+                infer_colors,
+                edgecolors,
+                infer_edgecolors,
+                hatch,
+                infer_hatch,
+                index,
+                vertical=vertical,
+                min_std=min_std,
+            )
+            figure_leaf_styles.update(leaf_styles)
 
         is_not_first_ax = subplots and (
             (not vertical and i % plots_per_row)
@@ -368,77 +497,86 @@ def barplot(
             or (not vertical and i < len(axes) - plots_per_row)
         )
 
+        metric = index if facets else df.columns[0][0]
+
         normalized_metric = auto_normalize_metrics and (
-            is_normalized_metric(df.columns[0][0]) or is_normalized_metric(title)
+            is_normalized_metric(metric) or is_normalized_metric(title)
         )
         absolutely_normalized_metric = auto_normalize_metrics and (
-            is_absolutely_normalized_metric(df.columns[0][0])
+            is_absolutely_normalized_metric(metric)
             or is_absolutely_normalized_metric(title)
         )
 
-        plot_bar_labels(
-            ax,
-            figure,
-            sub_df,
-            vertical,
-            expected_levels,
-            bar_width,
-            space_width,
-            minor_rotation,
-            major_rotation,
-            unique_minor_labels and is_not_first_ax,
-            unique_major_labels and is_not_first_ax,
-            unique_data_label and is_not_first_vertical_ax,
-            custom_defaults,
-            unit,
-            normalized_metric=normalized_metric,
-            absolutely_normalized_metric=absolutely_normalized_metric,
-            sanitize_metrics=sanitize_metrics,
-        )
-
-        ax.text(
-            x=-0.1,
-            y=1.1,
-            s=subplot_letter,
-            size=12,
-            color="black",
-            weight="bold",
-            horizontalalignment="left",
-            verticalalignment="center",
-            transform=ax.transAxes,
-        )
-
-        if show_last_level_as_legend and show_legend:
-            remove_duplicated_legend_labels(
+        if template is not None:
+            format_value_axis(
                 ax,
-                legend_position,
-                df.index.names[-1],
-                legend_entries_size,
-                legend_title_size,
-                show_legend_title,
+                vertical,
+                unit.get(index, None) if isinstance(unit, dict) else unit,
+                normalized_metric,
+                absolutely_normalized_metric,
+            )
+            update_data_label(
+                ax, vertical, data_label, sanitize_metrics, custom_defaults
+            )
+        else:
+            plot_bar_labels(
+                ax,
+                figure,
+                sub_df,
+                vertical,
+                expected_levels,
+                bar_width,
+                space_width,
+                minor_rotation,
+                major_rotation,
+                unique_minor_labels and is_not_first_ax,
+                unique_major_labels and is_not_first_ax,
+                unique_data_label and is_not_first_vertical_ax,
                 custom_defaults,
-                ncol,
+                unit.get(index, None) if isinstance(unit, dict) else unit,
+                normalized_metric=normalized_metric,
+                absolutely_normalized_metric=absolutely_normalized_metric,
+                sanitize_metrics=sanitize_metrics,
+                layout_cache=label_layout_cache,
             )
 
-        max_length, min_length = get_max_bar_length(sub_df, bar_width, space_width)
-        max_length *= 1.01
-        min_length *= 1.01
-        min_length = min(min_length, 0)
-
-        if min_value is not None:
-            min_length = min_value
-
-        if normalized_metric:
-            max_length = max(max_length, 1.01)
-        elif absolutely_normalized_metric:
-            max_length = max(max_length, 1.01)
-            if min_length < 0:
-                min_length = min(min_length, -1.01)
+            ax.text(
+                x=-0.1,
+                y=1.1,
+                s=subplot_letter,
+                size=12,
+                color="black",
+                weight="bold",
+                horizontalalignment="left",
+                verticalalignment="center",
+                transform=ax.transAxes,
+            )
 
-        if max_value is not None:
-            max_length = max_value
+            if show_last_level_as_legend and show_legend and not shared_legend:
+                plot_legend(
+                    ax,
+                    leaf_styles,
+                    legend_position,
+                    df.index.names[-1],
+                    legend_entries_size,
+                    legend_title_size,
+                    show_legend_title,
+                    sanitize_metrics,
+                    custom_defaults,
+                    ncol,
+                )
+
+        min_length, max_length = get_value_limits(
+            sub_table,
+            bar_width,
+            space_width,
+            min_value,
+            max_value,
+            normalized_metric,
+            absolutely_normalized_metric,
+        )
 
-        if placeholder:
+        if placeholder and template is None:
             ax.text(
                 0.5,
                 0.5,
@@ -457,7 +595,42 @@ def barplot(
         else:
             ax.set_xlim(min_length, max_length)
 
-    figure.tight_layout()
+    # The area of the figure left to the subplots.
+    rect = (0, 0, 1, 1)
+
+    if template is not None:
+        if title is not None and len(axes) == 1 and show_title:
+            axes[0].set_title(
+                sanitize_labels(title, custom_defaults=custom_defaults)
+                if sanitize_metrics
+                else title
+            )
+        for text in list(figure.texts):
+            if text.get_gid() == "letter":
+                text.remove()
+    elif show_last_level_as_legend and show_legend and shared_legend:
+        plot_legend(
+            figure,
+            figure_leaf_styles,
+            "upper center",
+            df.index.names[-1],
+            legend_entries_size,
+            legend_title_size,
+            show_legend_title,
+            sanitize_metrics,
+            custom_defaults,
+            ncol,
+            bbox_to_anchor=(0.5, 1),
+        )
+
+    if figure.legends:
+        legend_height = (
+            figure.legends[0].get_window_extent(figure.canvas.get_renderer()).height
+        )
+        rect = (0, 0, 1, 1 - legend_height / figure.bbox.height)
+
+    if checkpoint is not None:
+        checkpoint("layout")
 
     if letter:
         figure.text(
@@ -468,9 +641,17 @@ def barplot(
             verticalalignment="top",
             weight="bold",
             fontsize=letter_font_size,
+            gid="letter",
         )
 
+    if layout == "tight":
+        figure.tight_layout(rect=rect)
+    else:
+        apply_single_pass_layout(figure, rect=rect)
+
     if path is not None:
-        save_picture(path, figure)
+        if checkpoint is not None:
+            checkpoint("encoding")
+        save_picture(path, figure, bbox_inches="tight" if layout == "tight" else None)
 
     return figure, axes
@@ -1,15 +1,29 @@
 """Module implementing plotting of multiple barplots in parallel and sequential manner."""
 
-from typing import Dict, List, Tuple, Callable, Union, Optional
+from typing import Dict, List, Tuple, Callable, Union, Optional, TYPE_CHECKING
 
 import pandas as pd
 import numpy as np
-from sanitize_ml_labels import sanitize_ml_labels
 from tqdm.auto import tqdm
 from matplotlib.figure import Figure
 from matplotlib.axis import Axis
 
 from barplots.barplot import barplot
+from barplots.utils import (
+    aggregate_boxplot_statistics,
+    aggregate_bootstrap_confidence_intervals,
+    keep_top_k_leaves,
+    pool_aggregated_tables,
+    sanitize_labels,
+)
+from barplots.utils.aggregate_table import (
+    aggregate_table,
+    get_column_names,
+    to_pandas,
+)
+
+if TYPE_CHECKING:
+    from barplots.plot_spec import PlotSpec
 
 
 def plot_feature(
@@ -40,12 +54,12 @@ def plot_feature(
 
 
 def barplots(
-    df: pd.DataFrame,
+    df: "Union[pd.DataFrame, pyarrow.Table, polars.DataFrame, polars.LazyFrame]",
     groupby: Optional[Union[List[str], str]] = None,
     show_standard_deviation: Union[bool, str] = "auto",
-    title: str = "{feature}",
-    data_label: str = "{feature}",
-    path: str = "barplots/{feature}.png",
+    title: Optional[str] = "{feature}",
+    data_label: Optional[str] = "{feature}",
+    path: Optional[str] = "barplots/{feature}.png",
     sanitize_metrics: bool = True,
     letters: Optional[Dict[str, str]] = None,
     letter_font_size: int = 20,
@@ -67,6 +81,7 @@ def barplots(
     facecolors: Optional[Dict[str, str]] = None,
     orientation: str = "vertical",
     subplots: Union[bool, str] = "auto",
+    facets: bool = False,
     plots_per_row: Union[int, str] = "auto",
     minor_rotation: Union[float, str] = "auto",
     major_rotation: Union[float, str] = "auto",
@@ -86,6 +101,22 @@ def barplots(
     units: Optional[Dict[str, str]] = None,
     sort_bars: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
     ncol: Optional[int] = None,
+    shared_legend: bool = False,
+    top_k: Optional[int] = None,
+    top_k_statistic: str = "mean",
+    other_label: str = "Other",
+    aggregated: bool = False,
+    error_bars: str = "std",
+    bootstrap_resamples: int = 1000,
+    confidence: float = 0.95,
+    random_state: Optional[int] = 42,
+    boxplot: bool = False,
+    sketch_accuracy: float = 0.01,
+    layout: str = "tight",
+    template: bool = False,
+    checkpoint: Optional[Callable[[str], None]] = None,
+    on_render: Optional[Callable[[Figure, Axis], None]] = None,
+    spec: Optional["PlotSpec"] = None,
     verbose: bool = True,
 ) -> Tuple[List[Figure], List[Axis]]:
     """Returns list of the built figures and axes.
@@ -95,8 +126,12 @@ def barplots(
 
     Parameters
     ----------
-    df: pd.DataFrame
-        Dataframe from which to extrat data for plotting barplot.
+    df: Union[pd.DataFrame, pyarrow.Table, polars.DataFrame, polars.LazyFrame]
+        Dataframe from which to extrat data for plotting barplot,
+        or list of pre-aggregated dataframes when aggregated is True.
+        Arrow tables and Polars frames, either eager or lazy, are screened
+        and aggregated by their engine, and only the aggregated table is
+        converted to pandas, so pyarrow or polars are needed only to use them.
     groupby: Optional[Union[List[str], str]] = None
         List of groupby over to run group by.
         If groupby was previously executed, leave this as None.
@@ -107,15 +142,18 @@ def barplots(
         were provided, and we turn it off otherwise as it would not
         be defined with a single value.
         By default "auto".
-    title: str = "{feature}"
+    title: Optional[str] = "{feature}"
         The title to use for the subgraphs.
         The `feature` placeholder is replaced with the considered column name.
-    data_label: str = "{feature}"
+        Use None for not showing any title.
+    data_label: Optional[str] = "{feature}"
         The label to use for the data axis.
         The `feature` placeholder is replaced with the considered column name.
-    path: str = "barplots/{feature}.png"
+        Use None for not showing any data label.
+    path: Optional[str] = "barplots/{feature}.png"
         The path where to store the pictures.
         The `feature` placeholder is replaced with the considered column name.
+        Use None for not saving the pictures.
     sanitize_metrics: bool = True
         Whetever to automatically sanitize to standard name given features.
         For instance, "acc" to "Accuracy" or "lr" to "Learning rate"
@@ -176,6 +214,12 @@ def barplots(
         Whetever to slit the top indexing layer to multiple subplots.
         If left to "auto", it will enable automatically subplots when
         an index in four dimensions is provided in the group by.
+    facets: bool = False
+        Whetever to show all the features as the facets of a single figure,
+        instead of rendering a figure for each feature. The facets share the
+        index labels, the legend and the styles, and each facet is titled
+        with its feature. The `feature` placeholder of the path is replaced
+        with "facets". Facets cannot be combined with subplots.
     plots_per_row: Union[int, str] = "auto"
         If subplots is True, specifies the number of plots for row.
         If "auto" is used, for vertical the default is 2 plots per row,
@@ -230,6 +274,83 @@ def barplots(
         Callable that receives a dataframe and returns it arbitrarily sorted.
     ncol: Optional[int] = None
         The number of columns to show in the barplot.
+    shared_legend: bool = False
+        Whether to show a single legend on top of each figure
+        instead of a legend for each subplot.
+    top_k: Optional[int] = None
+        Number of values of the innermost index level to keep for each group.
+        The remaining values are merged in a single bar, whose mean and
+        standard deviation are pooled from the group counts.
+        This bounds the number of bars, colors and hatches to render
+        when the innermost index level has a high cardinality.
+        When groupby is None, the dataframe must include a "count" sub-column.
+        By default None, that is all the values are shown.
+    top_k_statistic: str = "mean"
+        The statistic to rank the values of the innermost index level by.
+        Can either be "mean", "std" or "count".
+    other_label: str = "Other"
+        Label of the bar with the merged values of the innermost index level.
+    aggregated: bool = False
+        Whether the dataframe is a pre-aggregated table, or a list of them
+        to be pooled, whose columns are named as "{metric}_{statistic}" or
+        are multi-index columns with the metric and the statistic. The
+        statistics are the "mean", which is required, either the "std" or
+        the "sem", the "count" and the "weight" used in place of the count
+        to weight the pooled means. The groupby columns, if given, identify the groups,
+        which are otherwise the index, and the rows are not grouped.
+        See normalize_aggregated_table and pool_aggregated_tables.
+    error_bars: str = "std"
+        The error bars of the grouped rows, either the standard deviation
+        "std" or the percentile bootstrap confidence interval of the mean
+        "bootstrap", shown as an asymmetric error bar. The bootstrap
+        requires a pandas dataframe to be grouped and is not supported
+        with the top K leaves.
+    bootstrap_resamples: int = 1000
+        Number of bootstrap resamples of the confidence intervals.
+    confidence: float = 0.95
+        Confidence level of the bootstrap confidence intervals.
+    random_state: Optional[int] = 42
+        Seed of the bootstrap resampling, so that the same data are always
+        rendered with the same intervals.
+    boxplot: bool = False
+        Whether to plot boxplots of the grouped rows instead of bars.
+        Their quartiles, median and whiskers are estimated during the
+        aggregation by mergeable quantile sketches, whose memory does not
+        depend on the number of rows. The whiskers are approximate: they
+        are drawn at 1.5 times the interquartile range from the estimated
+        quartiles, clipped to the minimum and maximum rows, and need not
+        be rows themselves. The outliers are not shown. The boxplots
+        require a pandas dataframe to be grouped, and they are not
+        supported with the top K leaves, the bootstrap or the template.
+    sketch_accuracy: float = 0.01
+        Maximum relative error of the quantiles estimated for the boxplots.
+    layout: str = "tight"
+        How to lay out the figures, either "tight" or "single_pass".
+        With "single_pass", the figures are resized to fit their content
+        after the tight layout, and then saved without cropping.
+    template: bool = False
+        Whether to build the figure once and to update it in place for
+        each of the following features with the same index, instead of
+        building a new figure for each feature. Only the bars, the value
+        axis, the titles, the data label and the letter are updated, which
+        is much faster than rendering a new figure. As the figure is
+        reused, the returned figures are the same figure, showing the
+        last feature. It cannot be used with sort_bars, while it has no
+        effect when using facets.
+    checkpoint: Optional[Callable[[str], None]] = None
+        Callable called with the name of each stage of the rendering,
+        either "aggregation", "drawing", "layout" or "encoding", before
+        it starts. It may raise an exception to stop the rendering,
+        for instance when the barplots are no longer needed.
+    on_render: Optional[Callable[[Figure, Axis], None]] = None
+        Callable called with the figure and axes of each barplot
+        as soon as it is rendered, before rendering the following ones.
+    spec: Optional[PlotSpec] = None
+        Validated options of the barplots. The options given when
+        building the spec replace the corresponding arguments. The title,
+        data label and path may contain the "{feature}" placeholder,
+        while the units and letters of the features are given by the
+        units and letters arguments.
     verbose: bool
         Whetever to show or not the loading bar.
 
@@ -237,10 +358,25 @@ def barplots(
     ---------------------
     Tuple with list of rendered figures and rendered axes.
     """
+    if spec is not None:
+        options = spec.to_kwargs(only_given=True)
+        for name in ("unit", "letter"):
+            if name in options:
+                raise ValueError(
+                    f'The option "{name}" of the spec is not supported by '
+                    f'barplots, use the "{name}s" argument instead.'
+                )
+        arguments = {
+            name: value
+            for name, value in locals().items()
+            if name not in ("df", "spec", "options", "name")
+        }
+        return barplots(df, **{**arguments, **options})
+
     if isinstance(groupby, str):
         groupby = [groupby]
 
-    if len(df.columns) == 0:
+    if not isinstance(df, list) and len(get_column_names(df)) == 0:
         raise ValueError("The provided DataFrame does not have any column.")
 
     if subplots == "auto":
@@ -256,7 +392,19 @@ def barplots(
     else:
         normalized_subplots = subplots
 
-    if not subplots and len(groupby) > 3:
+    if template and sort_bars is not None:
+        raise ValueError(
+            "It is not possible to use a template with sorted bars, "
+            "as the bars of each feature may be sorted differently."
+        )
+
+    if facets and normalized_subplots:
+        raise ValueError(
+            "It is not possible to show the features as facets when the "
+            "top index level is already split into multiple subplots."
+        )
+
+    if not subplots and groupby is not None and len(groupby) > 3:
         raise ValueError(
             (
                 "Without subplots it is not possible to visualize a "
@@ -264,48 +412,129 @@ def barplots(
             )
         )
 
-    # Filtering out columns that are not visualizable.
-    df = df[
-        [
-            column
-            for column in df.columns
-            if groupby is not None
-            and column in groupby
-            or plot_feature(
-                df[column],
-                skip_constant_columns=skip_constant_columns,
-                skip_boolean_columns=skip_boolean_columns,
-            )
-        ]
-    ]
+    if error_bars not in ("std", "bootstrap"):
+        raise ValueError(
+            f'Provided value "{error_bars}" for error_bars is not valid. '
+            'Use either "std" or "bootstrap".'
+        )
 
-    if groupby is not None:
-        if len(groupby) == 0:
-            raise ValueError(
-                "The provided list of columns to execute groupby on is empty."
-            )
-        for column_name in groupby:
-            if column_name not in df.columns:
-                raise ValueError(
-                    (
-                        f"The provided column {column_name} is not available "
-                        "in the set of columns of the dataframe."
-                    )
-                )
+    if error_bars == "bootstrap" and (
+        groupby is None
+        or aggregated
+        or top_k is not None
+        or show_standard_deviation is False
+        or not isinstance(df, pd.DataFrame)
+    ):
+        raise ValueError(
+            "The bootstrap confidence intervals are computed from the rows of a "
+            "pandas dataframe grouped by the groupby columns, and they cannot "
+            "be used with pre-aggregated tables, the top K leaves or without "
+            "error bars."
+        )
 
-            # So we can standardize this.
-            backup = pd.options.mode.chained_assignment
-            pd.options.mode.chained_assignment = None
-            df[column_name] = df[column_name].astype(str)
-            pd.options.mode.chained_assignment = backup
+    if boxplot and (
+        groupby is None
+        or aggregated
+        or top_k is not None
+        or error_bars != "std"
+        or not isinstance(df, pd.DataFrame)
+    ):
+        raise ValueError(
+            "The boxplots are computed from the rows of a pandas dataframe "
+            "grouped by the groupby columns, and they cannot be used with "
+            "pre-aggregated tables, the top K leaves or the bootstrap."
+        )
 
-        groups_df: pd.DataFrame = (
-            df.groupby(groupby)
-            .agg(("mean", "std") if show_standard_deviation else ("mean",))
-            .sort_index()
+    if boxplot and template:
+        raise ValueError(
+            "It is not possible to use a template with boxplots, "
+            "as only the bars of a template are updated."
+        )
+
+    if checkpoint is not None:
+        checkpoint("aggregation")
+
+    if aggregated:
+        # The statistics were computed upstream, so the rows are not grouped.
+        groups_df = pool_aggregated_tables(
+            df if isinstance(df, list) else [df], groupby=groupby
         )
     else:
-        groups_df = df
+        # Arrow tables and Polars frames are screened and aggregated natively,
+        # so that only the aggregated table is converted to pandas.
+        native = groupby is not None and not isinstance(df, pd.DataFrame)
+
+        if not native:
+            df = to_pandas(df)
+            # Filtering out columns that are not visualizable.
+            df = df[
+                [
+                    column
+                    for column in df.columns
+                    if groupby is not None
+                    and column in groupby
+                    or plot_feature(
+                        df[column],
+                        skip_constant_columns=skip_constant_columns,
+                        skip_boolean_columns=skip_boolean_columns,
+                    )
+                ]
+            ]
+
+        if groupby is not None:
+            if len(groupby) == 0:
+                raise ValueError(
+                    "The provided list of columns to execute groupby on is empty."
+                )
+            columns = get_column_names(df)
+            for column_name in groupby:
+                if column_name not in columns:
+                    raise ValueError(
+                        (
+                            f"The provided column {column_name} is not available "
+                            "in the set of columns of the dataframe."
+                        )
+                    )
+
+                if native:
+                    continue
+
+                # So we can standardize this.
+                backup = pd.options.mode.chained_assignment
+                pd.options.mode.chained_assignment = None
+                df[column_name] = df[column_name].astype(str)
+                pd.options.mode.chained_assignment = backup
+
+            statistics = ("mean", "std") if show_standard_deviation else ("mean",)
+
+            # The counts are needed to pool the statistics of the merged values.
+            if top_k is not None:
+                statistics = (*statistics, "count")
+
+            if native:
+                groups_df: pd.DataFrame = aggregate_table(
+                    df,
+                    groupby,
+                    statistics,
+                    skip_constant_columns=skip_constant_columns,
+                    skip_boolean_columns=skip_boolean_columns,
+                )
+            elif boxplot:
+                groups_df = aggregate_boxplot_statistics(
+                    df, groupby, relative_accuracy=sketch_accuracy
+                )
+            elif error_bars == "bootstrap":
+                groups_df = aggregate_bootstrap_confidence_intervals(
+                    df,
+                    groupby,
+                    resamples=bootstrap_resamples,
+                    confidence=confidence,
+                    random_state=random_state,
+                )
+            else:
+                groups_df = df.groupby(groupby).agg(statistics).sort_index()
+        else:
+            groups_df = df
 
     # If the use has left it to us to decide whether to show
     # or not the standard deviation, we go hunting for Nan values.
@@ -338,14 +567,139 @@ def barplots(
         units = {}
 
     if sanitize_metrics:
-        features = sanitize_ml_labels(features)
-
-    return [
-        barplot(
-            df=groups_df[[original]],
-            title=title.format(feature=feature.replace("_", " ")),
-            data_label=data_label.format(feature=feature.replace("_", " ")),
-            path=path.format(feature=feature).replace(" ", "_").lower(),
+        features = sanitize_labels(features)
+
+    def get_feature_df(original: str) -> pd.DataFrame:
+        feature_df = groups_df[[original]]
+        if top_k is not None:
+            feature_df = keep_top_k_leaves(
+                feature_df,
+                top_k=top_k,
+                statistic=top_k_statistic,
+                other_label=other_label,
+            )
+        # The counts and weights are not rendered, so we drop them before plotting.
+        return feature_df[
+            [
+                column
+                for column in feature_df.columns
+                if not isinstance(column, tuple)
+                or column[-1] not in ("count", "weight")
+            ]
+        ]
+
+    if facets:
+        facet_dfs = {}
+        for column in original:
+            facet_df = get_feature_df(column)
+            if isinstance(facet_df.columns, pd.MultiIndex):
+                facet_df = facet_df[column]
+            else:
+                facet_df.columns = ["mean"]
+            facet_dfs[column] = facet_df
+
+        facets_df = pd.concat(facet_dfs, names=["feature"])
+        # Features without a standard deviation are shown without error bars.
+        if "std" in facets_df.columns:
+            facets_df["std"] = facets_df["std"].fillna(0.0)
+
+        if letter_per_subplot is None and letters:
+            letter_per_subplot = [
+                letters.get(original, "") for original in facets_df.index.levels[0]
+            ]
+
+        figure_and_axes = barplot(
+            df=facets_df,
+            title=None,
+            data_label=None,
+            path=(
+                None
+                if path is None
+                else path.format(feature="facets").replace(" ", "_").lower()
+            ),
+            bar_width=bar_width,
+            space_width=space_width,
+            height=height,
+            dpi=dpi,
+            min_std=min_std,
+            min_value=min_value,
+            max_value=max_value,
+            show_legend=show_legend,
+            show_last_level_as_legend=show_last_level_as_legend,
+            show_title=show_title,
+            show_column_name=show_column_name,
+            legend_position=legend_position,
+            colors=colors,
+            hatch=hatch,
+            alphas=alphas,
+            facecolors=facecolors,
+            orientation=orientation,
+            facets=True,
+            plots_per_row=plots_per_row,
+            minor_rotation=minor_rotation,
+            major_rotation=major_rotation,
+            unique_minor_labels=unique_minor_labels,
+            unique_major_labels=unique_major_labels,
+            unique_data_label=unique_data_label,
+            auto_normalize_metrics=auto_normalize_metrics,
+            placeholder=placeholder,
+            scale=scale,
+            sanitize_metrics=sanitize_metrics,
+            legend_entries_size=legend_entries_size,
+            legend_title_size=legend_title_size,
+            letter_per_subplot=letter_per_subplot,
+            show_legend_title=show_legend_title,
+            custom_defaults=custom_defaults,
+            sort_bars=sort_bars,
+            unit=units,
+            letter_font_size=letter_font_size,
+            ncol=ncol,
+            shared_legend=shared_legend,
+            boxplot=boxplot,
+            layout=layout,
+            checkpoint=checkpoint,
+        )
+        if on_render is not None:
+            on_render(*figure_and_axes)
+        return [figure_and_axes]
+
+    figures_and_axes = []
+    previous_df = None
+
+    for original, feature in tqdm(
+        zip(original, features),
+        desc="Rendering barplots",
+        total=len(original),
+        dynamic_ncols=True,
+        leave=False,
+        disable=not verbose or len(original) == 1,
+    ):
+        feature_df = get_feature_df(original)
+        # The figure of the previous feature is reused when the
+        # bars are the same, which is not the case for instance
+        # when the top K leaves differ.
+        reuse = (
+            template
+            and previous_df is not None
+            and previous_df.index.equals(feature_df.index)
+        )
+        figure_and_axes = barplot(
+            df=feature_df,
+            title=(
+                None
+                if title is None
+                else title.format(feature=feature.replace("_", " "))
+            ),
+            data_label=(
+                None
+                if data_label is None
+                else data_label.format(feature=feature.replace("_", " "))
+            ),
+            path=(
+                None
+                if path is None
+                else path.format(feature=feature).replace(" ", "_").lower()
+            ),
             bar_width=bar_width,
             space_width=space_width,
             height=height,
@@ -384,13 +738,15 @@ def barplots(
             letter=letters.get(original, None),
             letter_font_size=letter_font_size,
             ncol=ncol,
+            shared_legend=shared_legend,
+            boxplot=boxplot,
+            layout=layout,
+            template=figures_and_axes[-1] if reuse else None,
+            checkpoint=checkpoint,
         )
-        for original, feature in tqdm(
-            zip(original, features),
-            desc="Rendering barplots",
-            total=len(original),
-            dynamic_ncols=True,
-            leave=False,
-            disable=not verbose or len(original) == 1,
-        )
-    ]
+        if on_render is not None:
+            on_render(*figure_and_axes)
+        figures_and_axes.append(figure_and_axes)
+        previous_df = feature_df
+
+    return figures_and_axes
@@ -0,0 +1,358 @@
+"""Module implementing the command line interface rendering barplots from tables."""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+import pandas as pd
+from barplots.__version__ import __version__
+from barplots.barplots import plot_feature
+from barplots.plot_spec import PlotSpec
+from barplots.render_pool import RenderPool, render_barplots_job
+from barplots.utils import read_table, sanitize_labels
+from barplots.watch_barplots import watch_barplots
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Return the parser of the command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="barplots",
+        description=(
+            "Render the barplots of the metrics of a CSV, TSV, Parquet or "
+            "Feather table, grouped by the given columns."
+        ),
+    )
+    parser.add_argument("input", help="Path of the table to be plotted.")
+    parser.add_argument(
+        "-g",
+        "--groupby",
+        nargs="+",
+        required=True,
+        help="Columns to group the rows by, from the outer to the inner level.",
+    )
+    parser.add_argument(
+        "-m",
+        "--metrics",
+        nargs="+",
+        default=None,
+        help="Metrics to be plotted. By default, all the plottable columns.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=None,
+        help=(
+            "Path of the barplots, with the {feature} placeholder, replacing "
+            "the path of the spec. By default, barplots/{feature}.png."
+        ),
+    )
+    parser.add_argument(
+        "--spec",
+        default=None,
+        help=(
+            "Options of the barplots, either as the JSON serialization of a "
+            "PlotSpec or as the path of a file containing it."
+        ),
+    )
+    parser.add_argument(
+        "--top-k",
+        type=int,
+        default=None,
+        help="Number of leaves to keep in each group, merging the others.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of processes rendering the barplots.",
+    )
+    parser.add_argument(
+        "--cache",
+        default=".barplots_cache.json",
+        help="Path of the manifest of the rendered barplots.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Render all the barplots, even when their inputs did not change.",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help=(
+            "Keep the barplots current as rows are appended to the CSV or "
+            "TSV table, until interrupted."
+        ),
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=1.0,
+        help="Seconds without appended rows to wait before rendering in watch mode.",
+    )
+    parser.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help="Do not print the timing summary.",
+    )
+    parser.add_argument("--version", action="version", version=__version__)
+    return parser
+
+
+def load_spec(spec: Optional[str]) -> Optional[PlotSpec]:
+    """Return the spec from its serialization or from the file containing it.
+
+    Parameters
+    ----------
+    spec: Optional[str]
+        The serialized spec, or the path of the file containing it.
+    """
+    if spec is None:
+        return None
+    if os.path.isfile(spec):
+        with open(spec, "r", encoding="utf8") as file:
+            spec = file.read()
+    return PlotSpec.from_json(spec)
+
+
+def get_output_path(output: Optional[str], spec_options: Dict[str, Any]) -> str:
+    """Return the path of the barplots, removing the one of the spec options.
+
+    The output given on the command line replaces the path of the spec,
+    and the barplots rendered by the command are always saved.
+
+    Parameters
+    ----------
+    output: Optional[str]
+        The output given on the command line, if any.
+    spec_options: Dict[str, Any]
+        The options given in the spec, from which the path is removed.
+    """
+    path = spec_options.pop("path", None)
+    if output is not None:
+        return output
+    if path is not None:
+        return path
+    return "barplots/{feature}.png"
+
+
+def get_cache_key(feature_df: pd.DataFrame, options: Dict[str, Any]) -> str:
+    """Return the key identifying the barplot of the given data and options.
+
+    Parameters
+    ----------
+    feature_df: pd.DataFrame
+        The columns of the data used by the barplot.
+    options: Dict[str, Any]
+        The options of the barplot, serializable as JSON.
+    """
+    digest = hashlib.sha256(__version__.encode("utf8"))
+    digest.update(json.dumps(options, sort_keys=True, default=str).encode("utf8"))
+    digest.update(",".join(map(str, feature_df.columns)).encode("utf8"))
+    digest.update(pd.util.hash_pandas_object(feature_df, index=False).values.tobytes())
+    return digest.hexdigest()
+
+
+def load_manifest(path: str) -> Dict[str, str]:
+    """Return the keys of the rendered barplots, by their path.
+
+    Parameters
+    ----------
+    path: str
+        Path of the manifest.
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf8") as file:
+        return json.load(file)
+
+
+def save_manifest(path: str, manifest: Dict[str, str]):
+    """Save the keys of the rendered barplots, by their path.
+
+    Parameters
+    ----------
+    path: str
+        Path of the manifest.
+    manifest: Dict[str, str]
+        The keys of the rendered barplots, by their path.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf8") as file:
+        json.dump(manifest, file, indent=2, sort_keys=True)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Render the barplots requested by the given command line arguments.
+
+    Each feature is rendered by barplots on the columns it needs, so that
+    the features can be rendered in parallel. As barplots would do, the
+    names of the features are sanitized together and the columns that
+    cannot be plotted are skipped. The barplots whose data and options
+    did not change since their last rendering are not rendered again.
+
+    Parameters
+    ----------
+    argv: Optional[List[str]] = None
+        The command line arguments. By default, the ones of the process.
+
+    Returns
+    -------
+    The exit code of the command.
+    """
+    parser = build_parser()
+    arguments = parser.parse_args(argv)
+
+    if arguments.jobs < 1:
+        parser.error(f"The number of jobs must be positive, not {arguments.jobs}.")
+
+    try:
+        spec = load_spec(arguments.spec)
+    except ValueError as error:
+        parser.error(f"The spec is not valid: {error}")
+
+    if spec is not None and spec.facets:
+        parser.error(
+            "The facets show all the features in a single barplot, "
+            "use the Python API to render them."
+        )
+
+    if arguments.watch:
+        if not arguments.input.lower().endswith((".csv", ".tsv")):
+            parser.error("Only CSV and TSV tables can be watched.")
+        if arguments.top_k is not None:
+            parser.error("The top K leaves are not supported in watch mode.")
+        spec_options = {} if spec is None else spec.to_kwargs(only_given=True)
+        path = get_output_path(arguments.output, spec_options)
+        try:
+            watch_barplots(
+                arguments.input,
+                arguments.groupby,
+                arguments.metrics,
+                title=spec_options.pop("title", "{feature}"),
+                data_label=spec_options.pop("data_label", "{feature}"),
+                path=path,
+                debounce=arguments.debounce,
+                on_render=(
+                    None
+                    if arguments.quiet
+                    else lambda feature, figure, axes: print(f"Rendered {feature}.")
+                ),
+                **spec_options,
+            )
+        except KeyboardInterrupt:
+            pass
+        except ValueError as error:
+            parser.exit(1, f"{parser.prog}: error: {error}\n")
+        return 0
+
+    try:
+        df = read_table(
+            arguments.input,
+            columns=(
+                None
+                if arguments.metrics is None
+                else list(dict.fromkeys(arguments.groupby + arguments.metrics))
+            ),
+        )
+    except ValueError as error:
+        parser.error(str(error))
+
+    spec_options = {} if spec is None else spec.to_kwargs(only_given=True)
+    path = get_output_path(arguments.output, spec_options)
+    title = spec_options.pop("title", "{feature}")
+    data_label = spec_options.pop("data_label", "{feature}")
+
+    originals = [
+        column
+        for column in df.columns
+        if column not in arguments.groupby and plot_feature(df[column])
+    ]
+
+    features = (
+        sanitize_labels(originals)
+        if spec_options.get("sanitize_metrics", True)
+        else originals
+    )
+
+    manifest = {} if arguments.no_cache else load_manifest(arguments.cache)
+    timings: Dict[str, float] = {}
+    futures = {}
+    keys = {}
+    pool = RenderPool(processes=arguments.jobs) if arguments.jobs > 1 else None
+    start = time.perf_counter()
+
+    try:
+        for original, feature in zip(originals, features):
+            feature_df = df[arguments.groupby + [original]]
+            feature_path = path.format(feature=feature).replace(" ", "_").lower()
+            kwargs = {
+                "groupby": arguments.groupby,
+                "title": (
+                    None
+                    if title is None
+                    else title.format(feature=feature.replace("_", " "))
+                ),
+                "data_label": (
+                    None
+                    if data_label is None
+                    else data_label.format(feature=feature.replace("_", " "))
+                ),
+                "path": feature_path,
+                "top_k": arguments.top_k,
+                "spec": None if spec is None else PlotSpec(**spec_options),
+            }
+            keys[feature_path] = get_cache_key(
+                feature_df, {**kwargs, "spec": spec_options}
+            )
+            if manifest.get(feature_path) == keys[feature_path] and os.path.exists(
+                feature_path
+            ):
+                continue
+            if pool is None:
+                timings[feature_path] = render_barplots_job(feature_df, kwargs)
+            else:
+                futures[feature_path] = pool.submit_barplots(feature_df, **kwargs)
+
+        for feature_path, future in futures.items():
+            timings[feature_path] = future.result()
+    except ValueError as error:
+        # The options of the spec are validated by barplots when rendering.
+        parser.exit(1, f"{parser.prog}: error: {error}\n")
+    finally:
+        if pool is not None:
+            pool.close()
+
+    elapsed = time.perf_counter() - start
+
+    if not arguments.no_cache:
+        for feature_path in timings:
+            manifest[feature_path] = keys[feature_path]
+        save_manifest(arguments.cache, manifest)
+
+    if not arguments.quiet:
+        width = max([len(feature_path) for feature_path in keys] + [4])
+        for feature_path in keys:
+            status = (
+                f"{timings[feature_path]:8.2f}s"
+                if feature_path in timings
+                else "  cached"
+            )
+            print(f"{feature_path:<{width}} {status}")
+        print(
+            f"Rendered {len(timings)} of {len(keys)} barplots in {elapsed:.2f}s "
+            f"with {arguments.jobs} job{'s' if arguments.jobs > 1 else ''}."
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+"""Module implementing the declarative specification of the barplot options."""
+
+import copy
+import hashlib
+import inspect
+import json
+from typing import Any, Dict
+from barplots.barplot import barplot
+from barplots.utils import validate_barplot_options
+
+# Options of barplot which are hooks of a single rendering, rather than
+# options of the barplot, and are therefore not held by the specs.
+RUNTIME_OPTIONS = ("df", "sort_bars", "template", "checkpoint", "spec")
+
+# Default values of the options held by the specs, in the order of barplot.
+DEFAULT_OPTIONS: Dict[str, Any] = {
+    name: parameter.default
+    for name, parameter in inspect.signature(barplot).parameters.items()
+    if name not in RUNTIME_OPTIONS
+}
+
+
+def check_keys(value: Any, name: str):
+    """Raise an error if the given option has mappings with keys other than strings.
+
+    Parameters
+    ----------
+    value: Any
+        The value of the option.
+    name: str
+        The name of the option.
+
+    Raises
+    ------
+    ValueError
+        If a mapping within the value has a key that is not a string,
+        which would be converted to a string by the serialization.
+    """
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if not isinstance(key, str):
+                raise ValueError(
+                    f"The keys of the option {name} must be strings, not {key!r}."
+                )
+            check_keys(item, name)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            check_keys(item, name)
+
+
+class PlotSpec:
+    """Frozen and validated options of a barplot.
+
+    The specs hold every option of barplot, except for sort_bars, template
+    and checkpoint, which are hooks of a single rendering. The specs keep
+    track of the options that were given, which are the ones passed to
+    barplot and barplots, even when equal to the defaults of barplot.
+    Two specs with the same given options are equal and have the same hash,
+    which is stable across processes, so that the specs can be used as
+    keys of render caches.
+    """
+
+    __slots__ = (*DEFAULT_OPTIONS, "_given", "_digest")
+
+    def __init__(self, **options: Any):
+        """Create a new spec with the given barplot options.
+
+        The options that are not given are set to the defaults of barplot.
+        The options are stored as restored from their serialization, so
+        that the tuples are stored as lists, and the serialization of the
+        spec is lossless.
+
+        Parameters
+        ----------
+        options: Any
+            Options of barplot, which must be serializable as JSON,
+            with strings as the keys of the mappings.
+
+        Raises
+        ------
+        ValueError
+            If any of the given options is not an option of barplot.
+        ValueError
+            If any of the given options is not serializable as JSON,
+            or has mappings with keys other than strings.
+        ValueError
+            If the orientation, plots_per_row or layout are not valid.
+        """
+        unknown = [name for name in options if name not in DEFAULT_OPTIONS]
+        if unknown:
+            raise ValueError(
+                f"The options {', '.join(unknown)} are not options of barplot."
+            )
+
+        for name, value in options.items():
+            check_keys(value, name)
+
+        try:
+            # The options are restored from their serialization, so that
+            # they cannot be changed afterwards and are serialized losslessly.
+            options = json.loads(json.dumps(options))
+        except TypeError as error:
+            raise ValueError(
+                f"The options of the spec are not serializable as JSON: {error}"
+            ) from error
+
+        validate_barplot_options(
+            options.get("orientation", DEFAULT_OPTIONS["orientation"]),
+            options.get("plots_per_row", DEFAULT_OPTIONS["plots_per_row"]),
+            options.get("layout", DEFAULT_OPTIONS["layout"]),
+        )
+
+        for name, default in DEFAULT_OPTIONS.items():
+            object.__setattr__(self, name, options.get(name, copy.deepcopy(default)))
+
+        object.__setattr__(self, "_given", frozenset(options))
+        object.__setattr__(self, "_digest", None)
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(
+            f"Cannot set the option {name}, as the specs are frozen. "
+            "Use the replace method to create a new spec instead."
+        )
+
+    def __delattr__(self, name: str):
+        raise AttributeError(
+            f"Cannot delete the option {name}, as the specs are frozen."
+        )
+
+    def to_kwargs(self, only_given: bool = False) -> Dict[str, Any]:
+        """Return the options of the spec, to be passed to barplot.
+
+        Parameters
+        ----------
+        only_given: bool = False
+            Whether to return only the options given when building the spec.
+        """
+        return {
+            name: copy.deepcopy(getattr(self, name))
+            for name in DEFAULT_OPTIONS
+            if not only_given or name in self._given
+        }
+
+    def to_json(self) -> str:
+        """Return the compact serialization of the spec.
+
+        Only the options given when building the spec are serialized,
+        sorted by name, so that equal specs have the same serialization.
+        """
+        return json.dumps(
+            self.to_kwargs(only_given=True),
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_json(cls, serialized: str) -> "PlotSpec":
+        """Return the spec from its serialization.
+
+        Parameters
+        ----------
+        serialized: str
+            The serialization returned by to_json.
+
+        Raises
+        ------
+        ValueError
+            If the serialized options are not valid.
+        """
+        return cls(**json.loads(serialized))
+
+    @property
+    def digest(self) -> str:
+        """Return the hexadecimal SHA-256 digest of the serialized spec."""
+        # The digest is cached, bypassing the frozen attributes.
+        if self._digest is None:
+            object.__setattr__(
+                self,
+                "_digest",
+                hashlib.sha256(self.to_json().encode("utf8")).hexdigest(),
+            )
+        return self._digest
+
+    def replace(self, **changes: Any) -> "PlotSpec":
+        """Return a new spec with the given options replaced.
+
+        Parameters
+        ----------
+        changes: Any
+            The options to replace.
+
+        Raises
+        ------
+        ValueError
+            If the resulting options are not valid.
+        """
+        return PlotSpec(**{**self.to_kwargs(only_given=True), **changes})
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, PlotSpec):
+            return NotImplemented
+        return self.to_json() == other.to_json()
+
+    def __hash__(self) -> int:
+        return int(self.digest[:16], 16)
+
+    def __reduce__(self):
+        return (PlotSpec.from_json, (self.to_json(),))
+
+    def __repr__(self) -> str:
+        options = ", ".join(
+            f"{name}={value!r}"
+            for name, value in self.to_kwargs(only_given=True).items()
+        )
+        return f"PlotSpec({options})"
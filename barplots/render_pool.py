@@ -0,0 +1,213 @@
+"""Module implementing a pool of warm processes rendering barplots."""
+
+import io
+import string
+import multiprocessing
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, Optional, Union
+import pandas as pd
+import matplotlib.pyplot as plt
+from barplots.barplot import barplot
+from barplots.barplots import barplots
+from barplots.plot_spec import PlotSpec
+from barplots.utils import get_text_widths, sanitize_labels, save_picture
+from barplots.utils.get_label_layout import MAJOR_LABEL_SIZE, MINOR_LABEL_SIZE
+
+
+def warm_up_worker():
+    """Prepare the process for rendering barplots, paying the start-up costs once.
+
+    The modules are imported with this module, while the font cache, the
+    text metrics of the visible ASCII characters and the sanitization of the
+    common metrics are loaded by rendering a small barplot.
+    """
+    plt.switch_backend("agg")
+
+    for size, weight in (
+        (MINOR_LABEL_SIZE, "normal"),
+        (MAJOR_LABEL_SIZE, "normal"),
+        # Sizes of the legend entries and title.
+        (8, "normal"),
+        (9, "bold"),
+    ):
+        get_text_widths(
+            string.ascii_letters + string.digits + string.punctuation + " ",
+            size,
+            weight,
+        )
+
+    sanitize_labels(["auroc", "auprc", "accuracy", "f1_score", "loss"])
+
+    figure, _ = barplot(
+        pd.DataFrame(
+            {("AUROC", "mean"): [0.5, 0.7, 0.6, 0.2], ("AUROC", "std"): [0.1] * 4},
+            index=pd.MultiIndex.from_product(
+                (("Group A", "Group B"), ("Bar A", "Bar B")),
+                names=("group", "bar"),
+            ),
+        ),
+        title="Warm up",
+        height=5,
+    )
+    save_picture(io.BytesIO(), figure, format="png")
+    plt.close(figure)
+
+
+def render_job(
+    spec: Union[PlotSpec, Dict[str, Any]],
+    df: pd.DataFrame,
+    path: Optional[str],
+    format: str,
+) -> Union[str, bytes]:
+    """Render the barplot of the given data with the given options.
+
+    Parameters
+    ----------
+    spec: Union[PlotSpec, Dict[str, Any]]
+        Spec or parameters to be passed to barplot.
+    df: pd.DataFrame
+        Dataframe from which to extract data for plotting barplot.
+    path: Optional[str]
+        Path where to save the picture. If None, the picture is returned.
+    format: str
+        Format of the picture returned when no path is given.
+
+    Returns
+    -------
+    The path of the saved picture, or the bytes of the picture.
+    """
+    if isinstance(spec, PlotSpec):
+        spec = spec.to_kwargs(only_given=True)
+    figure, _ = barplot(df, **{**spec, "path": None})
+    bbox_inches = "tight" if spec.get("layout", "tight") == "tight" else None
+    try:
+        if path is not None:
+            save_picture(path, figure, bbox_inches=bbox_inches)
+            return path
+        buffer = io.BytesIO()
+        save_picture(buffer, figure, bbox_inches=bbox_inches, format=format)
+        return buffer.getvalue()
+    finally:
+        plt.close(figure)
+
+
+def render_barplots_job(df: pd.DataFrame, kwargs: Dict[str, Any]) -> float:
+    """Render the barplots of the given data and return the elapsed seconds.
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        Dataframe from which to extract data for plotting barplots.
+    kwargs: Dict[str, Any]
+        Parameters to be passed to barplots.
+    """
+    start = time.perf_counter()
+    for figure, _ in barplots(df, **{"verbose": False, **kwargs}):
+        plt.close(figure)
+    return time.perf_counter() - start
+
+
+class RenderPool:
+    """Pool of persistent processes rendering barplots.
+
+    The workers are started when the jobs are first submitted and are
+    warmed up once, loading the fonts, the text metrics and the label
+    sanitization, so that they render the following barplots right away.
+    The pool can be used as a context manager, which closes it on exit.
+    """
+
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        start_method: Optional[str] = None,
+    ):
+        """Create a new pool of rendering processes.
+
+        Parameters
+        ----------
+        processes: Optional[int] = None
+            Number of worker processes. By default, as many as the CPUs.
+        start_method: Optional[str] = None
+            Method used to start the workers, such as "fork" or "spawn".
+            By default, the default method of the platform is used.
+
+        Raises
+        ------
+        ValueError
+            If the number of processes is not positive.
+        """
+        if processes is not None and processes < 1:
+            raise ValueError(
+                f"The number of processes must be positive, but {processes} was given."
+            )
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context(start_method),
+            initializer=warm_up_worker,
+        )
+
+    def submit(
+        self,
+        spec: Union[PlotSpec, Dict[str, Any]],
+        df: pd.DataFrame,
+        path: Optional[str] = None,
+        format: str = "png",
+    ) -> "Future[Union[str, bytes]]":
+        """Submit the rendering of a barplot and return its future.
+
+        Parameters
+        ----------
+        spec: Union[PlotSpec, Dict[str, Any]]
+            Spec of the barplot, or parameters to be passed to barplot,
+            which must be picklable.
+            The path of barplot is ignored, as it is provided separately.
+        df: pd.DataFrame
+            The slice of the data to be plotted, as expected by barplot.
+        path: Optional[str] = None
+            Path where to save the picture. If None, the future returns
+            the bytes of the picture.
+        format: str = "png"
+            Format of the picture returned when no path is given.
+
+        Returns
+        -------
+        Future of the path of the saved picture, or of the bytes of the picture.
+        """
+        return self._executor.submit(render_job, spec, df, path, format)
+
+    def submit_barplots(self, df: pd.DataFrame, **kwargs: Any) -> "Future[float]":
+        """Submit the rendering of the barplots of the given data and return its future.
+
+        The barplots must be saved to a path, as the figures are closed
+        once rendered.
+
+        Parameters
+        ----------
+        df: pd.DataFrame
+            The slice of the data to be plotted, as expected by barplots.
+        kwargs: Any
+            Parameters to be passed to barplots, which must be picklable.
+
+        Returns
+        -------
+        Future of the seconds spent rendering the barplots.
+        """
+        return self._executor.submit(render_barplots_job, df, kwargs)
+
+    def close(self, wait: bool = True):
+        """Close the pool, stopping the workers once their jobs are completed.
+
+        Parameters
+        ----------
+        wait: bool = True
+            Whether to wait for the submitted jobs to be completed.
+        """
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> "RenderPool":
+        return self
+
+    def __exit__(self, *args: Any):
+        self.close()
@@ -0,0 +1,361 @@
+"""Module implementing a local HTTP server rendering barplots."""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+import pandas as pd
+from barplots.plot_spec import PlotSpec
+from barplots.render_pool import RenderPool
+from barplots.utils import RunningAggregates, read_table, sanitize_labels
+
+# Content types of the supported picture formats.
+CONTENT_TYPES = {"png": "image/png", "svg": "image/svg+xml"}
+
+# Content type of the uploaded Arrow tables.
+ARROW_CONTENT_TYPE = "application/vnd.apache.arrow.stream"
+
+
+def read_arrow_table(buffer: bytes) -> pd.DataFrame:
+    """Return the table of the given Arrow IPC stream.
+
+    Parameters
+    ----------
+    buffer: bytes
+        The Arrow IPC stream.
+
+    Raises
+    ------
+    ValueError
+        If pyarrow is not installed.
+    """
+    try:
+        import pyarrow  # pylint: disable=import-outside-toplevel
+    except ImportError as error:
+        raise ValueError(
+            "Reading Arrow tables requires pyarrow, please install it."
+        ) from error
+    return pyarrow.ipc.open_stream(buffer).read_all().to_pandas()
+
+
+class RenderServer(ThreadingHTTPServer):
+    """HTTP server rendering barplots on a pool of warm processes.
+
+    Identical requests received while a rendering is in progress wait for
+    the same rendering, and the rendered pictures are kept in a bounded
+    LRU cache. The tables can be referenced by their path, relative to
+    the root directory of the server, or uploaded as Arrow streams.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        root: str = ".",
+        processes: Optional[int] = None,
+        cache_size: int = 128,
+    ):
+        """Create a new server listening on the given address.
+
+        Parameters
+        ----------
+        address: Tuple[str, int]
+            Host and port to listen on.
+        root: str = "."
+            Directory containing the tables that can be referenced by path.
+        processes: Optional[int] = None
+            Number of processes rendering the barplots.
+            By default, as many as the CPUs.
+        cache_size: int = 128
+            Maximum number of rendered pictures to keep in the cache.
+
+        Raises
+        ------
+        ValueError
+            If the cache size is negative.
+        """
+        if cache_size < 0:
+            raise ValueError(
+                f"The cache size must not be negative, but {cache_size} was given."
+            )
+        super().__init__(address, RenderRequestHandler)
+        self.root = os.path.realpath(root)
+        self.cache_size = cache_size
+        self.renders = 0
+        self._pool = RenderPool(processes=processes)
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def render(self, key: str, produce: Callable[[], bytes]) -> Tuple[bytes, str]:
+        """Return the picture with the given key, rendering it if needed.
+
+        Parameters
+        ----------
+        key: str
+            Key identifying the picture.
+        produce: Callable[[], bytes]
+            Callable loading the data and rendering the picture.
+
+        Returns
+        -------
+        Tuple with the picture and whether it was a cache "hit", a rendering
+        "coalesced" with an identical one in progress, or a "miss".
+        """
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key], "hit"
+            future = self._in_flight.get(key)
+            if future is not None:
+                status = "coalesced"
+            else:
+                future = self._in_flight[key] = Future()
+                self.renders += 1
+                status = "miss"
+
+        if status == "miss":
+            # The data are loaded outside of the lock, so that the
+            # different requests are not serialized.
+            try:
+                future.set_result(produce())
+            except Exception as error:  # pylint: disable=broad-except
+                future.set_exception(error)
+            with self._lock:
+                del self._in_flight[key]
+                if future.exception() is None and self.cache_size > 0:
+                    self._cache[key] = future.result()
+                    while len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+
+        return future.result(), status
+
+    def submit(self, spec: PlotSpec, df: pd.DataFrame, format: str) -> Future:
+        """Submit the rendering of the given barplot to the pool.
+
+        Parameters
+        ----------
+        spec: PlotSpec
+            The spec of the barplot.
+        df: pd.DataFrame
+            The aggregated data of the barplot.
+        format: str
+            Format of the picture.
+        """
+        return self._pool.submit(spec, df, format=format)
+
+    def server_close(self):
+        super().server_close()
+        self._pool.close(wait=False)
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """Handler of the requests of the rendering server.
+
+    The barplots are requested with a POST to /render, with the options
+    either in a JSON body or in the query of a request uploading an Arrow
+    stream: the "spec" with the options of the barplot, the "groupby"
+    columns, the "metric" to be plotted, the "format" of the picture,
+    either "png" or "svg", and, for the JSON bodies, the "path" of the
+    table. The titles, data label and path of the spec may contain the
+    "{feature}" placeholder, and by default they are the name of the metric.
+    """
+
+    server: RenderServer
+
+    def send_json(self, status: int, payload: Dict[str, Any]):
+        """Send the given JSON payload with the given status."""
+        body = json.dumps(payload).encode("utf8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        """Report whether the server is running."""
+        if urlparse(self.path).path != "/health":
+            self.send_json(404, {"error": f"Unknown endpoint {self.path}."})
+            return
+        self.send_json(200, {"status": "ok", "renders": self.server.renders})
+
+    def do_POST(self):
+        """Render the requested barplot."""
+        url = urlparse(self.path)
+        if url.path != "/render":
+            self.send_json(404, {"error": f"Unknown endpoint {url.path}."})
+            return
+
+        try:
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            arrow = self.headers.get("Content-Type", "").startswith(ARROW_CONTENT_TYPE)
+            if arrow:
+                request = {
+                    key: values[0] for key, values in parse_qs(url.query).items()
+                }
+                request["spec"] = json.loads(request.get("spec", "{}"))
+                request["groupby"] = request.get("groupby", "").split(",")
+            else:
+                request = json.loads(body)
+
+            groupby: List[str] = list(request["groupby"])
+            metric: str = request["metric"]
+            format: str = request.get("format", "png")
+            spec = PlotSpec(**request.get("spec", {}))
+
+            if format not in CONTENT_TYPES:
+                raise ValueError(f'The format "{format}" is not supported.')
+
+            if arrow:
+                data_key = hashlib.sha256(body).hexdigest()
+            else:
+                path = os.path.realpath(
+                    os.path.join(self.server.root, str(request.get("path", "")))
+                )
+                if os.path.commonpath([path, self.server.root]) != self.server.root:
+                    raise ValueError("The table must be in the root of the server.")
+                if not os.path.isfile(path):
+                    self.send_json(404, {"error": "The table does not exist."})
+                    return
+                stat = os.stat(path)
+                data_key = f"{path}:{stat.st_mtime_ns}:{stat.st_size}"
+
+            key = hashlib.sha256(
+                json.dumps([spec.digest, data_key, groupby, metric, format]).encode(
+                    "utf8"
+                )
+            ).hexdigest()
+
+            def load() -> pd.DataFrame:
+                if arrow:
+                    return read_arrow_table(body)
+                return read_table(path, columns=list(dict.fromkeys(groupby + [metric])))
+
+            def produce() -> bytes:
+                aggregates = RunningAggregates(groupby, [metric])
+                aggregates.update(load())
+                feature = (
+                    sanitize_labels(metric) if spec.sanitize_metrics else metric
+                ).replace("_", " ")
+                options = spec.to_kwargs(only_given=True)
+                title = options.get("title", "{feature}")
+                data_label = options.get("data_label", "{feature}")
+                return self.server.submit(
+                    spec.replace(
+                        title=None if title is None else title.format(feature=feature),
+                        data_label=(
+                            None
+                            if data_label is None
+                            else data_label.format(feature=feature)
+                        ),
+                        path=None,
+                    ),
+                    aggregates.get_feature_df(metric),
+                    format,
+                ).result()
+
+            picture, status = self.server.render(key, produce)
+        except (ValueError, KeyError, TypeError) as error:
+            self.send_json(400, {"error": str(error)})
+            return
+        except Exception as error:  # pylint: disable=broad-except
+            self.send_json(500, {"error": str(error)})
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPES[format])
+        self.send_header("Content-Length", str(len(picture)))
+        self.send_header("X-Barplots-Cache", status)
+        self.end_headers()
+        self.wfile.write(picture)
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    root: str = ".",
+    processes: Optional[int] = None,
+    cache_size: int = 128,
+):
+    """Serve the rendering of barplots until interrupted.
+
+    Parameters
+    ----------
+    host: str = "127.0.0.1"
+        Host to listen on. By default, only local connections are accepted.
+    port: int = 8000
+        Port to listen on.
+    root: str = "."
+        Directory containing the tables that can be referenced by path.
+    processes: Optional[int] = None
+        Number of processes rendering the barplots.
+        By default, as many as the CPUs.
+    cache_size: int = 128
+        Maximum number of rendered pictures to keep in the cache.
+    """
+    with RenderServer(
+        (host, port), root=root, processes=processes, cache_size=cache_size
+    ) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Serve the rendering of barplots with the given command line arguments.
+
+    Parameters
+    ----------
+    argv: Optional[List[str]] = None
+        The command line arguments. By default, the ones of the process.
+
+    Returns
+    -------
+    The exit code of the command.
+    """
+    parser = argparse.ArgumentParser(
+        prog="barplots-server",
+        description="Serve the rendering of barplots over HTTP.",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Host to listen on.")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on.")
+    parser.add_argument(
+        "--root",
+        default=".",
+        help="Directory containing the tables that can be referenced by path.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of processes rendering the barplots.",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=128,
+        help="Maximum number of rendered pictures to keep in the cache.",
+    )
+    arguments = parser.parse_args(argv)
+    serve(
+        host=arguments.host,
+        port=arguments.port,
+        root=arguments.root,
+        processes=arguments.jobs,
+        cache_size=arguments.cache_size,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
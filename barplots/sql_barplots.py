@@ -0,0 +1,55 @@
+"""Module implementing the barplots of the rows of a SQLite database."""
+
+import sqlite3
+from typing import Any, List, Optional, Tuple, Union
+from matplotlib.figure import Figure
+from matplotlib.axis import Axis
+from barplots.barplots import barplots
+from barplots.utils import SQLiteTable
+
+
+def sql_barplots(
+    database: Union[str, sqlite3.Connection],
+    groupby: Union[List[str], str],
+    table: Optional[str] = None,
+    query: Optional[str] = None,
+    metrics: Optional[List[str]] = None,
+    **kwargs: Any,
+) -> List[Tuple[Figure, Axis]]:
+    """Plot the barplots of the given SQLite table or query, aggregated by SQLite.
+
+    The screening of the plottable columns and the aggregation of their
+    mean, standard deviation and count are run by SQLite, so that only
+    the aggregated table is loaded in memory and rendered.
+
+    Parameters
+    ----------
+    database: Union[str, sqlite3.Connection]
+        Path of the database, opened read-only, or an open connection to it.
+    groupby: Union[List[str], str]
+        Columns to group the rows by.
+    table: Optional[str] = None
+        Name of the table containing the rows.
+    query: Optional[str] = None
+        Query returning the rows, as an alternative to the table.
+    metrics: Optional[List[str]] = None
+        The metrics to be plotted. By default, all the plottable columns.
+    kwargs: Any
+        Parameters to be passed to barplots.
+
+    Raises
+    ------
+    ValueError
+        If not exactly one among the table and the query is provided.
+    ValueError
+        If the parameters are not valid for barplots.
+
+    Returns
+    -------
+    List of the figures and axes of the barplots.
+    """
+    return barplots(
+        SQLiteTable(database, table=table, query=query, metrics=metrics),
+        groupby=groupby,
+        **kwargs,
+    )
@@ -0,0 +1,238 @@
+"""Module implementing the in place update of a barplot."""
+
+from typing import Any, Dict, List, Optional, Tuple
+from weakref import WeakKeyDictionary
+import pandas as pd
+from matplotlib.artist import Artist
+from matplotlib.axes import Axes
+from matplotlib.container import BarContainer
+from matplotlib.figure import Figure
+from sanitize_ml_labels import is_normalized_metric, is_absolutely_normalized_metric
+from barplots.utils import (
+    get_levels,
+    get_subplot_partitions,
+    get_value_limits,
+    update_bars,
+)
+
+# Backgrounds of the axes of the figures updated with blitting,
+# which are dropped together with their figures.
+BLIT_BACKGROUNDS: "WeakKeyDictionary[Figure, Dict[Axes, Any]]" = WeakKeyDictionary()
+
+
+def get_blitted_artists(axes: Axes) -> List[Artist]:
+    """Return the artists of the axes to be drawn over the blitted background.
+
+    Parameters
+    ----------
+    axes: Axes
+        The axes of the barplot.
+    """
+    artists = []
+    for container in axes.containers:
+        if not isinstance(container, BarContainer):
+            continue
+        artists.extend(container.patches)
+        if container.errorbar is not None:
+            _, caplines, barlinecols = container.errorbar.lines
+            artists.extend(caplines)
+            artists.extend(barlinecols)
+    # The legend is drawn over the bars.
+    if axes.get_legend() is not None:
+        artists.append(axes.get_legend())
+    return artists
+
+
+def blit_axes(figure: Figure, axes: List[Axes]):
+    """Restore the background of the given axes and draw their bars over it.
+
+    Parameters
+    ----------
+    figure: Figure
+        The figure of the barplot.
+    axes: List[Axes]
+        The axes to be redrawn.
+    """
+    canvas = figure.canvas
+    backgrounds = BLIT_BACKGROUNDS[figure]
+    for ax in axes:
+        canvas.restore_region(backgrounds[ax])
+        for artist in get_blitted_artists(ax):
+            ax.draw_artist(artist)
+        canvas.blit(ax.bbox)
+
+
+def setup_blitting(figure: Figure, axes: List[Axes]):
+    """Animate the bars of the figure and capture the background on each draw.
+
+    Parameters
+    ----------
+    figure: Figure
+        The figure of the barplot.
+    axes: List[Axes]
+        The axes of the barplot.
+    """
+
+    def on_draw(_):
+        # The saved pictures already include the animated artists.
+        if figure.canvas.is_saving():
+            return
+        # The animated artists are not drawn by the full draws of the canvas,
+        # so the backgrounds are captured and the bars are drawn over them.
+        BLIT_BACKGROUNDS[figure] = {
+            ax: figure.canvas.copy_from_bbox(ax.bbox) for ax in axes
+        }
+        blit_axes(figure, axes)
+
+    for ax in axes:
+        for artist in get_blitted_artists(ax):
+            artist.set_animated(True)
+
+    figure.canvas.mpl_connect("draw_event", on_draw)
+    figure.canvas.draw()
+
+
+def update_barplot(
+    figure: Figure,
+    axes: Axes,
+    df: pd.DataFrame,
+    bar_width: float = 0.3,
+    space_width: float = 0.2,
+    min_std: float = 0,
+    min_value: Optional[float] = None,
+    max_value: Optional[float] = None,
+    orientation: str = "vertical",
+    subplots: bool = False,
+    facets: bool = False,
+    title: Optional[str] = None,
+    auto_normalize_metrics: bool = True,
+    blit: bool = False,
+) -> Tuple[Figure, Axes]:
+    """Update in place the barplot with the values of the given dataframe.
+
+    Only the bars whose values changed are updated, and the limits of the
+    value axis are updated when needed. With blitting, and when the limits
+    did not change, only the axes with updated bars are redrawn, over the
+    background captured during the last full draw of the figure.
+
+    The options must be the same ones used to create the barplot. To also
+    update the titles, the data label or the letter of the barplot,
+    use barplot with the figure and axes as template instead.
+
+    Parameters
+    ----------
+    figure: Figure
+        The figure returned by barplot.
+    axes: Axes
+        The axes returned by barplot.
+    df: pd.DataFrame
+        Dataframe with the same index of the dataframe used to create the
+        barplot, from which to extract the new values of the bars.
+    bar_width: float = 0.3,
+        Width of the bar of the barplot.
+    space_width: float = 0.2
+        Width of the space between bar groups.
+    min_std: float = 0,
+        Minimum standard deviation for showing error bars.
+    min_value: Optional[float] = None,
+        Minimum value for the barplot.
+    max_value: Optional[float] = None,
+        Maximum value for the barplot.
+    orientation: str = "vertical",
+        Orientation of the bars.
+        Can either be "vertical" of "horizontal".
+    subplots: bool = False,
+        Whetever the top indexing layer is split to multiple subplots.
+    facets: bool = False,
+        Whether the top indexing layer contains the names of different metrics.
+    title: Optional[str] = None,
+        Barplot's title, used to detect normalized metrics.
+    auto_normalize_metrics: bool = True,
+        Whetever automatic normalization is applied to the metrics
+        that are recognized to be between zero and one.
+    blit: bool = False,
+        Whether to redraw only the updated axes using blitting, when
+        supported by the canvas of the figure. The bars are then animated
+        artists, redrawn by the following updates and full draws.
+
+    Raises
+    ------
+    ValueError:
+        If the given orientation is nor "vertical" nor "horizontal".
+    ValueError:
+        If the number of bars of an axes does not match the dataframe.
+
+    Returns
+    -------
+    Tuple containing Figure and Axes of the updated barplot.
+    """
+    if orientation not in ("vertical", "horizontal"):
+        raise ValueError(f'Given orientation "{orientation}" is not supported.')
+
+    vertical = orientation == "vertical"
+    subplots = subplots or facets
+
+    if subplots:
+        titles = get_levels(df)[0]
+        partitions = get_subplot_partitions(df)
+    else:
+        titles = ("",)
+        partitions = None
+
+    updated_axes = []
+    limits_changed = False
+
+    for index, ax in zip(titles, axes):
+        sub_df = partitions[index] if subplots else df
+
+        if update_bars(ax, sub_df, bar_width, space_width, vertical, min_std):
+            updated_axes.append(ax)
+
+        metric = index if facets else df.columns[0][0]
+        limits = get_value_limits(
+            sub_df,
+            bar_width,
+            space_width,
+            min_value,
+            max_value,
+            auto_normalize_metrics
+            and (is_normalized_metric(metric) or is_normalized_metric(title)),
+            auto_normalize_metrics
+            and (
+                is_absolutely_normalized_metric(metric)
+                or is_absolutely_normalized_metric(title)
+            ),
+        )
+
+        current_limits = ax.get_ylim() if vertical else ax.get_xlim()
+        if tuple(current_limits) != limits:
+            limits_changed = True
+            if vertical:
+                ax.set_ylim(*limits)
+            else:
+                ax.set_xlim(*limits)
+
+    canvas = figure.canvas
+
+    if not blit or not canvas.supports_blit:
+        if updated_axes or limits_changed:
+            canvas.draw_idle()
+        return figure, axes
+
+    if figure not in BLIT_BACKGROUNDS:
+        setup_blitting(figure, list(axes[: len(titles)]))
+        return figure, axes
+
+    # The error bars created by the update are animated as well.
+    for ax in updated_axes:
+        for artist in get_blitted_artists(ax):
+            artist.set_animated(True)
+
+    if limits_changed:
+        # The ticks changed, so the backgrounds are captured again.
+        canvas.draw()
+    elif updated_axes:
+        blit_axes(figure, updated_axes)
+        canvas.flush_events()
+
+    return figure, axes
@@ -1,24 +1,95 @@
 """Submodule with utilities for plotting barplots."""
 
 from barplots.utils.save_picture import save_picture
+from barplots.utils.apply_single_pass_layout import apply_single_pass_layout
 from barplots.utils.get_axes import get_axes
 from barplots.utils.text_positions import text_positions
+from barplots.utils.compact_table import CompactTable
 from barplots.utils.plot_bars import plot_bars
+from barplots.utils.plot_boxplots import plot_boxplots
+from barplots.utils.quantile_sketch import QuantileSketch
+from barplots.utils.aggregate_boxplot_statistics import aggregate_boxplot_statistics
 from barplots.utils.get_levels import get_levels
 from barplots.utils.remove_duplicated_legend_labels import (
     remove_duplicated_legend_labels,
 )
 from barplots.utils.plot_bar_labels import plot_bar_labels
+from barplots.utils.plot_legend import plot_legend
+from barplots.utils.get_bar_style import get_bar_style
+from barplots.utils.format_value_axis import format_value_axis
+from barplots.utils.update_bars import update_bars
+from barplots.utils.update_data_label import update_data_label
 from barplots.utils.get_max_bar_length import get_max_bar_length
+from barplots.utils.get_value_limits import get_value_limits
+from barplots.utils.pool_statistics import pool_statistics
+from barplots.utils.normalize_aggregated_table import normalize_aggregated_table
+from barplots.utils.pool_aggregated_tables import pool_aggregated_tables
+from barplots.utils.bootstrap_confidence_intervals import bootstrap_confidence_intervals
+from barplots.utils.aggregate_bootstrap_confidence_intervals import (
+    aggregate_bootstrap_confidence_intervals,
+)
+from barplots.utils.get_error_extents import get_error_extents
+from barplots.utils.keep_top_k_leaves import keep_top_k_leaves
+from barplots.utils.get_subplot_partitions import get_subplot_partitions
+from barplots.utils.sanitize_labels import (
+    sanitize_labels,
+    get_sanitization_cache_info,
+    clear_sanitization_cache,
+)
+from barplots.utils.text_metrics import get_text_width, get_text_widths
+from barplots.utils.validate_barplot_options import validate_barplot_options
+from barplots.utils.read_table import read_table
+from barplots.utils.aggregate_table import aggregate_table
+from barplots.utils.sqlite_table import SQLiteTable
+from barplots.utils.table_tail import TableTail
+from barplots.utils.running_aggregates import RunningAggregates
+from barplots.utils.render_executor import (
+    configure_render_executor,
+    get_closing_checkpoint,
+    run_in_render_executor,
+)
 
 
 __all__ = [
     "save_picture",
+    "apply_single_pass_layout",
     "get_axes",
     "text_positions",
+    "CompactTable",
     "plot_bars",
+    "plot_boxplots",
+    "QuantileSketch",
+    "aggregate_boxplot_statistics",
     "get_levels",
     "remove_duplicated_legend_labels",
     "plot_bar_labels",
+    "plot_legend",
+    "get_bar_style",
+    "format_value_axis",
+    "update_bars",
+    "update_data_label",
     "get_max_bar_length",
+    "get_value_limits",
+    "pool_statistics",
+    "normalize_aggregated_table",
+    "pool_aggregated_tables",
+    "bootstrap_confidence_intervals",
+    "aggregate_bootstrap_confidence_intervals",
+    "get_error_extents",
+    "keep_top_k_leaves",
+    "get_subplot_partitions",
+    "sanitize_labels",
+    "get_sanitization_cache_info",
+    "clear_sanitization_cache",
+    "get_text_width",
+    "get_text_widths",
+    "validate_barplot_options",
+    "read_table",
+    "aggregate_table",
+    "SQLiteTable",
+    "TableTail",
+    "RunningAggregates",
+    "configure_render_executor",
+    "get_closing_checkpoint",
+    "run_in_render_executor",
 ]
@@ -0,0 +1,68 @@
+"""Aggregate the means of groups of samples with their bootstrap confidence intervals."""
+
+from typing import List, Optional
+import pandas as pd
+from barplots.utils.bootstrap_confidence_intervals import (
+    bootstrap_confidence_intervals,
+)
+
+
+def aggregate_bootstrap_confidence_intervals(
+    df: pd.DataFrame,
+    groupby: List[str],
+    resamples: int = 1000,
+    confidence: float = 0.95,
+    random_state: Optional[int] = None,
+) -> pd.DataFrame:
+    """Return the means of the groups with their bootstrap confidence intervals.
+
+    The intervals of all the groups and metrics are computed together,
+    see bootstrap_confidence_intervals.
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        Dataframe with the groupby columns and the numeric metrics.
+    groupby: List[str]
+        Columns to group the rows by.
+    resamples: int = 1000
+        Number of bootstrap resamples.
+    confidence: float = 0.95
+        Confidence level of the intervals.
+    random_state: Optional[int] = None
+        Seed of the random generator, to reproduce the intervals.
+
+    Raises
+    ------
+    ValueError
+        If the number of resamples or the confidence are not valid.
+
+    Returns
+    -------
+    Dataframe indexed by the groups, with the "mean", "lower" and "upper"
+    sub-columns of each metric.
+    """
+    metrics = [column for column in df.columns if column not in groupby]
+    grouped = df.groupby(groupby)
+    means = grouped[metrics].mean().sort_index()
+    lower, upper = bootstrap_confidence_intervals(
+        df[metrics].to_numpy(dtype=float),
+        grouped.ngroup().to_numpy(),
+        resamples=resamples,
+        confidence=confidence,
+        random_state=random_state,
+    )
+    return pd.concat(
+        {
+            metric: pd.DataFrame(
+                {
+                    "mean": means[metric],
+                    "lower": lower[:, position],
+                    "upper": upper[:, position],
+                },
+                index=means.index,
+            )
+            for position, metric in enumerate(metrics)
+        },
+        axis=1,
+    )
@@ -0,0 +1,109 @@
+"""Aggregate the boxplot statistics of groups of samples from quantile sketches."""
+
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+from barplots.utils.quantile_sketch import SKETCH_CHUNK_SIZE, QuantileSketch
+
+# Statistics of a boxplot, in the order of the aggregated sub-columns.
+BOXPLOT_STATISTICS = ("mean", "whislo", "q1", "med", "q3", "whishi")
+
+
+def sketch_groups(
+    values: np.ndarray,
+    codes: np.ndarray,
+    relative_accuracy: float = 0.01,
+) -> List[QuantileSketch]:
+    """Return the quantile sketches of the samples of each group.
+
+    The samples are processed in chunks: the buckets of the samples of
+    each chunk are computed and counted at once, and only the counts of
+    the buckets are then added to the sketches of the groups in the chunk.
+
+    Parameters
+    ----------
+    values: np.ndarray
+        The finite samples.
+    codes: np.ndarray
+        Group code of each sample, from zero to the number of groups minus one.
+    relative_accuracy: float = 0.01
+        Maximum relative error of the estimated quantiles.
+    """
+    values = np.asarray(values, dtype=float)
+    codes = np.asarray(codes, dtype=np.int64)
+    groups = int(codes.max()) + 1 if len(codes) else 0
+    sketches = [QuantileSketch(relative_accuracy) for _ in range(groups)]
+    if groups == 0:
+        return sketches
+    if not np.isfinite(values).all():
+        raise ValueError("The samples of a quantile sketch must be finite.")
+
+    for start in range(0, len(values), SKETCH_CHUNK_SIZE):
+        chunk = values[start : start + SKETCH_CHUNK_SIZE]
+        present, chunk_codes = np.unique(
+            codes[start : start + SKETCH_CHUNK_SIZE], return_inverse=True
+        )
+        signs, keys = sketches[0].get_buckets(chunk)
+        buckets, counts = np.unique(
+            np.stack((chunk_codes, signs, keys)), axis=1, return_counts=True
+        )
+        # The buckets are sorted by group, so each group is a contiguous slice.
+        bounds = np.searchsorted(buckets[0], np.arange(len(present) + 1))
+        totals = np.bincount(chunk_codes, weights=chunk, minlength=len(present))
+        minimums = np.full(len(present), np.inf)
+        maximums = np.full(len(present), -np.inf)
+        np.minimum.at(minimums, chunk_codes, chunk)
+        np.maximum.at(maximums, chunk_codes, chunk)
+
+        for position, code in enumerate(present.tolist()):
+            begin, end = bounds[position], bounds[position + 1]
+            sketches[code].add_counts(
+                buckets[1, begin:end],
+                buckets[2, begin:end],
+                counts[begin:end],
+                totals[position],
+                minimums[position],
+                maximums[position],
+            )
+    return sketches
+
+
+def aggregate_boxplot_statistics(
+    df: pd.DataFrame,
+    groupby: List[str],
+    relative_accuracy: float = 0.01,
+    whisker: Optional[float] = 1.5,
+) -> pd.DataFrame:
+    """Return the boxplot statistics of the groups, estimated by quantile sketches.
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        Dataframe with the groupby columns and the numeric metrics.
+    groupby: List[str]
+        Columns to group the rows by.
+    relative_accuracy: float = 0.01
+        Maximum relative error of the estimated quantiles.
+    whisker: Optional[float] = 1.5
+        Multiple of the interquartile range at which the whiskers are drawn.
+        If None, the whiskers reach the minimum and maximum samples.
+
+    Returns
+    -------
+    Dataframe indexed by the groups, with the mean, the whiskers, the
+    quartiles and the median as sub-columns of each metric.
+    """
+    metrics = [column for column in df.columns if column not in groupby]
+    grouped = df.groupby(groupby)
+    codes = grouped.ngroup().to_numpy()
+    index = grouped.size().sort_index().index
+
+    columns: Dict[str, pd.DataFrame] = {}
+    for metric in metrics:
+        sketches = sketch_groups(df[metric].to_numpy(), codes, relative_accuracy)
+        columns[metric] = pd.DataFrame(
+            [sketch.boxplot_statistics(whisker) for sketch in sketches],
+            columns=list(BOXPLOT_STATISTICS),
+            index=index,
+        )
+    return pd.concat(columns, axis=1)
@@ -0,0 +1,375 @@
+"""Screen and aggregate the columns of Arrow, Polars and SQLite tables natively."""
+
+from typing import Any, Dict, List, Sequence
+import numpy as np
+import pandas as pd
+from barplots.utils.sqlite_table import SQLiteTable
+
+# Number of rows of an Arrow column compared at once with the row numbers,
+# so that the screening does not allocate arrays as long as the table.
+SCREENING_CHUNK_SIZE = 1 << 20
+
+
+def is_arrow_table(df: Any) -> bool:
+    """Return whether the given table is an Arrow table, without importing pyarrow."""
+    return type(df).__module__.startswith("pyarrow") and hasattr(df, "column_names")
+
+
+def is_polars_frame(df: Any) -> bool:
+    """Return whether the given table is a Polars frame, without importing polars."""
+    return type(df).__module__.startswith("polars") and type(df).__name__ in (
+        "DataFrame",
+        "LazyFrame",
+    )
+
+
+def get_column_names(df: Any) -> List[str]:
+    """Return the names of the columns of the given pandas, Arrow, Polars or SQLite table.
+
+    Parameters
+    ----------
+    df: Any
+        The pandas dataframe, Arrow table, Polars frame or SQLite table.
+    """
+    if isinstance(df, SQLiteTable) or is_arrow_table(df):
+        return list(df.column_names)
+    if is_polars_frame(df):
+        return list(df.lazy().collect_schema().names())
+    return list(df.columns)
+
+
+def build_groups_df(
+    columns: Dict[str, Sequence],
+    groupby: List[str],
+    metrics: List[str],
+    statistics: Sequence[str],
+) -> pd.DataFrame:
+    """Return the aggregated table in the format of the pandas aggregation.
+
+    The group keys are converted to strings, as barplots does before
+    grouping, but only once they are aggregated.
+
+    Parameters
+    ----------
+    columns: Dict[str, Sequence]
+        The aggregated columns, with the statistics named as "metric/statistic".
+    groupby: List[str]
+        The columns the rows were grouped by.
+    metrics: List[str]
+        The aggregated metrics.
+    statistics: Sequence[str]
+        The computed statistics.
+    """
+    keys = []
+    for column in groupby:
+        values = pd.Series(columns[column], dtype=object)
+        # The missing keys are converted to "nan", as by pandas.
+        keys.append(values.where(values.notna(), np.nan).astype(str))
+    index = (
+        pd.Index(keys[0], name=groupby[0])
+        if len(groupby) == 1
+        else pd.MultiIndex.from_arrays(keys, names=groupby)
+    )
+    return pd.DataFrame(
+        {
+            (metric, statistic): np.asarray(
+                columns[f"{metric}/{statistic}"], dtype=float
+            )
+            for metric in metrics
+            for statistic in statistics
+        },
+        index=index,
+    ).sort_index()
+
+
+def aggregate_polars_frame(
+    df: Any,
+    groupby: List[str],
+    statistics: Sequence[str],
+    skip_constant_columns: bool,
+    skip_boolean_columns: bool,
+) -> pd.DataFrame:
+    """Return the statistics of the plottable columns of the given Polars frame.
+
+    Parameters
+    ----------
+    df: Any
+        The Polars frame, either eager or lazy.
+    groupby: List[str]
+        The columns to group the rows by.
+    statistics: Sequence[str]
+        The statistics to compute, among "mean", "std" and "count".
+    skip_constant_columns: bool
+        Whether to skip the columns with constant values.
+    skip_boolean_columns: bool
+        Whether to skip the boolean columns.
+    """
+    import polars as pl  # pylint: disable=import-outside-toplevel
+
+    lazy = df.lazy()
+    schema = lazy.collect_schema()
+    candidates = [
+        name
+        for name, dtype in schema.items()
+        if name not in groupby
+        and (dtype.is_numeric() or (dtype == pl.Boolean and not skip_boolean_columns))
+    ]
+
+    # The screening of barplots, run as a single query of the frame.
+    screening = []
+    for name in candidates:
+        column = pl.col(name)
+        if schema[name] == pl.Boolean:
+            column = column.cast(pl.Int8)
+        missing = column.is_null().any()
+        if schema[name].is_float():
+            missing = missing | column.is_nan().any()
+        plottable = (
+            ~missing & (pl.len() > 0) & ~(column == pl.int_range(pl.len())).all()
+        )
+        if skip_constant_columns:
+            plottable = plottable & (column.min() != column.max())
+        screening.append(plottable.alias(name))
+
+    screened = lazy.select(screening).collect().row(0) if candidates else ()
+    metrics = [name for name, plottable in zip(candidates, screened) if plottable]
+
+    expressions = {
+        "mean": lambda column: column.mean(),
+        "std": lambda column: column.std(ddof=1),
+        "count": lambda column: column.count(),
+    }
+
+    aggregated = (
+        lazy.group_by(groupby)
+        .agg(
+            [
+                expressions[statistic](pl.col(metric).cast(pl.Float64)).alias(
+                    f"{metric}/{statistic}"
+                )
+                for metric in metrics
+                for statistic in statistics
+            ]
+        )
+        .collect()
+    )
+
+    return build_groups_df(
+        aggregated.to_dict(as_series=False), groupby, metrics, statistics
+    )
+
+
+def is_arrow_row_numbers(column: Any, minimum: Any, maximum: Any) -> bool:
+    """Return whether the given Arrow column holds the row numbers, from zero.
+
+    The columns whose extremes are not the first and last row numbers are
+    ruled out at once, while the others are compared with the row numbers
+    in chunks of SCREENING_CHUNK_SIZE rows, stopping at the first mismatch.
+
+    Parameters
+    ----------
+    column: Any
+        The Arrow column, without missing values.
+    minimum: Any
+        The minimum of the column.
+    maximum: Any
+        The maximum of the column.
+    """
+    import pyarrow as pa  # pylint: disable=import-outside-toplevel
+    import pyarrow.compute as pc  # pylint: disable=import-outside-toplevel
+
+    if minimum != 0 or maximum != len(column) - 1:
+        return False
+    for start in range(0, len(column), SCREENING_CHUNK_SIZE):
+        chunk = column.slice(start, SCREENING_CHUNK_SIZE)
+        row_numbers = pa.array(np.arange(start, start + len(chunk)), type=pa.int64())
+        if not pc.all(pc.equal(chunk, row_numbers)).as_py():
+            return False
+    return True
+
+
+def aggregate_arrow_table(
+    df: Any,
+    groupby: List[str],
+    statistics: Sequence[str],
+    skip_constant_columns: bool,
+    skip_boolean_columns: bool,
+) -> pd.DataFrame:
+    """Return the statistics of the plottable columns of the given Arrow table.
+
+    Parameters
+    ----------
+    df: Any
+        The Arrow table.
+    groupby: List[str]
+        The columns to group the rows by.
+    statistics: Sequence[str]
+        The statistics to compute, among "mean", "std" and "count".
+    skip_constant_columns: bool
+        Whether to skip the columns with constant values.
+    skip_boolean_columns: bool
+        Whether to skip the boolean columns.
+    """
+    import pyarrow as pa  # pylint: disable=import-outside-toplevel
+    import pyarrow.compute as pc  # pylint: disable=import-outside-toplevel
+
+    metrics = []
+    for field in df.schema:
+        if field.name in groupby:
+            continue
+        boolean = pa.types.is_boolean(field.type)
+        if not (
+            pa.types.is_integer(field.type)
+            or pa.types.is_floating(field.type)
+            or (boolean and not skip_boolean_columns)
+        ):
+            continue
+        column = df.column(field.name)
+        if boolean:
+            column = column.cast(pa.int8())
+        # The screening of barplots, run with the Arrow kernels.
+        if len(column) == 0 or column.null_count > 0:
+            continue
+        if pa.types.is_floating(field.type) and pc.any(pc.is_nan(column)).as_py():
+            continue
+        extremes = pc.min_max(column)
+        if is_arrow_row_numbers(
+            column, extremes["min"].as_py(), extremes["max"].as_py()
+        ):
+            continue
+        if skip_constant_columns and extremes["min"] == extremes["max"]:
+            continue
+        metrics.append(field.name)
+
+    kernels = {
+        "mean": ("mean", None),
+        "std": ("stddev", pc.VarianceOptions(ddof=1)),
+        "count": ("count", None),
+    }
+
+    table = df.select(groupby + metrics)
+    table = table.cast(
+        pa.schema(
+            [
+                (pa.field(field.name, pa.float64()) if field.name in metrics else field)
+                for field in table.schema
+            ]
+        )
+    )
+    aggregated = table.group_by(groupby).aggregate(
+        [
+            (metric, kernels[statistic][0], kernels[statistic][1])
+            for metric in metrics
+            for statistic in statistics
+        ]
+    )
+
+    columns = aggregated.to_pydict()
+    for metric in metrics:
+        for statistic in statistics:
+            columns[f"{metric}/{statistic}"] = columns.pop(
+                f"{metric}_{kernels[statistic][0]}"
+            )
+
+    return build_groups_df(columns, groupby, metrics, statistics)
+
+
+def aggregate_sqlite_table(
+    df: SQLiteTable,
+    groupby: List[str],
+    statistics: Sequence[str],
+    skip_constant_columns: bool,
+    skip_boolean_columns: bool,  # pylint: disable=unused-argument
+) -> pd.DataFrame:
+    """Return the statistics of the plottable columns of the given SQLite table.
+
+    Parameters
+    ----------
+    df: SQLiteTable
+        The SQLite table.
+    groupby: List[str]
+        The columns to group the rows by.
+    statistics: Sequence[str]
+        The statistics to compute, among "mean", "std" and "count".
+    skip_constant_columns: bool
+        Whether to skip the columns with constant values.
+    skip_boolean_columns: bool
+        Ignored, as SQLite stores the booleans as integers.
+    """
+    metrics = df.screen(groupby, skip_constant_columns)
+    return build_groups_df(
+        df.aggregate(groupby, metrics, statistics), groupby, metrics, statistics
+    )
+
+
+def aggregate_table(
+    df: Any,
+    groupby: List[str],
+    statistics: Sequence[str],
+    skip_constant_columns: bool = True,
+    skip_boolean_columns: bool = True,
+) -> pd.DataFrame:
+    """Return the statistics of the plottable columns of the given Arrow, Polars or SQLite table.
+
+    The columns are screened and aggregated by the engine of the table,
+    so that only the aggregated table is converted to pandas. The result
+    is the same of the pandas aggregation run by barplots.
+
+    Parameters
+    ----------
+    df: Any
+        The Arrow table, Polars frame, either eager or lazy, or SQLite table.
+    groupby: List[str]
+        The columns to group the rows by.
+    statistics: Sequence[str]
+        The statistics to compute, among "mean", "std" and "count".
+    skip_constant_columns: bool = True
+        Whether to skip the columns with constant values.
+    skip_boolean_columns: bool = True
+        Whether to skip the boolean columns.
+
+    Raises
+    ------
+    ValueError
+        If the table is neither an Arrow table, a Polars frame nor a SQLite table.
+
+    Returns
+    -------
+    Dataframe indexed by the groups, with the statistics of each metric.
+    """
+    if isinstance(df, SQLiteTable):
+        aggregate = aggregate_sqlite_table
+    elif is_polars_frame(df):
+        aggregate = aggregate_polars_frame
+    elif is_arrow_table(df):
+        aggregate = aggregate_arrow_table
+    else:
+        raise ValueError(
+            f"The table of type {type(df).__name__} is neither an Arrow table, "
+            "a Polars frame nor a SQLite table."
+        )
+    return aggregate(
+        df, groupby, statistics, skip_constant_columns, skip_boolean_columns
+    )
+
+
+def to_pandas(df: Any) -> pd.DataFrame:
+    """Return the given pandas, Arrow, Polars or SQLite table as a pandas dataframe.
+
+    Parameters
+    ----------
+    df: Any
+        The pandas dataframe, Arrow table, Polars frame or SQLite table.
+    """
+    if isinstance(df, SQLiteTable) or is_arrow_table(df):
+        return df.to_pandas()
+    if is_polars_frame(df):
+        # The columns are converted through NumPy, without copying the
+        # numeric ones without missing values.
+        return pd.DataFrame(
+            {
+                name: series.to_numpy()
+                for name, series in df.lazy().collect().to_dict().items()
+            }
+        )
+    return df
@@ -0,0 +1,68 @@
+"""Function to lay out a figure so that it can be saved without cropping."""
+
+import matplotlib as mpl
+from typing import Tuple
+from matplotlib.figure import Figure
+from matplotlib.transforms import Bbox
+
+
+def apply_single_pass_layout(
+    figure: Figure, rect: Tuple[float, float, float, float] = (0, 0, 1, 1)
+):
+    """Lay out the figure so that it can be saved as it is, matching the cropped picture.
+
+    The tight layout is applied as with the tight layout mode, and then
+    the extents of the content of the figure are measured once and the
+    figure is resized to them, padded as by savefig with bbox_inches="tight",
+    moving the axes, texts and legends of the figure so that they keep
+    their size and relative placement, as the cropping does. The figure
+    can then be saved as it is, without the further draw that savefig
+    would need to crop it.
+
+    Parameters
+    ----------
+    figure: Figure
+        The figure to lay out.
+    rect: Tuple[float, float, float, float] = (0, 0, 1, 1)
+        The area of the figure, in normalized coordinates, to fit the subplots in.
+    """
+    figure.tight_layout(rect=rect)
+    fit_figure_to_content(figure, mpl.rcParams["savefig.pad_inches"])
+
+
+def fit_figure_to_content(figure: Figure, pad_inches: float):
+    """Resize the figure to its padded content, keeping the content in place.
+
+    Parameters
+    ----------
+    figure: Figure
+        The figure to resize.
+    pad_inches: float
+        The padding around the content, in inches.
+    """
+    width, height = figure.get_size_inches()
+    content = figure.get_tightbbox(figure.canvas.get_renderer()).padded(pad_inches)
+
+    def to_content(x: float, y: float) -> Tuple[float, float]:
+        """Return the given figure coordinates in the resized figure."""
+        return (
+            (x * width - content.x0) / content.width,
+            (y * height - content.y0) / content.height,
+        )
+
+    for ax in figure.axes:
+        x0, y0, x1, y1 = ax.get_position().extents
+        ax.set_position(Bbox([to_content(x0, y0), to_content(x1, y1)]))
+
+    for text in figure.texts:
+        if text.get_transform() == figure.transFigure:
+            text.set_position(to_content(*text.get_position()))
+
+    for legend in figure.legends:
+        anchor = legend.get_bbox_to_anchor().transformed(figure.transFigure.inverted())
+        legend.set_bbox_to_anchor(
+            Bbox([to_content(anchor.x0, anchor.y0), to_content(anchor.x1, anchor.y1)]),
+            transform=figure.transFigure,
+        )
+
+    figure.set_size_inches(content.width, content.height)
@@ -1,44 +1,121 @@
 """Module to generate bar positions."""
 
-from typing import Generator, Tuple
+from typing import Generator, Tuple, Union
+import numpy as np
 import pandas as pd
-from barplots.utils.get_jumps import get_jumps
+from barplots.utils.compact_table import CompactTable, as_compact_table
 
 
-def bar_positions(df: pd.DataFrame, bar_width: float, space_width: float) -> Generator:
+def is_interval(statistics: Tuple[str, ...]) -> bool:
+    """Return whether the given statistics are a value with the bounds of an interval.
+
+    Parameters
+    ----------
+    statistics: Tuple[str, ...]
+        The names of the statistics of the table.
+    """
+    return len(statistics) == 3 and {"lower", "upper"} <= set(statistics)
+
+
+def get_bar_geometry(
+    df: Union[pd.DataFrame, CompactTable], bar_width: float, space_width: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Return the positions, values and error extents of all the bars at once.
+
+    The dataframe has either the mean, the mean and the standard deviation,
+    in this order, or the mean with the "lower" and "upper" bounds of an
+    interval, such as a confidence interval. The error of the bars is either
+    the standard deviation or the extents of the interval below and above
+    the mean.
+    The dataframes of boxplots have instead the sub-columns "whislo", "q1",
+    "med", "q3" and "whishi", and the median with the extents of the
+    whiskers are used as the value and the error of the bars.
+
+    Parameters
+    ----------
+    df: Union[pd.DataFrame, CompactTable]
+        Dataframe, or its compact table, from which to extract the data.
+    bar_width: float
+        Width of any given bar.
+    space_width: float
+        Width of spaces between spaces.
+
+    Raises
+    ------
+    ValueError
+        If the dataframe does not have 1 or 2 columns, or 3 columns with the
+        "lower" and "upper" bounds, and is not a boxplot one.
+
+    Returns
+    -------
+    Tuple with the arrays of the centers of the bars, their values and the
+    extents of their errors below and above the values.
+    """
+    table = as_compact_table(df)
+    values = table.values
+    columns = len(table.statistics)
+    statistics = {name: values[:, i] for i, name in enumerate(table.statistics)}
+
+    if "med" in table.statistics:
+        y = statistics["med"]
+        below, above = y - statistics["whislo"], statistics["whishi"] - y
+    elif is_interval(table.statistics):
+        (value,) = set(table.statistics) - {"lower", "upper"}
+        y = statistics[value]
+        # The percentile intervals may not contain the mean.
+        below = np.maximum(y - statistics["lower"], 0.0)
+        above = np.maximum(statistics["upper"] - y, 0.0)
+    elif columns == 1:
+        y = values[:, 0]
+        below = above = np.zeros(len(table))
+    elif columns == 2:
+        y = values[:, 0]
+        below = above = values[:, 1]
+    else:
+        raise ValueError(
+            "Dataframe must have 1 or 2 columns, or 3 columns with the "
+            f'"lower" and "upper" bounds, but the columns {table.statistics} '
+            "were found."
+        )
+
+    jumps = table.get_jumps()
+    # The spaces and the bar widths are accumulated in the same order
+    # as the bars are laid out, so that the positions are the same as
+    # when adding them one by one.
+    increments = np.empty(2 * len(table))
+    increments[0::2] = space_width * jumps[:, :-1].sum(axis=1)
+    increments[1::2] = np.where(jumps[:, -1], bar_width, 0.0)
+    x = np.cumsum(increments)[1::2] + bar_width / 2
+
+    return x, y, below, above
+
+
+def bar_positions(
+    df: Union[pd.DataFrame, CompactTable], bar_width: float, space_width: float
+) -> Generator:
     """Returns a generator of bar positions.
 
+    The bars are laid out by get_bar_geometry, and for each bar are
+    yielded its center, its value, its error and its index. The error
+    is either the standard deviation or, for the intervals and the
+    boxplots, the tuple of its extents below and above the value.
+
     Parameters
     ----------
-    df: pd.DataFrame
-        Dataframe to iterate to extract the necessary data.
+    df: Union[pd.DataFrame, CompactTable]
+        Dataframe, or its compact table, from which to extract the data.
     bar_width: float
         Width of any given bar.
     space_width: float
         Width of spaces between spaces.
     """
-    old_index: Tuple = ()
-    bar_position: float = 0.0
-    for index, values in df.iterrows():
-        if not isinstance(index, (list, tuple)):
-            index = (index,)
-
-        jumps = get_jumps(index, old_index)
-
-        bar_position += space_width * sum(jumps[:-1])
-        if jumps[-1]:
-            bar_position += bar_width
-
-        old_index = index
-
-        if len(values) == 2:
-            y, std = values
-        elif len(values) == 1:
-            y, std = values.values[0], 0
-        else:
-            raise ValueError(
-                "Dataframe must have 1 or 2 columns, "
-                f"but {len(values)} columns were found."
-            )
-
-        yield (bar_position + bar_width / 2, y, std, index)
+    table = as_compact_table(df)
+    x, y, below, above = get_bar_geometry(table, bar_width, space_width)
+    symmetric = "med" not in table.statistics and not is_interval(table.statistics)
+    stds = (
+        (below if len(table.statistics) == 2 else [0] * len(table))
+        if symmetric
+        else list(zip(below.tolist(), above.tolist()))
+    )
+    for row, std in enumerate(stds):
+        yield (x[row], y[row], std, table.get_index(row))
@@ -0,0 +1,94 @@
+"""Percentile bootstrap confidence intervals of the means of groups of samples."""
+
+from typing import Optional, Tuple
+import numpy as np
+
+# Maximum number of resampled values to be held in memory at once.
+MAX_RESAMPLED_VALUES = 2**24
+
+
+def bootstrap_confidence_intervals(
+    values: np.ndarray,
+    codes: np.ndarray,
+    resamples: int = 1000,
+    confidence: float = 0.95,
+    random_state: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the percentile bootstrap confidence intervals of the group means.
+
+    The samples are sorted by their group code, so that each group is a
+    contiguous segment, and each resample draws, for every segment, as
+    many samples as the segment has with replacement from the segment
+    itself. The means of all the groups, metrics and resamples are then
+    computed at once as the sums of the segments, in batches of resamples
+    bounded by the number of resampled values held in memory.
+
+    Parameters
+    ----------
+    values: np.ndarray
+        Two-dimensional array with the samples as rows and the metrics as columns.
+    codes: np.ndarray
+        Group code of each sample, from zero to the number of groups minus one.
+    resamples: int = 1000
+        Number of bootstrap resamples.
+    confidence: float = 0.95
+        Confidence level of the intervals.
+    random_state: Optional[int] = None
+        Seed of the random generator, to reproduce the intervals.
+
+    Raises
+    ------
+    ValueError
+        If the number of resamples is not positive, or the confidence is
+        not strictly between zero and one.
+    ValueError
+        If the values and the codes have a different number of samples,
+        or a group has no samples.
+
+    Returns
+    -------
+    Tuple with the lower and upper bounds of the intervals, as arrays
+    with the groups as rows and the metrics as columns.
+    """
+    if not isinstance(resamples, int) or resamples < 1:
+        raise ValueError(
+            f"The number of resamples must be a positive integer, not {resamples}."
+        )
+    if not 0 < confidence < 1:
+        raise ValueError(
+            f"The confidence must be strictly between zero and one, not {confidence}."
+        )
+
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        values = values[:, None]
+    codes = np.asarray(codes)
+    if len(codes) != len(values):
+        raise ValueError(f"The {len(values)} samples have {len(codes)} group codes.")
+
+    order = np.argsort(codes, kind="stable")
+    values = values[order]
+    counts = np.bincount(codes)
+    if (counts == 0).any():
+        raise ValueError("Every group must have at least one sample.")
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    # For each position of the sorted samples, the start and size of its segment.
+    segment_starts = np.repeat(starts, counts)
+    segment_counts = np.repeat(counts, counts)
+
+    generator = np.random.default_rng(random_state)
+    batch_size = max(1, MAX_RESAMPLED_VALUES // max(1, values.size))
+    means = np.empty((resamples, len(counts), values.shape[1]))
+
+    for batch_start in range(0, resamples, batch_size):
+        batch = min(batch_size, resamples - batch_start)
+        positions = segment_starts + (
+            generator.random((batch, len(values))) * segment_counts
+        ).astype(np.int64)
+        sums = np.add.reduceat(values[positions], starts, axis=1)
+        means[batch_start : batch_start + batch] = sums / counts[:, None]
+
+    alpha = (1 - confidence) / 2
+    lower, upper = np.quantile(means, [alpha, 1 - alpha], axis=0)
+    return lower, upper
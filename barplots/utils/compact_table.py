@@ -0,0 +1,125 @@
+"""Compact array-backed representation of an aggregated table."""
+
+from typing import Tuple, Union
+import numpy as np
+import pandas as pd
+
+
+class CompactTable:
+    """Aggregated table stored as arrays, as needed to render the barplots.
+
+    Each index level is stored as an array of integer codes with the tuple
+    of its labels, and the values as a single two-dimensional array, with
+    a column for each statistic. The table is built once from a dataframe
+    and is cheap to iterate and to pickle.
+    """
+
+    __slots__ = ("names", "codes", "labels", "statistics", "values")
+
+    def __init__(
+        self,
+        names: Tuple,
+        codes: Tuple[np.ndarray, ...],
+        labels: Tuple[Tuple, ...],
+        statistics: Tuple[str, ...],
+        values: np.ndarray,
+    ):
+        """Create a new compact table.
+
+        Parameters
+        ----------
+        names: Tuple
+            The names of the index levels.
+        codes: Tuple[np.ndarray, ...]
+            For each index level, the int32 codes of the labels of the rows.
+        labels: Tuple[Tuple, ...]
+            For each index level, the labels of its codes.
+        statistics: Tuple[str, ...]
+            The names of the statistics, in the order of the value columns.
+        values: np.ndarray
+            The values, with the rows as rows and the statistics as columns.
+        """
+        self.names = names
+        self.codes = codes
+        self.labels = labels
+        self.statistics = statistics
+        self.values = values
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> "CompactTable":
+        """Return the compact table of the given aggregated dataframe.
+
+        Parameters
+        ----------
+        df: pd.DataFrame
+            The aggregated dataframe, whose sub-columns, or columns if
+            not multi-index, are the names of the statistics.
+        """
+        codes, labels = [], []
+        for level in range(df.index.nlevels):
+            level_codes, level_labels = pd.factorize(df.index.get_level_values(level))
+            codes.append(level_codes.astype(np.int32))
+            labels.append(tuple(level_labels))
+        return cls(
+            names=tuple(df.index.names),
+            codes=tuple(codes),
+            labels=tuple(labels),
+            statistics=tuple(
+                column[-1] if isinstance(column, tuple) else column
+                for column in df.columns
+            ),
+            values=df.to_numpy(dtype=np.float64),
+        )
+
+    def __len__(self) -> int:
+        """Return the number of rows of the table."""
+        return len(self.values)
+
+    def get_index(self, row: int) -> Tuple:
+        """Return the tuple of the labels of the given row.
+
+        Parameters
+        ----------
+        row: int
+            The position of the row.
+        """
+        return tuple(
+            labels[codes[row]] for codes, labels in zip(self.codes, self.labels)
+        )
+
+    def get_changes(self) -> np.ndarray:
+        """Return whether the label of each level changes from the previous row.
+
+        Returns
+        -------
+        Boolean array with the rows as rows and the levels as columns,
+        whose first row is False.
+        """
+        changes = np.zeros((len(self), len(self.codes)), dtype=bool)
+        for level, codes in enumerate(self.codes):
+            changes[1:, level] = codes[1:] != codes[:-1]
+        return changes
+
+    def get_jumps(self) -> np.ndarray:
+        """Return the jumps of each level from the previous row, as get_jumps.
+
+        A level jumps when its label or the label of the level right
+        above it changes from the previous row.
+        """
+        changes = self.get_changes()
+        jumps = changes.copy()
+        jumps[:, 1:] |= changes[:, :-1]
+        return jumps
+
+
+def as_compact_table(df: Union[pd.DataFrame, CompactTable]) -> CompactTable:
+    """Return the compact table of the given dataframe, unless it already is one.
+
+    Parameters
+    ----------
+    df: Union[pd.DataFrame, CompactTable]
+        The aggregated dataframe or its compact table.
+    """
+    if isinstance(df, CompactTable):
+        return df
+    return CompactTable.from_dataframe(df)
@@ -0,0 +1,127 @@
+"""Formatter of the values shown on the value axis of the barplots."""
+
+from bisect import bisect_right
+from functools import lru_cache
+from typing import List, Optional, Sequence
+import numpy as np
+from matplotlib.ticker import Formatter
+from barplots.utils.sanitize_labels import sanitize_labels
+
+factors = [
+    ("_", 0),
+    ("y", 1e-24),
+    ("z", 1e-21),
+    ("a", 1e-18),
+    ("f", 1e-15),
+    ("p", 1e-12),
+    ("n", 1e-9),
+    ("µ", 1e-6),
+    ("m", 1e-3),
+    ("K", 1e3),
+    ("M", 1e6),
+    ("G", 1e9),
+    ("T", 1e12),
+    ("P", 1e15),
+    ("E", 1e18),
+    ("Z", 1e21),
+    ("Y", 1e24),
+    ("_", float("inf")),
+]
+
+factor_values = [value for _, value in factors]
+
+
+def get_factor_indices(absolute_digits: np.ndarray, normalized: bool) -> np.ndarray:
+    """Return the index of the SI factor of each digit, or -1 if it is not scaled.
+
+    Parameters
+    ----------
+    absolute_digits: np.ndarray
+        The absolute values of the digits.
+    normalized: bool
+        Whether the digits belong to a normalized metric, which are never scaled.
+    """
+    indices = np.searchsorted(factor_values, absolute_digits, side="right") - 1
+    # Digits smaller than the smallest factor are still shown with it.
+    indices[indices == 0] = 1
+    scaled = (
+        (absolute_digits != 0.0)
+        & ((absolute_digits <= 1e-3) | (absolute_digits >= 1e3))
+        & (indices < len(factors) - 1)
+    )
+    if normalized:
+        scaled[:] = False
+    indices[~scaled] = -1
+    return indices
+
+
+@lru_cache(maxsize=4096)
+def format_digit(digit: float, unit: str) -> str:
+    """Return the sanitized digit followed by the given unit."""
+    return sanitize_labels(digit) + unit
+
+
+@lru_cache(maxsize=4096)
+def sanitize_digits(digit: float, unit: Optional[str], normalized: bool) -> str:
+    """Return the given digit scaled to its SI prefix, followed by the unit.
+
+    Parameters
+    ----------
+    digit: float
+        The digit to format.
+    unit: Optional[str]
+        The unit to show after the digit.
+    normalized: bool
+        Whether the digit belongs to a normalized metric, which is never scaled.
+    """
+    unit = "" if unit is None else unit
+    absolute_digit = abs(digit)
+    if (
+        not normalized
+        and digit != 0.0
+        and (absolute_digit <= 1e-3 or absolute_digit >= 1e3)
+    ):
+        index = max(bisect_right(factor_values, absolute_digit) - 1, 1)
+        if index < len(factors) - 1:
+            factor, denominator = factors[index]
+            digit /= denominator
+            unit = factor + unit
+
+    return format_digit(digit, unit)
+
+
+class DigitsFormatter(Formatter):
+    """Tick formatter showing the values scaled to their SI prefix and unit."""
+
+    def __init__(self, unit: Optional[str], normalized: bool):
+        """Create a new formatter.
+
+        Parameters
+        ----------
+        unit: Optional[str]
+            The unit to show after the values.
+        normalized: bool
+            Whether the values belong to a normalized metric, which are never scaled.
+        """
+        self.unit = unit
+        self.normalized = normalized
+
+    def __call__(self, x: float, pos: Optional[int] = None) -> str:
+        """Return the label of the given tick value."""
+        return sanitize_digits(float(x), self.unit, self.normalized)
+
+    def format_ticks(self, values: Sequence[float]) -> List[str]:
+        """Return the labels of all the given tick values at once."""
+        digits = np.asarray(values, dtype=float)
+        indices = get_factor_indices(np.abs(digits), self.normalized)
+        unit = "" if self.unit is None else self.unit
+        return [
+            (
+                format_digit(float(digit), unit)
+                if index < 0
+                else format_digit(
+                    float(digit / factors[index][1]), factors[index][0] + unit
+                )
+            )
+            for digit, index in zip(digits, indices)
+        ]
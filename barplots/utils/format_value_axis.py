@@ -0,0 +1,44 @@
+"""Function to set the ticks locator and formatter of the value axis."""
+
+from typing import Optional
+from matplotlib.axes import Axes
+from matplotlib.ticker import MaxNLocator
+from barplots.utils.digits_formatter import DigitsFormatter
+
+
+def format_value_axis(
+    axes: Axes,
+    vertical: bool,
+    unit: Optional[str],
+    normalized_metric: bool,
+    absolutely_normalized_metric: bool,
+):
+    """Set the number of ticks and the formatter of the value axis.
+
+    Parameters
+    ----------
+    axes: Axes
+        The axes whose value axis is to be formatted.
+    vertical: bool
+        Whetever the bars are vertical or horizontal.
+    unit: Optional[str]
+        Optional unit to show on the value axis.
+    normalized_metric: bool
+        Whether to consider the current metric normalized in a range (0, 1)
+    absolutely_normalized_metric: bool
+        Whether to consider the current metric absolutely normalized in a range (-1, 1)
+    """
+    value_axis = axes.yaxis if vertical else axes.xaxis
+    locator = value_axis.get_major_locator()
+
+    if normalized_metric or absolutely_normalized_metric:
+        locator.set_params(nbins=5 if normalized_metric else 8)
+    elif isinstance(locator, MaxNLocator):
+        # Restore the default number of ticks of an axes being reused.
+        locator.set_params(nbins="auto")
+
+    value_axis.set_major_formatter(
+        DigitsFormatter(
+            unit=unit, normalized=normalized_metric or absolutely_normalized_metric
+        )
+    )
@@ -1,15 +1,16 @@
 """Function to setup axes for barplot plotting."""
 
-from typing import Tuple, Dict, List, Iterable
+from typing import Any, Tuple, Dict, List, Iterable, Optional
 from math import ceil
 from matplotlib.figure import Figure
 from matplotlib.axes import Axes
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-from sanitize_ml_labels import sanitize_ml_labels
+from barplots.utils.sanitize_labels import sanitize_labels
 from barplots.utils.get_best_match import get_best_match
 from barplots.utils.get_max_bar_position import get_max_bar_position
+from barplots.utils.get_subplot_partitions import get_subplot_partitions
 
 
 GOLDEN_RATIO: float = 1.61803398875
@@ -39,6 +40,7 @@ def get_axes(
     facecolors: Dict[str, str],
     show_title: bool,
     show_column_name: bool,
+    partitions: Optional[Dict[Any, pd.DataFrame]] = None,
 ) -> Tuple[Figure, Axes]:
     """Setup axes for barplot plotting.
 
@@ -73,16 +75,20 @@ def get_axes(
         Whetever to show or not the barplot title.
     show_column_name: bool = True
         Whether to show the metric name.
+    partitions: Optional[Dict[Any, pd.DataFrame]] = None
+        The partitions of the dataframe shown in each subplot.
+        If not provided, they are computed when subplots are required.
 
     Returns
     -----------
     Tuple containing new figure and axis.
     """
     if subplots:
-        index: MultiIndex = df.index
+        if partitions is None:
+            partitions = get_subplot_partitions(df)
         side = max(
-            get_max_bar_position(df.loc[index], bar_width, space_width)
-            for index in index.levels[0]
+            get_max_bar_position(partition, bar_width, space_width)
+            for partition in partitions.values()
         )
     else:
         side = get_max_bar_position(df, bar_width, space_width)
@@ -119,7 +125,7 @@ def get_axes(
             ax.yaxis.grid(True, which="both")
             if data_label is not None and show_column_name:
                 ax.set_ylabel(
-                    sanitize_ml_labels(data_label, custom_defaults=custom_defaults)
+                    sanitize_labels(data_label, custom_defaults=custom_defaults)
                     if sanitize_metrics
                     else data_label
                 )
@@ -130,13 +136,13 @@ def get_axes(
             ax.xaxis.grid(True, which="both")
             if data_label is not None and show_column_name:
                 ax.set_xlabel(
-                    sanitize_ml_labels(data_label, custom_defaults=custom_defaults)
+                    sanitize_labels(data_label, custom_defaults=custom_defaults)
                     if sanitize_metrics
                     else data_label
                 )
         if show_title:
             ax.set_title(
-                sanitize_ml_labels(subtitle, custom_defaults=custom_defaults)
+                sanitize_labels(subtitle, custom_defaults=custom_defaults)
                 if sanitize_metrics
                 else subtitle
             )
@@ -147,7 +153,7 @@ def get_axes(
 
     if title is not None and len(axes) == 1 and show_title:
         axes[0].set_title(
-            sanitize_ml_labels(title, custom_defaults=custom_defaults)
+            sanitize_labels(title, custom_defaults=custom_defaults)
             if sanitize_metrics
             else title
         )
@@ -0,0 +1,76 @@
+"""Function to resolve the style of a bar from the provided style dictionaries."""
+
+from typing import Any, Dict, Optional, Tuple
+from barplots.utils.get_best_match import get_best_match
+
+
+def resolve_style(
+    styles: Optional[Dict[str, Any]], infer: bool, leaf: str, index: Tuple[str, ...]
+) -> Any:
+    """Return the style of the given leaf, inferring it from the index if requested.
+
+    Parameters
+    ----------
+    styles: Optional[Dict[str, Any]]
+        Dictionary of the styles, or None when the style is not set.
+    infer: bool
+        Whetever to infer the style from the best match of the index.
+    leaf: str
+        The innermost index value of the bar.
+    index: Tuple[str, ...]
+        The complete index of the bar, including the top index.
+    """
+    if styles is None:
+        return None
+    if leaf in styles:
+        return styles[leaf]
+    if infer:
+        return get_best_match(styles, index)
+    return None
+
+
+def get_bar_style(
+    index: Tuple[str, ...],
+    top_index: str,
+    alphas: Dict[str, float],
+    infer_alphas: bool,
+    colors: Dict[str, str],
+    infer_colors: bool,
+    edgecolors: Optional[Dict[str, str]],
+    infer_edgecolors: bool,
+    hatch: Optional[Dict[str, str]],
+    infer_hatch: bool,
+) -> Dict[str, Any]:
+    """Return the alpha, color, edgecolor and hatch of the bar with the given index.
+
+    Parameters
+    ----------
+    index: Tuple[str, ...]
+        The index of the bar.
+    top_index: str
+        The top index of the subplot the bar is plotted in.
+    alphas: Dict[str, float],
+        Dictionary of alphas to be used.
+    infer_alphas: bool,
+        Whetever to infer alphas or not.
+    colors: Dict[str, str],
+        Dictionary of colors to be used.
+    infer_colors: bool,
+        Whetever to infer colors or not.
+    edgecolors: Optional[Dict[str, str]],
+        Dictionary of edgecolors to be used.
+    infer_edgecolors: bool,
+        Whetever to infer edgecolors or not.
+    hatch: Optional[Dict[str, str]]
+        Dict of hatch, i.e. patterns for the bars, to be used for innermost index of dataframe.
+    infer_hatch: bool,
+        Whetever to infer hatch or not.
+    """
+    leaf = index[-1]
+    full_index = (top_index, *index)
+    return {
+        "alpha": resolve_style(alphas, infer_alphas, leaf, full_index),
+        "color": resolve_style(colors, infer_colors, leaf, full_index),
+        "edgecolor": resolve_style(edgecolors, infer_edgecolors, leaf, full_index),
+        "hatch": resolve_style(hatch, infer_hatch, leaf, full_index),
+    }
@@ -0,0 +1,17 @@
+"""Function to get the extents of an error bar below and above the bar."""
+
+from typing import Tuple, Union
+
+
+def get_error_extents(error: Union[float, Tuple[float, float]]) -> Tuple[float, float]:
+    """Return the extents of the given error bar below and above the bar.
+
+    Parameters
+    ----------
+    error: Union[float, Tuple[float, float]]
+        Either the standard deviation, shown on both sides of the bar,
+        or the extents of an asymmetric error bar, such as a confidence interval.
+    """
+    if isinstance(error, tuple):
+        return error
+    return error, error
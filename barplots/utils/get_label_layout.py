@@ -0,0 +1,113 @@
+"""Function to compute the positions, labels and rotation of a level of bar labels."""
+
+from typing import Dict, List, Optional, Tuple, Union
+import pandas as pd
+from barplots.utils.sanitize_labels import sanitize_labels
+from barplots.utils.text_positions import text_positions
+from barplots.utils.text_metrics import get_text_widths
+from barplots.utils.label_collisions import get_auto_rotation
+
+# Font sizes of the minor and major bar labels.
+MINOR_LABEL_SIZE = 9
+MAJOR_LABEL_SIZE = 10
+# Height of a line of the labels, relative to their font size.
+LINE_SPACING = 1.2
+
+
+def get_label_layout(
+    df: pd.DataFrame,
+    bar_width: float,
+    space_width: float,
+    level: int,
+    levels: int,
+    vertical: bool,
+    minor_rotation: Union[float, str],
+    major_rotation: Union[float, str],
+    custom_defaults: Dict[str, List[str]],
+    sanitize_metrics: bool,
+    cache: Optional[Dict[Tuple, Tuple]] = None,
+) -> Tuple[List[float], List[str], float, float]:
+    """Return the positions, labels, maximum label length and rotation of a level.
+
+    The layout only depends on the structure of the index of the dataframe,
+    so subplots with the same index structure can share it through the cache.
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        The dataframe whose index labels are to be placed.
+    bar_width: float
+        The width of the bars.
+    space_width: float
+        Width of spaces between spaces.
+    level: int
+        The index level to compute the layout for.
+    levels: int
+        Number of index levels shown as labels.
+    vertical: bool
+        Whetever the bars are vertical or horizontal.
+    minor_rotation: Union[float, str]
+        Rotation for the minor ticks of the bars, or "auto".
+    major_rotation: Union[float, str]
+        Rotation for the major ticks of the bars, or "auto".
+    custom_defaults: Dict[str, List[str]]
+        The defaults for normalizing the labels.
+    sanitize_metrics: bool
+        Whether to sanitize the labels or not.
+    cache: Optional[Dict[Tuple, Tuple]] = None
+        Dictionary where to store and look up the computed layouts.
+        It must not be shared across different custom defaults.
+
+    Returns
+    -------
+    Tuple with the label positions, the labels, the width in points
+    of the longest label and the rotation of the labels.
+    """
+    key = (
+        tuple(df.index),
+        bar_width,
+        space_width,
+        level,
+        levels,
+        vertical,
+        minor_rotation,
+        major_rotation,
+        sanitize_metrics,
+    )
+
+    if cache is not None and key in cache:
+        return cache[key]
+
+    positions, labels = zip(*text_positions(df, bar_width, space_width, level))
+    labels = (
+        sanitize_labels(labels, custom_defaults=custom_defaults)
+        if sanitize_metrics
+        else labels
+    )
+
+    positions = [round(pos, 5) for pos in positions]
+    minor = level == levels - 1
+
+    size = MINOR_LABEL_SIZE if minor else MAJOR_LABEL_SIZE
+    rotation = minor_rotation if minor else major_rotation
+    label_widths = get_text_widths(labels, size)
+    max_label_width = max(label_widths)
+
+    if rotation == "auto":
+        # The bar positions are expressed in inches of the figure,
+        # while the text widths are expressed in points.
+        rotation, shown = get_auto_rotation(
+            positions,
+            [label_width / 72 for label_width in label_widths],
+            size * LINE_SPACING / 72,
+            vertical,
+        )
+        positions = [position for position, show in zip(positions, shown) if show]
+        labels = [label for label, show in zip(labels, shown) if show]
+
+    layout = (positions, list(labels), max_label_width, rotation)
+
+    if cache is not None:
+        cache[key] = layout
+
+    return layout
@@ -1,12 +1,13 @@
 """Function to get the maximum and minimum bar length, including std."""
 
-from typing import Tuple
+from typing import Tuple, Union
 import pandas as pd
-from barplots.utils.bar_positions import bar_positions
+from barplots.utils.bar_positions import get_bar_geometry
+from barplots.utils.compact_table import CompactTable
 
 
 def get_max_bar_length(
-    df: pd.DataFrame, bar_width: float, space_width: float
+    df: Union[pd.DataFrame, CompactTable], bar_width: float, space_width: float
 ) -> Tuple[float, float]:
     """Return Tuple containing maximum and minimum bar length, including std.
 
@@ -14,13 +15,12 @@ def get_max_bar_length(
 
     Parameters
     ----------
-    df: pd.DataFrame
-        The dataframe from where to extract the data.
+    df: Union[pd.DataFrame, CompactTable]
+        The dataframe, or its compact table, from where to extract the data.
     bar_width: float
         The width of the bars, used also for spacing
     space_width: float
         Width of spaces between spaces.
     """
-    return max(
-        y + std for _, y, std, _ in bar_positions(df, bar_width, space_width)
-    ), min(y - std for _, y, std, _ in bar_positions(df, bar_width, space_width))
+    _, y, below, above = get_bar_geometry(df, bar_width, space_width)
+    return max((y + above).tolist()), min((y - below).tolist())
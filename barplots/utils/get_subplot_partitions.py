@@ -0,0 +1,44 @@
+"""Function to split a dataframe into the partitions shown in each subplot."""
+
+from typing import Any, Dict
+import numpy as np
+import pandas as pd
+
+
+def get_subplot_partitions(df: pd.DataFrame) -> Dict[Any, pd.DataFrame]:
+    """Return dictionary from the top index values to their rows, without the top level.
+
+    The partitions are computed once from the codes of the top index level:
+    when the index is sorted, each partition is a contiguous slice of the rows
+    found by binary search, otherwise the rows are gathered by their positions.
+    Either way no label lookup is executed on the multi-index.
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        Dataframe with a multi-index to be split by its top level.
+
+    Returns
+    -------
+    Dictionary with the partitions, in the order of the top index level.
+    """
+    level = df.index.levels[0]
+    codes = np.asarray(df.index.codes[0])
+
+    if (np.diff(codes) >= 0).all():
+        bounds = np.searchsorted(codes, np.arange(len(level) + 1))
+        partitions = {
+            label: df.iloc[start:stop]
+            for label, start, stop in zip(level, bounds[:-1], bounds[1:])
+            if stop > start
+        }
+    else:
+        partitions = {
+            label: df.iloc[positions]
+            for label, positions in sorted(
+                df.groupby(level=0, sort=False).indices.items(),
+                key=lambda item: level.get_loc(item[0]),
+            )
+        }
+
+    return {label: partition.droplevel(0) for label, partition in partitions.items()}
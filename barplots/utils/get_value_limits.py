@@ -0,0 +1,55 @@
+"""Function to get the limits of the value axis of a barplot."""
+
+from typing import Optional, Tuple, Union
+import pandas as pd
+from barplots.utils.compact_table import CompactTable
+from barplots.utils.get_max_bar_length import get_max_bar_length
+
+
+def get_value_limits(
+    df: Union[pd.DataFrame, CompactTable],
+    bar_width: float,
+    space_width: float,
+    min_value: Optional[float],
+    max_value: Optional[float],
+    normalized_metric: bool,
+    absolutely_normalized_metric: bool,
+) -> Tuple[float, float]:
+    """Return the minimum and maximum of the value axis.
+
+    Parameters
+    ----------
+    df: Union[pd.DataFrame, CompactTable]
+        The dataframe, or its compact table, from where to extract the data.
+    bar_width: float
+        The width of the bars, used also for spacing.
+    space_width: float
+        Width of spaces between spaces.
+    min_value: Optional[float]
+        Minimum value for the barplot, if provided.
+    max_value: Optional[float]
+        Maximum value for the barplot, if provided.
+    normalized_metric: bool
+        Whether to consider the current metric normalized in a range (0, 1)
+    absolutely_normalized_metric: bool
+        Whether to consider the current metric absolutely normalized in a range (-1, 1)
+    """
+    max_length, min_length = get_max_bar_length(df, bar_width, space_width)
+    max_length *= 1.01
+    min_length *= 1.01
+    min_length = min(min_length, 0)
+
+    if min_value is not None:
+        min_length = min_value
+
+    if normalized_metric:
+        max_length = max(max_length, 1.01)
+    elif absolutely_normalized_metric:
+        max_length = max(max_length, 1.01)
+        if min_length < 0:
+            min_length = min(min_length, -1.01)
+
+    if max_value is not None:
+        max_length = max_value
+
+    return min_length, max_length
@@ -0,0 +1,102 @@
+"""Function to reduce the innermost index level to its top K values."""
+
+import numpy as np
+import pandas as pd
+from barplots.utils.pool_statistics import pool_statistics
+
+
+def keep_top_k_leaves(
+    df: pd.DataFrame,
+    top_k: int,
+    statistic: str = "mean",
+    ascending: bool = False,
+    other_label: str = "Other",
+) -> pd.DataFrame:
+    """Return dataframe with only the top K leaves of each group plus an "other" bar.
+
+    The leaves are the values of the innermost index level, and they are
+    ranked within each group of the outer index levels. The leaves that are
+    not kept are merged in a single bar per group, whose mean and standard
+    deviation are pooled from the counts of the merged leaves.
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        Aggregated dataframe of a single feature, with multi-index columns
+        including the "count" sub-column.
+    top_k: int
+        Number of leaves to keep for each group.
+    statistic: str = "mean"
+        The sub-column to rank the leaves by.
+    ascending: bool = False
+        Whether to keep the leaves with the lowest statistic.
+        By default, the leaves with the highest statistic are kept.
+    other_label: str = "Other"
+        Label of the bar with the merged leaves.
+
+    Raises
+    ------
+    ValueError
+        If the given top_k is not a positive integer.
+    ValueError
+        If the dataframe does not contain the count or the statistic sub-columns.
+
+    Returns
+    -------
+    Dataframe with at most top_k + 1 leaves per group.
+    """
+    if not isinstance(top_k, int) or top_k < 1:
+        raise ValueError(f'Given top_k "{top_k}" is not a positive integer.')
+
+    feature = df.columns[0][0]
+    stats = df[feature]
+
+    for column in ("count", statistic):
+        if column not in stats.columns:
+            raise ValueError(
+                f"The sub-column {column} of the feature {feature} is required "
+                "to keep the top K leaves, but it is not available."
+            )
+
+    outer_levels = list(range(df.index.nlevels - 1))
+
+    if outer_levels:
+        ranks = (
+            stats[statistic]
+            .groupby(level=outer_levels, sort=False)
+            .rank(method="first", ascending=ascending)
+        )
+    else:
+        ranks = stats[statistic].rank(method="first", ascending=ascending)
+
+    kept = (ranks <= top_k).values
+
+    if kept.all():
+        return df
+
+    if outer_levels:
+        others = pool_statistics(stats[~kept], by=outer_levels)
+        outer_index = others.index.to_frame(index=False)
+        outer_index[df.index.names[-1]] = other_label
+        others.index = pd.MultiIndex.from_frame(outer_index)
+    else:
+        others = pool_statistics(stats[~kept], by=np.zeros((~kept).sum()))
+        others.index = pd.Index([other_label], name=df.index.name)
+
+    reduced = pd.concat([stats[kept], others[stats.columns]])
+
+    # The merged leaves are placed at the end of their own group,
+    # while both the groups and the kept leaves retain their order.
+    if outer_levels:
+        group_order = (
+            df.index.droplevel(-1).unique().get_indexer(reduced.index.droplevel(-1))
+        )
+    else:
+        group_order = np.zeros(len(reduced), dtype=int)
+    row_order = np.concatenate([np.flatnonzero(kept), np.full(len(others), len(df))])
+    reduced = reduced.iloc[np.lexsort((row_order, group_order))]
+
+    if isinstance(reduced.index, pd.MultiIndex):
+        reduced.index = reduced.index.remove_unused_levels()
+
+    return pd.concat({feature: reduced}, axis=1)
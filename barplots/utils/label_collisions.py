@@ -0,0 +1,144 @@
+"""Detection of the collisions between labels placed along an axis."""
+
+from typing import Sequence, Tuple
+import numpy as np
+
+# Rotations tried, in order of preference, when the rotation is "auto".
+AUTO_ROTATIONS = (0, 90)
+
+
+def get_label_extents(
+    label_widths: Sequence[float],
+    line_height: float,
+    rotation: float,
+    vertical: bool,
+) -> np.ndarray:
+    """Return the extents of the labels along the axis they are placed on.
+
+    Parameters
+    ----------
+    label_widths: Sequence[float]
+        The widths of the labels when not rotated.
+    line_height: float
+        The height of a line of text, in the same unit of the widths.
+    rotation: float
+        The rotation of the labels, in degrees.
+    vertical: bool
+        Whetever the bars are vertical, and the labels are therefore
+        placed along the horizontal axis, or horizontal.
+    """
+    radians = np.deg2rad(rotation)
+    widths = np.asarray(label_widths, dtype=float)
+    if vertical:
+        return np.abs(widths * np.cos(radians)) + np.abs(line_height * np.sin(radians))
+    return np.abs(widths * np.sin(radians)) + np.abs(line_height * np.cos(radians))
+
+
+def get_colliding_labels(
+    positions: Sequence[float], extents: Sequence[float]
+) -> np.ndarray:
+    """Return mask of the labels overlapping with any other label.
+
+    The labels are the intervals of the given extents centered in the
+    given positions: after sorting them by their start, a label overlaps
+    with a preceding one if and only if it starts before the furthest end
+    of the preceding labels, hence the collisions are found in O(n log n).
+
+    Parameters
+    ----------
+    positions: Sequence[float]
+        The centers of the labels along the axis.
+    extents: Sequence[float]
+        The extents of the labels along the axis.
+    """
+    positions = np.asarray(positions, dtype=float)
+    extents = np.asarray(extents, dtype=float)
+    starts = positions - extents / 2
+    ends = positions + extents / 2
+
+    order = np.argsort(starts, kind="stable")
+    starts = starts[order]
+    ends = ends[order]
+
+    colliding = np.zeros(len(order), dtype=bool)
+    if len(order) > 1:
+        furthest_ends = np.maximum.accumulate(ends)
+        # Labels starting before the furthest end of the preceding ones.
+        overlapping = starts[1:] < furthest_ends[:-1]
+        colliding[1:] |= overlapping
+        # The preceding label reaching furthest collides with them too.
+        reaching = np.maximum.accumulate(
+            np.where(ends == furthest_ends, np.arange(len(ends)), 0)
+        )
+        colliding[reaching[:-1][overlapping]] = True
+
+    mask = np.empty_like(colliding)
+    mask[order] = colliding
+    return mask
+
+
+def thin_colliding_labels(
+    positions: Sequence[float], extents: Sequence[float]
+) -> np.ndarray:
+    """Return mask of the labels to keep so that no two kept labels overlap.
+
+    The labels are swept by their start, and a label is kept only if it
+    starts after the end of the last kept label.
+
+    Parameters
+    ----------
+    positions: Sequence[float]
+        The centers of the labels along the axis.
+    extents: Sequence[float]
+        The extents of the labels along the axis.
+    """
+    positions = np.asarray(positions, dtype=float)
+    extents = np.asarray(extents, dtype=float)
+    starts = positions - extents / 2
+    ends = positions + extents / 2
+
+    kept = np.zeros(len(positions), dtype=bool)
+    last_end = -np.inf
+    for index in np.argsort(starts, kind="stable"):
+        if starts[index] >= last_end:
+            kept[index] = True
+            last_end = ends[index]
+    return kept
+
+
+def get_auto_rotation(
+    positions: Sequence[float],
+    label_widths: Sequence[float],
+    line_height: float,
+    vertical: bool,
+) -> Tuple[float, np.ndarray]:
+    """Return the rotation of the labels and the mask of the labels to show.
+
+    The first rotation without collisions is chosen. When all of them
+    produce collisions, the one with the fewest is chosen and the
+    overlapping labels are thinned out.
+
+    Parameters
+    ----------
+    positions: Sequence[float]
+        The centers of the labels along the axis.
+    label_widths: Sequence[float]
+        The widths of the labels when not rotated.
+    line_height: float
+        The height of a line of text, in the same unit of the widths.
+    vertical: bool
+        Whetever the bars are vertical or horizontal.
+    """
+    best_rotation, best_extents, best_collisions = None, None, None
+    for rotation in AUTO_ROTATIONS:
+        extents = get_label_extents(label_widths, line_height, rotation, vertical)
+        collisions = get_colliding_labels(positions, extents).sum()
+        if collisions == 0:
+            return rotation, np.ones(len(extents), dtype=bool)
+        if best_collisions is None or collisions < best_collisions:
+            best_rotation, best_extents, best_collisions = (
+                rotation,
+                extents,
+                collisions,
+            )
+    return best_rotation, thin_colliding_labels(positions, best_extents)
@@ -0,0 +1,122 @@
+"""Validate a pre-aggregated table and normalize it to the aggregated format."""
+
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+# Statistics that can be provided for each metric of a pre-aggregated table.
+AGGREGATED_STATISTICS = ("mean", "std", "sem", "count", "weight")
+
+
+def normalize_aggregated_table(
+    df: pd.DataFrame,
+    groupby: Optional[List[str]] = None,
+    separator: str = "_",
+) -> pd.DataFrame:
+    """Return the given pre-aggregated table in the format of the aggregation of barplots.
+
+    The statistics of each metric are provided either as columns named
+    "{metric}{separator}{statistic}" or as multi-index columns with the
+    metric and the statistic. The statistics are the "mean", which is
+    required, either the standard deviation "std" or the standard error
+    of the mean "sem", the "count" of the samples and the "weight" of the
+    rows, to be used in place of the counts to weight the pooled means.
+    The standard errors are converted to standard deviations, which
+    requires the counts.
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        The pre-aggregated table.
+    groupby: Optional[List[str]] = None
+        Columns identifying the groups, converted to strings as barplots
+        does before grouping. By default, the groups are the index.
+    separator: str = "_"
+        Separator of the metric and the statistic in the flat column names.
+
+    Raises
+    ------
+    ValueError
+        If a groupby column is missing.
+    ValueError
+        If a column is not named after a metric and a known statistic.
+    ValueError
+        If a metric has no mean, both the std and the sem, or the sem without the count.
+    ValueError
+        If the counts or weights are not positive, or the deviations are negative.
+
+    Returns
+    -------
+    Dataframe indexed by the groups, with the mean and, if available, the
+    std, count and weight sub-columns of each metric.
+    """
+    if groupby is not None:
+        for column_name in groupby:
+            if column_name not in df.columns:
+                raise ValueError(
+                    f"The provided column {column_name} is not available "
+                    "in the set of columns of the dataframe."
+                )
+        index = df[groupby].astype(str)
+        df = df.drop(columns=groupby)
+        df.index = (
+            pd.Index(index[groupby[0]])
+            if len(groupby) == 1
+            else pd.MultiIndex.from_frame(index)
+        )
+
+    if isinstance(df.columns, pd.MultiIndex):
+        if df.columns.nlevels != 2:
+            raise ValueError(
+                "The multi-index columns of a pre-aggregated table must have "
+                f"two levels, the metric and the statistic, not {df.columns.nlevels}."
+            )
+        names: List[Tuple[str, str]] = list(df.columns)
+    else:
+        names = [str(column).rpartition(separator)[::2] for column in df.columns]
+
+    statistics: Dict[str, Dict[str, np.ndarray]] = {}
+    for column, (metric, statistic) in zip(df.columns, names):
+        if not metric or statistic not in AGGREGATED_STATISTICS:
+            raise ValueError(
+                f'The column "{column}" is not named as a metric followed by '
+                f'"{separator}" and one of the statistics '
+                f"{', '.join(AGGREGATED_STATISTICS)}."
+            )
+        statistics.setdefault(metric, {})[statistic] = df[column].to_numpy(dtype=float)
+
+    columns: Dict[Tuple[str, str], np.ndarray] = {}
+    for metric, values in statistics.items():
+        if "mean" not in values:
+            raise ValueError(f"The mean of the metric {metric} is required.")
+        if "std" in values and "sem" in values:
+            raise ValueError(
+                f"Either the std or the sem of the metric {metric} can be given, "
+                "not both."
+            )
+        if "sem" in values and "count" not in values:
+            raise ValueError(
+                f"The count of the metric {metric} is required to convert its "
+                "sem to the std."
+            )
+        for statistic in ("count", "weight"):
+            if statistic in values and not (values[statistic] > 0).all():
+                raise ValueError(
+                    f"The {statistic} of the metric {metric} must be positive."
+                )
+        for statistic in ("std", "sem"):
+            if statistic in values and (values[statistic] < 0).any():
+                raise ValueError(
+                    f"The {statistic} of the metric {metric} must not be negative."
+                )
+
+        columns[(metric, "mean")] = values["mean"]
+        if "sem" in values:
+            columns[(metric, "std")] = values["sem"] * np.sqrt(values["count"])
+        elif "std" in values:
+            columns[(metric, "std")] = values["std"]
+        for statistic in ("count", "weight"):
+            if statistic in values:
+                columns[(metric, statistic)] = values[statistic]
+
+    return pd.DataFrame(columns, index=df.index).sort_index()
@@ -1,13 +1,15 @@
 """Utility dispatch function to plot bar with given properties."""
 
+from typing import Tuple, Union
 from matplotlib.axis import Axis
+from barplots.utils.get_error_extents import get_error_extents
 
 
 def plot_bar(
     axes: Axis,
     x: float,
     y: float,
-    std: float,
+    std: Union[float, Tuple[float, float]],
     min_std: float,
     bar_width: float,
     vertical: bool,
@@ -23,8 +25,9 @@ def plot_bar(
         Position for the left size of the bar.
     y: float,
         Height of the considered bar.
-    std: float,
-        Standard deviation to plot on top.
+    std: Union[float, Tuple[float, float]],
+        Standard deviation to plot on top, or the extents of an
+        asymmetric error bar below and above the bar.
     min_std: float,
         Minimum standard deviation to be shown.
     bar_width: float,
@@ -32,12 +35,15 @@ def plot_bar(
     vertical: bool,
         Whetever to build the axis to show the bars as vertical or as horizontal.
     """
+    below, above = get_error_extents(std)
+    error = [[below], [above]]
+    show_error = max(below, above) > min_std
     if vertical:
         axes.bar(
             x=x,
             height=y,
             width=bar_width,
-            **({"yerr": std} if std > min_std else {}),
+            **({"yerr": error} if show_error else {}),
             capsize=7 * bar_width / 0.3,
             **kwargs
         )
@@ -46,7 +52,7 @@ def plot_bar(
             y=x,
             width=y,
             height=bar_width,
-            **({"xerr": std} if std > min_std else {}),
+            **({"xerr": error} if show_error else {}),
             capsize=7 * bar_width / 0.3,
             **kwargs
         )
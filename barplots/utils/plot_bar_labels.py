@@ -1,62 +1,18 @@
 """Submodule handling the plotting of the bar labels."""
 
-from typing import Dict, List, Union, Optional
+from typing import Dict, List, Tuple, Union, Optional
 
 import pandas as pd
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
-from sanitize_ml_labels import sanitize_ml_labels
 
+from barplots.utils.format_value_axis import format_value_axis
 from barplots.utils.get_max_bar_position import get_max_bar_position
-from barplots.utils.text_positions import text_positions
-
-factors = [
-    ("_", 0),
-    ("y", 1e-24),
-    ("z", 1e-21),
-    ("a", 1e-18),
-    ("f", 1e-15),
-    ("p", 1e-12),
-    ("n", 1e-9),
-    ("µ", 1e-6),
-    ("m", 1e-3),
-    ("K", 1e3),
-    ("M", 1e6),
-    ("G", 1e9),
-    ("T", 1e12),
-    ("P", 1e15),
-    ("E", 1e18),
-    ("Z", 1e21),
-    ("Y", 1e24),
-    ("_", float("inf")),
-]
-
-
-def sanitize_digits(digit: float, unit: Optional[str], normalized: bool):
-    unit = "" if unit is None else unit
-    absolute_digit = abs(digit)
-    if (
-        not normalized
-        and digit != 0.0
-        and (absolute_digit <= 1e-3 or absolute_digit >= 1e3)
-    ):
-        for (lower_factor, lower_value), (higher_factor, higher_value) in zip(
-            factors[:-1],
-            factors[1:],
-        ):
-            if absolute_digit < higher_value:
-                if lower_factor == "_":
-                    denominator = higher_value
-                    factor = higher_factor
-                else:
-                    denominator = lower_value
-                    factor = lower_factor
-                digit /= denominator
-                unit = factor + unit
-                break
-
-    return sanitize_ml_labels(digit) + unit
+from barplots.utils.get_label_layout import (
+    get_label_layout,
+    MINOR_LABEL_SIZE,
+    MAJOR_LABEL_SIZE,
+)
 
 
 def plot_bar_labels(
@@ -77,6 +33,7 @@ def plot_bar_labels(
     normalized_metric: bool,
     absolutely_normalized_metric: bool,
     sanitize_metrics: bool,
+    layout_cache: Optional[Dict[Tuple, Tuple]] = None,
 ):
     """
     Parameters
@@ -105,111 +62,70 @@ def plot_bar_labels(
         Whether to consider the current metric absolutely normalized in a range (-1, 1)
     sanitize_metrics: bool
         Whether to sanitize the metrics or not.
+    layout_cache: Optional[Dict[Tuple, Tuple]] = None
+        Cache of the label layouts, to be shared among the subplots
+        of a figure so that identical index structures are laid out once.
     """
     other_positions = set()
-    width = get_max_bar_position(df, bar_width, space_width)
 
     if unique_data_label:
         axes.set_ylabel("")
 
-    if normalized_metric or absolutely_normalized_metric:
-        nbins = 5 if normalized_metric else 8
-
-        if vertical:
-            axes.locator_params(axis="y", nbins=nbins)
-        else:
-            axes.locator_params(axis="x", nbins=nbins)
-
-    def sanitizer(x, *args, **kwargs):
-        return sanitize_digits(
-            x, unit=unit, normalized=normalized_metric or absolutely_normalized_metric
-        )
-
-    if vertical:
-        axes.yaxis.set_major_formatter(plt.FuncFormatter(sanitizer))
-    else:
-        axes.xaxis.set_major_formatter(plt.FuncFormatter(sanitizer))
+    format_value_axis(
+        axes, vertical, unit, normalized_metric, absolutely_normalized_metric
+    )
 
     for level in reversed(range(max(levels - 2, 0), levels)):
-        positions, labels = zip(*text_positions(df, bar_width, space_width, level))
-        labels = (
-            sanitize_ml_labels(labels, custom_defaults=custom_defaults)
-            if sanitize_metrics
-            else labels
-        )
-
-        max_characters_number_in_labels = max((len(label) for label in labels))
-
-        positions = [round(pos, 5) for pos in positions]
-        positions = [
-            position + width * 0.0002 if position in other_positions else position
-            for position in positions
-        ]
-        other_positions |= set(positions)
         minor = level == levels - 1
 
-        # Handle the automatic rotation of minor labels.
-        if minor_rotation == "auto":
-            if (
-                minor
-                and len(set(labels)) <= width * 5 / max_characters_number_in_labels
-                and vertical
-            ):
-                adapted_minor_rotation = 90
-            elif (
-                minor
-                and len(set(labels)) <= width * 20 / max_characters_number_in_labels
-                and not vertical
-            ):
-                adapted_minor_rotation = 90
-            else:
-                adapted_minor_rotation = 0
-        else:
-            adapted_minor_rotation = minor_rotation
-
-        # Handle the automatic rotation of major labels.
-        if major_rotation == "auto":
-            if (
-                not minor
-                and len(set(labels)) <= width * 5 / max_characters_number_in_labels
-                and not vertical
-            ):
-                adapted_major_rotation = 90
-            elif (
-                not minor
-                and len(set(labels)) >= width * 20 / max_characters_number_in_labels
-                and vertical
-            ):
-                adapted_major_rotation = 90
-            else:
-                adapted_major_rotation = 0
-        else:
-            adapted_major_rotation = major_rotation
-
+        # The labels that are not shown are not laid out at all.
         if minor and unique_minor_labels:
             continue
         if not minor and unique_major_labels:
             continue
 
+        positions, labels, max_label_width, rotation = get_label_layout(
+            df,
+            bar_width,
+            space_width,
+            level,
+            levels,
+            vertical,
+            minor_rotation,
+            major_rotation,
+            custom_defaults,
+            sanitize_metrics,
+            cache=layout_cache,
+        )
+
+        if other_positions:
+            width = get_max_bar_position(df, bar_width, space_width)
+            positions = [
+                position + width * 0.0002 if position in other_positions else position
+                for position in positions
+            ]
+        other_positions |= set(positions)
+        adapted_minor_rotation = adapted_major_rotation = rotation
+
         if vertical:
             axes.set_xticks(positions, minor=minor)
             axes.set_xticklabels(labels, minor=minor, ha="center")
             if minor:
                 axes.tick_params(
                     axis="x",
-                    labelsize=9,
+                    labelsize=MINOR_LABEL_SIZE,
                     which="minor",
                     labelrotation=adapted_minor_rotation,
                 )
 
                 if adapted_minor_rotation > 80:
-                    length = 6 * (max_characters_number_in_labels + 1)
+                    length = max_label_width + 6
                 else:
                     length = 20
 
                 axes.tick_params(
                     axis="x",
-                    labelsize=10,
+                    labelsize=MAJOR_LABEL_SIZE,
                     which="major",
                     direction="out",
                     length=length,
@@ -218,7 +134,7 @@ def plot_bar_labels(
             else:
                 axes.tick_params(
                     axis="x",
-                    labelsize=10,
+                    labelsize=MAJOR_LABEL_SIZE,
                     which="major",
                     labelrotation=adapted_major_rotation,
                 )
@@ -229,19 +145,19 @@ def plot_bar_labels(
                 axes.tick_params(
                     axis="y",
                     which="minor",
-                    labelsize=9,
+                    labelsize=MINOR_LABEL_SIZE,
                     labelrotation=adapted_minor_rotation,
                 )
 
                 if adapted_minor_rotation > 80:
                     length = 20
                 else:
-                    length = 6 * (max_characters_number_in_labels + 1)
+                    length = max_label_width + 6
 
                 axes.tick_params(
                     axis="y",
                     which="major",
-                    labelsize=10,
+                    labelsize=MAJOR_LABEL_SIZE,
                     direction="out",
                     length=length,
                     # This is the size of the actual `tick`
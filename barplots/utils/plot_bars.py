@@ -1,16 +1,17 @@
 """Plot bars for given dataframe at given intervals."""
 
-from typing import Dict, Optional
+from typing import Any, Dict, Optional, Union
 import pandas as pd
 from matplotlib.axes import Axes
 from barplots.utils.plot_bar import plot_bar
 from barplots.utils.bar_positions import bar_positions
-from barplots.utils.get_best_match import get_best_match
+from barplots.utils.compact_table import CompactTable
+from barplots.utils.get_bar_style import get_bar_style
 
 
 def plot_bars(
     axes: Axes,
-    df: pd.DataFrame,
+    df: Union[pd.DataFrame, CompactTable],
     bar_width: float,
     space_width: float,
     alphas: Dict[str, float],
@@ -23,15 +24,15 @@ def plot_bars(
     infer_hatch: bool,
     top_index: str,
     **kwargs: Dict
-):
+) -> Dict[str, Dict[str, Any]]:
     """Plot bars for given dataframe at given intervals.
 
     Parameters
     ----------
     axes:Axes,
         The axes where to plot the bars.
-    df: pd.DataFrame,
-        The dataframe from where to extract the data.
+    df: Union[pd.DataFrame, CompactTable],
+        The dataframe, or its compact table, from where to extract the data.
     bar_width: float,
         The width of the bars, used also for spacing.
     space_width: float,
@@ -52,60 +53,39 @@ def plot_bars(
         Dict of hatch, i.e. patterns for the bars, to be used for innermost index of dataframe.
     infer_hatch: bool,
         Whetever to infer hatch or not.
+    top_index: str,
+        The top index of the subplot, used to infer the styles.
     kwargs: Dict,
         Parameters to be passed directly to the plot_bar method
+
+    Returns
+    -------
+    Dictionary with the style of the bars of each innermost index value,
+    in order of appearance, to be used to build the legend.
     """
+    leaf_styles = {}
     for x, y, std, index in bar_positions(df, bar_width, space_width):
+        style = get_bar_style(
+            index,
+            top_index,
+            alphas,
+            infer_alphas,
+            colors,
+            infer_colors,
+            edgecolors,
+            infer_edgecolors,
+            hatch,
+            infer_hatch,
+        )
+        leaf_styles[index[-1]] = style
         plot_bar(
             axes=axes,
             x=x,
             y=y,
             std=std,
             bar_width=bar_width,
-            alpha=(
-                alphas[index[-1]]
-                if index[-1] in alphas
-                else (
-                    get_best_match(alphas, (top_index, *index))
-                    if infer_alphas
-                    else None
-                )
-            ),
-            color=(
-                colors[index[-1]]
-                if index[-1] in colors
-                else (
-                    get_best_match(colors, (top_index, *index))
-                    if infer_colors
-                    else None
-                )
-            ),
-            edgecolor=(
-                None
-                if edgecolors is None
-                else (
-                    edgecolors[index[-1]]
-                    if index[-1] in edgecolors
-                    else (
-                        get_best_match(edgecolors, (top_index, *index))
-                        if infer_edgecolors
-                        else None
-                    )
-                )
-            ),
-            hatch=(
-                None
-                if hatch is None
-                else (
-                    hatch[index[-1]]
-                    if index[-1] in hatch
-                    else (
-                        get_best_match(hatch, (top_index, *index))
-                        if infer_hatch
-                        else None
-                    )
-                )
-            ),
             label=index[-1],
+            **style,
             **kwargs
         )
+    return leaf_styles
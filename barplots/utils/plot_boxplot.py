@@ -1,15 +1,25 @@
-from matplotlib.axis import Axis
-import numpy as np
+"""Utility function to plot a boxplot from its statistics."""
+
+import inspect
+from typing import Dict, Optional
+from matplotlib.axes import Axes
+
+# Whether the installed matplotlib sets the orientation of the boxplots
+# with the orientation argument, which replaced the vert one.
+HAS_ORIENTATION = "orientation" in inspect.signature(Axes.bxp).parameters
 
 
 def plot_boxplot(
-    axes: Axis,
-    data: np.ndarray,
+    axes: Axes,
+    statistics: Dict[str, float],
     x: float,
-    y: float,
     boxplot_width: float,
     vertical: bool,
-    **kwargs
+    alpha: Optional[float] = None,
+    color: Optional[str] = None,
+    edgecolor: Optional[str] = None,
+    hatch: Optional[str] = None,
+    label: Optional[str] = None,
 ):
     """Plot boxplot with given properties.
 
@@ -17,41 +27,50 @@ def plot_boxplot(
     ----------
     axes: Axes,
         Axes object where to plot the boxplot.
+    statistics: Dict[str, float],
+        The mean, whiskers "whislo" and "whishi", quartiles "q1" and "q3"
+        and median "med" of the boxplot. The mean is optional.
     x: float,
-        Position for the left size of the boxplot.
-    y: float,
-        Height of the considered boxplot.
+        Position of the center of the boxplot.
     boxplot_width: float,
         Width of the boxplot.
     vertical: bool,
         Whetever to build the axis to show the boxplots as vertical or as horizontal.
+    alpha: Optional[float] = None,
+        Alpha of the box.
+    color: Optional[str] = None,
+        Color of the box.
+    edgecolor: Optional[str] = None,
+        Color of the edge of the box.
+    hatch: Optional[str] = None,
+        Hatch of the box.
+    label: Optional[str] = None,
+        Label of the boxplot.
     """
-    assert isinstance(x, float)
-    assert isinstance(y, float)
-    assert isinstance(data, np.ndarray)
-    assert np.isfinite(data).all()
-    assert isinstance(boxplot_width, float)
-    assert isinstance(vertical, bool)
-
-    if vertical:
-        axes.boxplot(
-            x=data,
-            notch=True,
-            positions=[x],
-            widths=boxplot_width,
-            capsize=7 * boxplot_width / 0.3,
-            **kwargs
-        )
-    else:
-        raise NotImplementedError("POI FAREMO")
-        # axes.boxplot(
-        #     y=x,
-        #     notch=True,
-        #     vert=False,
-        #     positions=[x],
-        #     widths=y,
-        #     height=boxplot_width,
-        #     **({"xerr": std} if std > min_std else {}),
-        #     capsize=7 * boxplot_width / 0.3,
-        #     **kwargs
-        # )
+    axes.bxp(
+        [{**statistics, "fliers": [], "label": label}],
+        positions=[x],
+        widths=boxplot_width,
+        **(
+            {"orientation": "vertical" if vertical else "horizontal"}
+            if HAS_ORIENTATION
+            else {"vert": vertical}
+        ),
+        patch_artist=True,
+        showmeans="mean" in statistics,
+        showfliers=False,
+        manage_ticks=False,
+        boxprops={
+            "facecolor": color,
+            "alpha": alpha,
+            "hatch": hatch,
+            "edgecolor": "k" if edgecolor is None else edgecolor,
+        },
+        medianprops={"color": "k"},
+        meanprops={
+            "marker": "D",
+            "markerfacecolor": "white",
+            "markeredgecolor": "k",
+            "markersize": 4,
+        },
+    )
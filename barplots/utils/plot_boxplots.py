@@ -1,69 +1,96 @@
+"""Plot boxplots for given dataframe at given intervals."""
+
+from typing import Any, Dict, Optional, Union
 import pandas as pd
-from typing import Dict, Optional
 from matplotlib.axes import Axes
-from .plot_boxplot import plot_boxplot
-from .bar_positions import bar_positions
-from .get_best_match import get_best_match
+from barplots.utils.plot_boxplot import plot_boxplot
+from barplots.utils.bar_positions import bar_positions
+from barplots.utils.compact_table import CompactTable, as_compact_table
+from barplots.utils.get_bar_style import get_bar_style
 
 
 def plot_boxplots(
     axes: Axes,
-    df: pd.DataFrame,
+    df: Union[pd.DataFrame, CompactTable],
     bar_width: float,
     space_width: float,
     alphas: Dict[str, float],
+    infer_alphas: bool,
     colors: Dict[str, str],
+    infer_colors: bool,
+    edgecolors: Optional[Dict[str, str]],
+    infer_edgecolors: bool,
     hatch: Optional[Dict[str, str]],
+    infer_hatch: bool,
     top_index: str,
-    **kwargs: Dict
-):
-    """Plot bars for given dataframe at given intervals.
+    vertical: bool,
+) -> Dict[str, Dict[str, Any]]:
+    """Plot boxplots for given dataframe at given intervals.
+
+    The boxplots are placed and styled as the bars plotted by plot_bars.
 
     Parameters
     ----------
     axes:Axes,
-        The axes where to plot the bars.
-    df: pd.DataFrame,
-        The dataframe from where to extract the data.
+        The axes where to plot the boxplots.
+    df: Union[pd.DataFrame, CompactTable],
+        The dataframe, or its compact table, from where to extract the data, with the "whislo",
+        "q1", "med", "q3", "whishi" and optionally "mean" sub-columns.
     bar_width: float,
-        The width of the bars, used also for spacing.
+        The width of the boxplots, used also for spacing.
     space_width: float,
         Width of spaces between spaces.
-    alphas:Dict[str, float],
+    alphas: Dict[str, float],
         Dictionary of alphas to be used.
-    colors:Dict[str, str],
+    infer_alphas: bool,
+        Whetever to infer alphas or not.
+    colors: Dict[str, str],
         Dictionary of colors to be used.
+    infer_colors: bool,
+        Whetever to infer colors or not.
+    edgecolors: Optional[Dict[str, str]],
+        Dictionary of edgecolors to be used.
+    infer_edgecolors: bool,
+        Whetever to infer edgecolors or not.
     hatch: Optional[Dict[str, str]]
-        Dict of hatch, i.e. patterns for the bars, to be used for innermost index of dataframe.
-    kwargs:Dict,
-        Parameters to be passed directly to the plot_boxplot method
+        Dict of hatch, i.e. patterns for the boxplots, to be used for innermost index of dataframe.
+    infer_hatch: bool,
+        Whetever to infer hatch or not.
+    top_index: str,
+        The top index of the subplot, used to infer the styles.
+    vertical: bool,
+        Whetever the boxplots are vertical or horizontal.
+
+    Returns
+    -------
+    Dictionary with the style of the boxplots of each innermost index value,
+    in order of appearance, to be used to build the legend.
     """
-    for x, y, std, index in bar_positions(df, bar_width, space_width):
+    table = as_compact_table(df)
+    leaf_styles = {}
+    for values, (x, _, _, index) in zip(
+        table.values.tolist(), bar_positions(table, bar_width, space_width)
+    ):
+        style = get_bar_style(
+            index,
+            top_index,
+            alphas,
+            infer_alphas,
+            colors,
+            infer_colors,
+            edgecolors,
+            infer_edgecolors,
+            hatch,
+            infer_hatch,
+        )
+        leaf_styles[index[-1]] = style
         plot_boxplot(
             axes=axes,
+            statistics=dict(zip(table.statistics, values)),
             x=x,
-            y=y,
-            std=std,
-            bar_width=bar_width,
-            alpha=(
-                alphas[index[-1]]
-                if index[-1] in alphas
-                else get_best_match(alphas, (top_index, *index))
-            ),
-            color=(
-                colors[index[-1]]
-                if index[-1] in colors
-                else get_best_match(colors, (top_index, *index))
-            ),
-            hatch=(
-                None
-                if hatch is None
-                else (
-                    hatch[index[-1]]
-                    if index[-1] in hatch
-                    else get_best_match(hatch, (top_index, *index))
-                )
-            ),
+            boxplot_width=bar_width,
+            vertical=vertical,
             label=index[-1],
-            **kwargs
+            **style,
         )
+    return leaf_styles
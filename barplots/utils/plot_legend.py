@@ -0,0 +1,117 @@
+"""Plot the legend of the bars from the table of their styles."""
+
+from typing import Any, Dict, List, Optional, Union
+import math
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+from matplotlib.legend import Legend
+from matplotlib.patches import Patch
+from barplots.utils.text_metrics import get_text_width, get_text_widths
+from barplots.utils.sanitize_labels import sanitize_labels as sanitize_legend_labels
+
+
+def plot_legend(
+    target: Union[Axes, Figure],
+    leaf_styles: Dict[str, Dict[str, Any]],
+    legend_position: str,
+    legend_title: str,
+    legend_entries_size: float,
+    legend_title_size: float,
+    show_legend_title: bool,
+    sanitize_labels: bool,
+    custom_defaults: Dict[str, List[str]],
+    ncol: Optional[int] = None,
+    **kwargs: Dict
+) -> Legend:
+    """Plot a legend entry for each of the given styles.
+
+    Parameters
+    ----------
+    target: Union[Axes, Figure]
+        Axes or figure where to show the legend.
+    leaf_styles: Dict[str, Dict[str, Any]]
+        Dictionary with the alpha, color, edgecolor and hatch of the bars
+        of each legend entry, as returned by plot_bars.
+    legend_position: str
+        Legend position.
+    legend_title: str
+        Title for the legend.
+    legend_entries_size: float
+        Size for the legend entries font.
+    legend_title_size: float
+        Size for the legend title font.
+    show_legend_title: bool
+        Whether to show the legend title.
+    sanitize_labels: bool
+        Whether to sanitize the labels or not.
+    custom_defaults: Dict[str, List[str]]
+        The defaults for normalizing the provided keys.
+    ncol: Optional[int] = None
+        The number of columns to show in the legend.
+        By default, in the legend of an axes the columns are enough to
+        match the width of the title, while in the legend of a figure
+        the columns are as many as fit in the width of the figure.
+    kwargs: Dict
+        Parameters to be passed directly to the legend method.
+
+    Returns
+    -------
+    The created legend.
+    """
+    entries = (
+        sanitize_legend_labels(leaf_styles.keys(), custom_defaults=custom_defaults)
+        if sanitize_labels
+        else list(leaf_styles.keys())
+    )
+    title = (
+        sanitize_legend_labels(legend_title, custom_defaults=custom_defaults)
+        if sanitize_labels
+        else legend_title
+    )
+
+    # The entries of a figure legend are laid out on a row,
+    # and are therefore spaced further apart.
+    columnspacing = 1.0 if isinstance(target, Figure) else 0.1
+
+    if ncol is None:
+        # Each entry is padded by its handle and the spacing around it.
+        padding = (0.7 + 0.1 + columnspacing) * legend_entries_size
+        mean_entry_width = (
+            sum(get_text_widths(entries, legend_entries_size)) / len(entries) + padding
+        )
+        if isinstance(target, Figure):
+            figure_width = target.get_figwidth() * 72
+            ncol = min(
+                max(math.floor(figure_width / mean_entry_width), 1), len(entries)
+            )
+        else:
+            title_width = get_text_width(str(title), legend_title_size, weight="bold")
+            ncol = max(math.ceil(title_width / mean_entry_width), 1)
+
+    legend = target.legend(
+        handles=[
+            Patch(
+                linestyle="none",
+                label=label,
+                linewidth=legend_entries_size,
+                facecolor=style["color"],
+                alpha=style["alpha"],
+                edgecolor=style["edgecolor"],
+                hatch=style["hatch"],
+            )
+            for label, style in zip(entries, leaf_styles.values())
+        ],
+        ncol=ncol,
+        handletextpad=0.1,
+        columnspacing=columnspacing,
+        handlelength=0.7,
+        prop={"size": legend_entries_size},
+        loc=legend_position,
+        **kwargs
+    )
+    if show_legend_title:
+        legend.set_title(
+            title,
+            prop={"weight": "bold", "size": legend_title_size},
+        )
+    return legend
@@ -0,0 +1,104 @@
+"""Pool the statistics of several pre-aggregated tables."""
+
+from typing import Dict, List, Optional, Tuple
+import pandas as pd
+from barplots.utils.normalize_aggregated_table import normalize_aggregated_table
+from barplots.utils.pool_statistics import pool_statistics
+
+
+def pool_aggregated_tables(
+    tables: List[pd.DataFrame],
+    groupby: Optional[List[str]] = None,
+    separator: str = "_",
+) -> pd.DataFrame:
+    """Return the pooled statistics of the given pre-aggregated tables.
+
+    The tables are validated and normalized as by normalize_aggregated_table,
+    and the statistics of the groups appearing in more than one table are
+    pooled: the means are weighted by the weights of the rows or, if not
+    available, by their counts, and the standard deviations are the ones
+    of the union of the samples, combining the within-row variances with
+    the spread of the row means, which requires the counts.
+
+    Parameters
+    ----------
+    tables: List[pd.DataFrame]
+        The pre-aggregated tables.
+    groupby: Optional[List[str]] = None
+        Columns identifying the groups. By default, the groups are the index.
+    separator: str = "_"
+        Separator of the metric and the statistic in the flat column names.
+
+    Raises
+    ------
+    ValueError
+        If no table is given, or a table is not valid.
+    ValueError
+        If a group to be pooled has no counts or weights, or has a standard
+        deviation but no counts, or the standard deviation of a metric is
+        available only in some of the tables.
+
+    Returns
+    -------
+    Dataframe indexed by the groups, with the pooled statistics of each metric.
+    """
+    if len(tables) == 0:
+        raise ValueError("At least a pre-aggregated table is required.")
+
+    normalized = [
+        normalize_aggregated_table(table, groupby=groupby, separator=separator)
+        for table in tables
+    ]
+
+    if len(normalized) == 1:
+        return normalized[0]
+
+    df = pd.concat(normalized)
+
+    if not df.index.has_duplicates:
+        return df.sort_index()
+
+    levels = list(range(df.index.nlevels))
+    columns: Dict[Tuple[str, str], pd.Series] = {}
+    for metric in dict.fromkeys(column[0] for column in df.columns):
+        stats = df[metric]
+        given = [
+            statistic
+            for statistic in ("count", "weight")
+            if statistic in stats.columns and not stats[statistic].isna().any()
+        ]
+        if not given:
+            raise ValueError(
+                f"The counts or weights of the metric {metric} are required "
+                "in every table to pool the statistics of its groups."
+            )
+        if "std" in stats.columns and any(
+            (metric, "std") not in table.columns for table in normalized
+        ):
+            raise ValueError(
+                f"The std of the metric {metric} must be given either in every "
+                "table or in none of them."
+            )
+        if "std" in stats.columns and "count" not in given:
+            raise ValueError(
+                f"The counts of the metric {metric} are required in every "
+                "table to pool its standard deviations."
+            )
+        # Without the counts, the means are pooled by the weights only.
+        pooled = pool_statistics(
+            stats[["mean"] + (["std"] if "std" in stats.columns else [])].assign(
+                count=stats[given[0]],
+                **({"weight": stats["weight"]} if "weight" in given else {}),
+            ),
+            by=levels,
+        )
+        columns[(metric, "mean")] = pooled["mean"]
+        if "std" in pooled.columns:
+            columns[(metric, "std")] = pooled["std"]
+        for statistic in ("count", "weight"):
+            if statistic in stats.columns:
+                columns[(metric, statistic)] = (
+                    stats[statistic].groupby(level=levels, sort=False).sum(min_count=1)
+                )
+
+    return pd.DataFrame(columns).sort_index()
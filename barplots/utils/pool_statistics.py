@@ -0,0 +1,69 @@
+"""Function to pool the summary statistics of groups of samples."""
+
+from typing import List, Union
+import numpy as np
+import pandas as pd
+
+
+def pool_statistics(df: pd.DataFrame, by: Union[List[int], np.ndarray]) -> pd.DataFrame:
+    """Return the pooled count, mean and, if available, standard deviation.
+
+    The pooled means are weighted by the counts of the rows or, if
+    available, by their weights. The pooled standard deviation is the
+    sample standard deviation (ddof=1) of the union of the samples
+    described by the pooled rows, obtained by combining the within-row
+    variances with the spread of the row means, and it therefore depends
+    only on the counts, and not on the weights.
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        Dataframe with the "count" and "mean" columns and optionally
+        the "std" and "weight" columns.
+    by: Union[List[int], np.ndarray]
+        Either the index levels or the array of keys to pool the rows by.
+
+    Raises
+    ------
+    ValueError
+        If the "count" or "mean" columns are missing.
+
+    Returns
+    -------
+    Dataframe with the pooled "count", "mean" and optionally "std" columns.
+    """
+    for column in ("count", "mean"):
+        if column not in df.columns:
+            raise ValueError(
+                f"The column {column} is required to pool the statistics, "
+                f"but only the columns {list(df.columns)} were provided."
+            )
+
+    counts = df["count"].astype(float)
+    pooling_level = by if isinstance(by, list) else None
+    pooling_keys = None if isinstance(by, list) else by
+
+    def pooled_sum(values: pd.Series) -> pd.Series:
+        return values.groupby(
+            level=pooling_level, by=pooling_keys, sort=False
+        ).transform("sum")
+
+    total_counts = pooled_sum(counts)
+    pooled_means = pooled_sum(counts * df["mean"]) / total_counts
+
+    pooled = pd.DataFrame({"count": total_counts, "mean": pooled_means})
+
+    if "weight" in df.columns:
+        weights = df["weight"].astype(float)
+        pooled["mean"] = pooled_sum(weights * df["mean"]) / pooled_sum(weights)
+
+    if "std" in df.columns:
+        # Rows with a single sample have an undefined standard deviation,
+        # but contribute no within-row variance to the pooled one.
+        within = (counts - 1) * df["std"].fillna(0.0) ** 2
+        between = counts * (df["mean"] - pooled_means) ** 2
+        pooled["std"] = np.sqrt(pooled_sum(within + between) / (total_counts - 1))
+
+    pooled = pooled.groupby(level=pooling_level, by=pooling_keys, sort=False).first()
+
+    return pooled
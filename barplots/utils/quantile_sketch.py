@@ -0,0 +1,215 @@
+"""Mergeable sketch of the quantiles of a stream of samples."""
+
+from typing import Dict, Optional, Sequence, Tuple
+import numpy as np
+
+# Number of samples whose buckets are computed and counted at once.
+SKETCH_CHUNK_SIZE = 1 << 16
+
+
+class QuantileSketch:
+    """Mergeable sketch estimating the quantiles with a bounded relative error.
+
+    The samples are counted in buckets whose bounds grow geometrically,
+    so that any quantile is estimated within the given relative accuracy
+    while the memory depends only on the range of the samples, and not on
+    their number. The sketches of disjoint sets of samples are merged by
+    summing the counts of their buckets. The count, mean, minimum and
+    maximum of the samples are tracked exactly.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        """Create a new empty sketch.
+
+        Parameters
+        ----------
+        relative_accuracy: float = 0.01
+            Maximum relative error of the estimated quantiles.
+
+        Raises
+        ------
+        ValueError
+            If the relative accuracy is not strictly between zero and one.
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(
+                "The relative accuracy must be strictly between zero and one, "
+                f"not {relative_accuracy}."
+            )
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = np.log(self._gamma)
+        self._buckets: Dict[Tuple[int, int], int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.minimum = np.inf
+        self.maximum = -np.inf
+
+    def get_buckets(self, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the signs and the keys of the buckets of the given samples.
+
+        Parameters
+        ----------
+        values: np.ndarray
+            The samples, which must be finite.
+        """
+        signs = np.sign(values).astype(np.int64)
+        keys = np.zeros(len(values), dtype=np.int64)
+        nonzero = signs != 0
+        keys[nonzero] = np.ceil(
+            np.log(np.abs(values[nonzero])) / self._log_gamma
+        ).astype(np.int64)
+        return signs, keys
+
+    def add_counts(
+        self,
+        signs: np.ndarray,
+        keys: np.ndarray,
+        counts: np.ndarray,
+        total: float,
+        minimum: float,
+        maximum: float,
+    ):
+        """Add the given bucket counts and summary of samples to the sketch.
+
+        Parameters
+        ----------
+        signs: np.ndarray
+            The signs of the buckets.
+        keys: np.ndarray
+            The keys of the buckets.
+        counts: np.ndarray
+            The number of samples in each bucket.
+        total: float
+            The sum of the samples.
+        minimum: float
+            The minimum of the samples.
+        maximum: float
+            The maximum of the samples.
+        """
+        for sign, key, count in zip(signs.tolist(), keys.tolist(), counts.tolist()):
+            self._buckets[(sign, key)] = self._buckets.get((sign, key), 0) + count
+        self.count += int(counts.sum())
+        self.total += total
+        self.minimum = min(self.minimum, minimum)
+        self.maximum = max(self.maximum, maximum)
+
+    def update(self, values: Sequence[float]) -> "QuantileSketch":
+        """Add the given samples to the sketch, and return the sketch.
+
+        Parameters
+        ----------
+        values: Sequence[float]
+            The samples to add.
+
+        Raises
+        ------
+        ValueError
+            If some samples are not finite.
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        if not np.isfinite(values).all():
+            raise ValueError("The samples of a quantile sketch must be finite.")
+        for start in range(0, len(values), SKETCH_CHUNK_SIZE):
+            chunk = values[start : start + SKETCH_CHUNK_SIZE]
+            signs, keys = self.get_buckets(chunk)
+            buckets, counts = np.unique(
+                np.stack((signs, keys)), axis=1, return_counts=True
+            )
+            self.add_counts(
+                buckets[0], buckets[1], counts, chunk.sum(), chunk.min(), chunk.max()
+            )
+        return self
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Add the samples of the given sketch to this one, and return this sketch.
+
+        Parameters
+        ----------
+        other: QuantileSketch
+            The sketch to merge, with the same relative accuracy.
+
+        Raises
+        ------
+        ValueError
+            If the relative accuracies of the sketches differ.
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError(
+                "Only the sketches with the same relative accuracy can be merged."
+            )
+        for bucket, count in other._buckets.items():
+            self._buckets[bucket] = self._buckets.get(bucket, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        return self
+
+    @property
+    def mean(self) -> float:
+        """Return the mean of the samples."""
+        return self.total / self.count if self.count else np.nan
+
+    def quantiles(self, quantiles: Sequence[float]) -> np.ndarray:
+        """Return the estimates of the given quantiles of the samples.
+
+        Parameters
+        ----------
+        quantiles: Sequence[float]
+            The quantiles to estimate, between zero and one.
+
+        Raises
+        ------
+        ValueError
+            If the sketch is empty, or a quantile is not between zero and one.
+        """
+        quantiles = np.asarray(quantiles, dtype=float)
+        if self.count == 0:
+            raise ValueError("The quantiles of an empty sketch are not defined.")
+        if ((quantiles < 0) | (quantiles > 1)).any():
+            raise ValueError("The quantiles must be between zero and one.")
+
+        buckets = np.array(list(self._buckets.keys()), dtype=np.int64)
+        counts = np.array(list(self._buckets.values()), dtype=np.int64)
+        signs, keys = buckets[:, 0], buckets[:, 1]
+        # Every bucket is represented by the value with the least relative
+        # error with respect to both its bounds.
+        values = signs * 2 * self._gamma ** keys.astype(float) / (self._gamma + 1)
+        order = np.argsort(values, kind="stable")
+        values, counts = values[order], counts[order]
+
+        ranks = quantiles * (self.count - 1)
+        positions = np.searchsorted(np.cumsum(counts), ranks, side="right")
+        estimates = values[np.minimum(positions, len(values) - 1)]
+        return np.clip(estimates, self.minimum, self.maximum)
+
+    def boxplot_statistics(self, whisker: Optional[float] = 1.5) -> Dict[str, float]:
+        """Return the statistics of a boxplot of the samples.
+
+        The whiskers are drawn at the given multiple of the interquartile
+        range from the estimated quartiles, clipped to the minimum and
+        maximum samples. They approximate the furthest samples within that
+        range, but they need not be samples themselves.
+
+        Parameters
+        ----------
+        whisker: Optional[float] = 1.5
+            Multiple of the interquartile range at which the whiskers are drawn.
+            If None, the whiskers reach the minimum and maximum samples.
+        """
+        first_quartile, median, third_quartile = self.quantiles((0.25, 0.5, 0.75))
+        if whisker is None:
+            low, high = self.minimum, self.maximum
+        else:
+            spread = whisker * (third_quartile - first_quartile)
+            low = max(first_quartile - spread, self.minimum)
+            high = min(third_quartile + spread, self.maximum)
+        return {
+            "mean": self.mean,
+            "whislo": low,
+            "q1": first_quartile,
+            "med": median,
+            "q3": third_quartile,
+            "whishi": high,
+        }
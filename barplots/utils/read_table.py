@@ -0,0 +1,45 @@
+"""Read a table from a CSV, TSV, Parquet or Feather file."""
+
+from typing import List, Optional
+import pandas as pd
+
+# Extensions of the supported formats.
+TABLE_EXTENSIONS = (".csv", ".tsv", ".parquet", ".feather")
+
+
+def read_table(path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Return the table stored in the given file, loading only the given columns.
+
+    Parameters
+    ----------
+    path: str
+        Path of the file, whose format is inferred from its extension.
+    columns: Optional[List[str]] = None
+        The columns to be loaded. By default, all the columns are loaded.
+
+    Raises
+    ------
+    ValueError
+        If the format of the file is not supported.
+
+    Returns
+    -------
+    The loaded dataframe.
+    """
+    extension = path.lower()[path.rfind(".") :]
+
+    if extension not in TABLE_EXTENSIONS:
+        raise ValueError(
+            f'The format of the file "{path}" is not supported, '
+            f"the supported extensions are {', '.join(TABLE_EXTENSIONS)}."
+        )
+
+    if extension in (".csv", ".tsv"):
+        return pd.read_csv(
+            path,
+            usecols=columns,
+            sep="," if extension == ".csv" else "\t",
+        )
+    if extension == ".parquet":
+        return pd.read_parquet(path, columns=columns)
+    return pd.read_feather(path, columns=columns)
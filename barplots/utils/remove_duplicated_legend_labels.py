@@ -1,10 +1,8 @@
 """Remove duplicated labels from the plot legend."""
 
 from typing import Dict, List, Optional
-import math
 from matplotlib.axes import Axes
-from matplotlib.patches import Patch
-from sanitize_ml_labels import sanitize_ml_labels
+from barplots.utils.plot_legend import plot_legend
 
 
 def remove_duplicated_legend_labels(
@@ -20,6 +18,10 @@ def remove_duplicated_legend_labels(
 ):
     """Remove duplicated labels from the plot legend.
 
+    The styles of the legend entries are read from the bars drawn on the
+    axes. When the styles of the bars are known, as in barplot, use the
+    plot_legend function instead, which does not scan the axes artists.
+
     Parameters
     ----------
     axes: Axes
@@ -44,45 +46,24 @@ def remove_duplicated_legend_labels(
     handles, labels = axes.get_legend_handles_labels()
 
     by_label = dict(zip(labels, handles))
-    length__of_padding = 6
-    mean_label_length = (
-        sum(len(label) for label in by_label.keys()) / len(by_label)
-        + length__of_padding
-    )
-
-    ncol = math.ceil(len(legend_title) / mean_label_length) if ncol is None else ncol
 
-    legend = axes.legend(
-        handles=[
-            Patch(
-                linestyle="none",
-                label=label,
-                linewidth=legend_entries_size,
-                facecolor=handler.patches[0].get_facecolor(),
-                hatch=handler.patches[0].get_hatch(),
-            )
-            for handler, label in zip(
-                by_label.values(),
-                (
-                    sanitize_ml_labels(by_label.keys(), custom_defaults=custom_defaults)
-                    if sanitize_labels
-                    else by_label.keys()
-                ),
-            )
-        ],
-        ncol=ncol,
-        handletextpad=0.1,
-        columnspacing=0.1,
-        handlelength=0.7,
-        prop={"size": legend_entries_size},
-        loc=legend_position,
+    plot_legend(
+        axes,
+        {
+            label: {
+                "alpha": None,
+                "color": handler.patches[0].get_facecolor(),
+                "edgecolor": None,
+                "hatch": handler.patches[0].get_hatch(),
+            }
+            for label, handler in by_label.items()
+        },
+        legend_position,
+        legend_title,
+        legend_entries_size,
+        legend_title_size,
+        show_legend_title,
+        sanitize_labels,
+        custom_defaults,
+        ncol,
     )
-    if show_legend_title:
-        legend.set_title(
-            (
-                sanitize_ml_labels(legend_title, custom_defaults=custom_defaults)
-                if sanitize_labels
-                else legend_title
-            ),
-            prop={"weight": "bold", "size": legend_title_size},
-        )
@@ -0,0 +1,175 @@
+"""Managed executor running the renderings requested from asyncio code."""
+
+import asyncio
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+from weakref import WeakKeyDictionary
+import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+
+# Executor running the renderings, created when first needed.
+RENDER_EXECUTOR: Optional[ThreadPoolExecutor] = None
+# Number of threads of the executor. As pyplot is not thread safe and the
+# rendering holds the GIL, by default the renderings are run one at a time.
+MAX_RENDER_WORKERS = 1
+# Maximum number of renderings running or waiting for the executor,
+# beyond which the following requests wait before being submitted.
+MAX_IN_FLIGHT_RENDERS = 8
+# Semaphores limiting the renderings in flight, one for each event loop,
+# which are dropped together with their event loops.
+IN_FLIGHT_SEMAPHORES: (
+    "WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]"
+) = WeakKeyDictionary()
+LOCK = threading.Lock()
+
+
+def configure_render_executor(
+    max_workers: int = 1,
+    max_in_flight: int = 8,
+):
+    """Configure the executor running the asynchronous renderings.
+
+    The previous executor is shut down once its renderings are completed.
+
+    Parameters
+    ----------
+    max_workers: int = 1
+        Number of threads running the renderings. As pyplot is not thread
+        safe, more than one thread should be used only when the figures
+        are not managed by pyplot elsewhere in the process.
+    max_in_flight: int = 8
+        Maximum number of renderings running or waiting for the executor
+        in each event loop, beyond which the following ones wait before
+        being submitted.
+
+    Raises
+    ------
+    ValueError
+        If the number of workers or of renderings in flight is not positive.
+    """
+    global RENDER_EXECUTOR, MAX_RENDER_WORKERS, MAX_IN_FLIGHT_RENDERS
+
+    if max_workers < 1:
+        raise ValueError(
+            f"The number of workers must be positive, but {max_workers} was given."
+        )
+
+    if max_in_flight < 1:
+        raise ValueError(
+            "The number of renderings in flight must be positive, "
+            f"but {max_in_flight} was given."
+        )
+
+    with LOCK:
+        if RENDER_EXECUTOR is not None:
+            RENDER_EXECUTOR.shutdown(wait=False)
+        RENDER_EXECUTOR = None
+        MAX_RENDER_WORKERS = max_workers
+        MAX_IN_FLIGHT_RENDERS = max_in_flight
+        IN_FLIGHT_SEMAPHORES.clear()
+
+
+def get_render_executor() -> ThreadPoolExecutor:
+    """Return the executor running the renderings, creating it if needed."""
+    global RENDER_EXECUTOR
+    with LOCK:
+        if RENDER_EXECUTOR is None:
+            RENDER_EXECUTOR = ThreadPoolExecutor(
+                max_workers=MAX_RENDER_WORKERS, thread_name_prefix="barplots"
+            )
+        return RENDER_EXECUTOR
+
+
+def get_in_flight_semaphore() -> asyncio.Semaphore:
+    """Return the semaphore limiting the renderings of the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = IN_FLIGHT_SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = IN_FLIGHT_SEMAPHORES[loop] = asyncio.Semaphore(
+            MAX_IN_FLIGHT_RENDERS
+        )
+    return semaphore
+
+
+def get_cancellable_checkpoint(
+    cancelled: threading.Event,
+    checkpoint: Optional[Callable[[str], None]] = None,
+) -> Callable[[str], None]:
+    """Return checkpoint stopping the rendering once the given event is set.
+
+    Parameters
+    ----------
+    cancelled: threading.Event
+        Event set when the rendering is no longer needed.
+    checkpoint: Optional[Callable[[str], None]] = None
+        Checkpoint provided by the user, to be called afterwards.
+    """
+
+    def cancellable_checkpoint(stage: str):
+        if cancelled.is_set():
+            raise CancelledError(f"The rendering was cancelled before {stage}.")
+        if checkpoint is not None:
+            checkpoint(stage)
+
+    return cancellable_checkpoint
+
+
+def get_closing_checkpoint(
+    checkpoint: Callable[[str], None], figure: Figure
+) -> Callable[[str], None]:
+    """Return checkpoint closing the given figure when it stops the rendering.
+
+    Parameters
+    ----------
+    checkpoint: Callable[[str], None]
+        Checkpoint which may raise an exception to stop the rendering.
+    figure: Figure
+        Figure of the rendering, which would otherwise be left open in pyplot.
+    """
+
+    def closing_checkpoint(stage: str):
+        try:
+            checkpoint(stage)
+        except BaseException:
+            plt.close(figure)
+            raise
+
+    return closing_checkpoint
+
+
+async def run_in_render_executor(function: Callable, **kwargs: Any) -> Any:
+    """Run the given rendering function in the executor and return its result.
+
+    The renderings of the running event loop in flight are limited by
+    its semaphore. When the awaiting task is cancelled, the rendering
+    stops at its following checkpoint, and its place is released only
+    once it has stopped.
+
+    Parameters
+    ----------
+    function: Callable
+        Rendering function accepting a checkpoint, such as barplot.
+    kwargs: Any
+        Parameters to be passed to the function.
+    """
+    async with get_in_flight_semaphore():
+        cancelled = threading.Event()
+        future = get_render_executor().submit(
+            function,
+            **{
+                **kwargs,
+                "checkpoint": get_cancellable_checkpoint(
+                    cancelled, kwargs.get("checkpoint")
+                ),
+            },
+        )
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            cancelled.set()
+            # The rendering waiting for the executor is dropped, while the
+            # running one is awaited until it reaches its next checkpoint.
+            if not future.cancel():
+                await asyncio.wait([asyncio.wrap_future(future)])
+            raise
@@ -0,0 +1,134 @@
+"""Running aggregates of the metrics of groups of rows, updated incrementally."""
+
+from typing import Dict, List, Set
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+from barplots.utils.pool_statistics import pool_statistics
+
+
+class RunningAggregates:
+    """Count, mean and standard deviation of the metrics of each group of rows.
+
+    The statistics of the new rows are pooled with the current ones, so that
+    the rows are aggregated only once. The pooled statistics match the ones
+    of the aggregation of all the rows, up to floating point errors. The
+    metrics are also screened as barplots does, so that the ones it would
+    skip are known without keeping the rows.
+    """
+
+    def __init__(self, groupby: List[str], metrics: List[str]):
+        """Create new empty aggregates.
+
+        Parameters
+        ----------
+        groupby: List[str]
+            Columns to group the rows by.
+        metrics: List[str]
+            Columns of the metrics to be aggregated.
+        """
+        self._groupby = groupby
+        self._metrics = metrics
+        self._statistics: Dict[str, pd.DataFrame] = {}
+        self._rows = 0
+        # The metrics with missing, not numeric or boolean values.
+        self._skipped: Set[str] = set()
+        self._first_values: Dict[str, float] = {}
+        self._varying: Set[str] = set()
+        # The metrics whose values are so far the numbers of their rows.
+        self._counting: Set[str] = set(metrics)
+
+    def update(self, df: pd.DataFrame) -> Set[str]:
+        """Pool the statistics of the given rows and return the changed metrics.
+
+        A metric is changed when its means or standard deviations changed,
+        or when it is found to be skipped by barplots.
+
+        Parameters
+        ----------
+        df: pd.DataFrame
+            The new rows, with the groupby and metrics columns.
+        """
+        if df.empty:
+            return set()
+
+        df = df.astype({column: str for column in self._groupby})
+        row_numbers = np.arange(self._rows, self._rows + len(df))
+        self._rows += len(df)
+        changed = set()
+
+        for metric in self._metrics:
+            if metric in self._skipped:
+                continue
+            values = df[metric]
+            if (
+                values.isna().any()
+                or not is_numeric_dtype(values)
+                or is_bool_dtype(values)
+            ):
+                self._skipped.add(metric)
+                self._statistics.pop(metric, None)
+                changed.add(metric)
+                continue
+            if metric in self._counting and (values.to_numpy() != row_numbers).any():
+                self._counting.discard(metric)
+            if metric not in self._varying:
+                first_value = self._first_values.setdefault(metric, values.iloc[0])
+                if (values != first_value).any():
+                    self._varying.add(metric)
+
+            statistics = df.groupby(self._groupby)[metric].agg(("count", "mean", "std"))
+            previous = self._statistics.get(metric)
+            if previous is not None:
+                statistics = pool_statistics(
+                    pd.concat([previous, statistics]),
+                    by=list(range(len(self._groupby))),
+                )
+            statistics = statistics.sort_index()
+            self._statistics[metric] = statistics
+            if previous is None or not previous[["mean", "std"]].equals(
+                statistics[["mean", "std"]]
+            ):
+                changed.add(metric)
+
+        return changed
+
+    def get_plottable_metrics(self) -> List[str]:
+        """Return the metrics that barplots would plot, in their order.
+
+        As in barplots, the metrics with missing, not numeric or boolean
+        values are skipped, together with the ones counting the rows and
+        the constant ones.
+        """
+        return [
+            metric
+            for metric in self._metrics
+            if metric in self._statistics
+            and metric in self._varying
+            and metric not in self._counting
+        ]
+
+    def get_feature_df(self, metric: str) -> pd.DataFrame:
+        """Return the mean and standard deviation of the given metric, as barplots.
+
+        The standard deviations are dropped when any of them is undefined,
+        as barplots does by default.
+
+        Parameters
+        ----------
+        metric: str
+            The metric to be returned.
+
+        Raises
+        ------
+        ValueError
+            If no value of the metric has been aggregated yet.
+        """
+        if metric not in self._statistics:
+            raise ValueError(f"No value of the metric {metric} has been aggregated.")
+
+        statistics = self._statistics[metric]
+        columns = ["mean"] if statistics["std"].isna().any() else ["mean", "std"]
+        feature_df = statistics[columns].copy()
+        feature_df.columns = pd.MultiIndex.from_product([[metric], columns])
+        return feature_df
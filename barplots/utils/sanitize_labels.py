@@ -0,0 +1,82 @@
+"""Cached sanitization of the labels shared across all the plots of a process."""
+
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
+from sanitize_ml_labels import sanitize_ml_labels
+
+# Maximum number of distinct labels and lists of labels to keep sanitized.
+SANITIZATION_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=SANITIZATION_CACHE_SIZE, typed=True)
+def cached_sanitize_ml_labels(
+    labels: Union[Tuple[Any, ...], Any],
+    custom_defaults: Optional[Tuple[Tuple[str, Any], ...]],
+) -> Union[Tuple[str, ...], str]:
+    """Return the sanitized labels, caching the result.
+
+    Parameters
+    ----------
+    labels: Union[Tuple[Any, ...], Any]
+        Either a tuple of labels or a single label to sanitize.
+    custom_defaults: Optional[Tuple[Tuple[str, Any], ...]]
+        The items of the custom defaults, with the lists converted to tuples.
+    """
+    sanitized = sanitize_ml_labels(
+        list(labels) if isinstance(labels, tuple) else labels,
+        custom_defaults=(
+            None
+            if custom_defaults is None
+            else {
+                key: list(value) if isinstance(value, tuple) else value
+                for key, value in custom_defaults
+            }
+        ),
+    )
+    return tuple(sanitized) if isinstance(labels, tuple) else sanitized
+
+
+def sanitize_labels(
+    labels: Union[List[Any], Any],
+    custom_defaults: Optional[Dict[str, Union[List[str], str]]] = None,
+) -> Union[List[str], str]:
+    """Return sanitized labels, using a bounded cache shared by the whole process.
+
+    Note that the sanitization of a list of labels depends on all of its labels,
+    as for instance the descriptors shared by all the labels are removed,
+    so lists of labels are cached as a whole.
+
+    Parameters
+    ----------
+    labels: Union[List[Any], Any]
+        Either a label or an iterable of labels to sanitize.
+    custom_defaults: Optional[Dict[str, Union[List[str], str]]] = None
+        The defaults for normalizing the provided labels.
+
+    Returns
+    -------
+    The sanitized label, or the list of sanitized labels.
+    """
+    frozen_defaults = (
+        None
+        if custom_defaults is None
+        else tuple(
+            (key, tuple(value) if isinstance(value, list) else value)
+            for key, value in custom_defaults.items()
+        )
+    )
+
+    if isinstance(labels, str) or not hasattr(labels, "__iter__"):
+        return cached_sanitize_ml_labels(labels, frozen_defaults)
+
+    return list(cached_sanitize_ml_labels(tuple(labels), frozen_defaults))
+
+
+def get_sanitization_cache_info():
+    """Return the hits, misses, maximum size and current size of the cache."""
+    return cached_sanitize_ml_labels.cache_info()
+
+
+def clear_sanitization_cache():
+    """Remove all the sanitized labels from the cache and reset its statistics."""
+    cached_sanitize_ml_labels.cache_clear()
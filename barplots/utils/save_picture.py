@@ -1,20 +1,36 @@
 """Save the given figure to the given path."""
 
 import os
+from typing import BinaryIO, Optional, Union
 from matplotlib.figure import Figure
 
 
-def save_picture(path: str, figure: Figure):
+def save_picture(
+    path: Union[str, BinaryIO],
+    figure: Figure,
+    bbox_inches: Optional[str] = "tight",
+    format: Optional[str] = None,
+):
     """Save the given figure to the given path.
 
     Parameters
     ----------
-    path: str,
-        Path where to save the figure.
+    path: Union[str, BinaryIO],
+        Path where to save the figure, or binary file object
+        where to write the picture.
     figure: Figure,
         Figure to save.
+    bbox_inches: Optional[str] = "tight",
+        Portion of the figure to save. With "tight", the picture is
+        cropped to the content of the figure, which requires an
+        additional pass to measure it. With None, the whole figure is saved.
+    format: Optional[str] = None,
+        Format of the picture, such as "png" or "svg". By default, it is
+        inferred from the extension of the path, or it is the default
+        format of matplotlib for file objects.
     """
-    directory = os.path.dirname(path)
-    if directory:
-        os.makedirs(directory, exist_ok=True)
-    figure.savefig(path, bbox_inches="tight")
+    if isinstance(path, str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+    figure.savefig(path, bbox_inches=bbox_inches, format=format)
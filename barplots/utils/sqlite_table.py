@@ -0,0 +1,208 @@
+"""Screen and aggregate the columns of a SQLite table or query within SQLite."""
+
+import math
+import sqlite3
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Union
+import pandas as pd
+
+
+def quote_identifier(name: str) -> str:
+    """Return the given name quoted as a SQL identifier."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+class SQLiteTable:
+    """Table or query of a SQLite database, aggregated by SQLite.
+
+    The screening of the plottable columns and the aggregation of their
+    statistics are pushed down to SQLite, so that only the aggregated
+    table is loaded in memory.
+    """
+
+    def __init__(
+        self,
+        database: Union[str, sqlite3.Connection],
+        table: Optional[str] = None,
+        query: Optional[str] = None,
+        metrics: Optional[List[str]] = None,
+    ):
+        """Create a new SQLite table.
+
+        Parameters
+        ----------
+        database: Union[str, sqlite3.Connection]
+            Path of the database, opened read-only for each query, or an
+            open connection to it.
+        table: Optional[str] = None
+            Name of the table containing the rows.
+        query: Optional[str] = None
+            Query returning the rows, as an alternative to the table.
+        metrics: Optional[List[str]] = None
+            The metrics to be plotted. By default, all the plottable columns.
+
+        Raises
+        ------
+        ValueError
+            If not exactly one among the table and the query is provided.
+        """
+        if (table is None) == (query is None):
+            raise ValueError("Exactly one among the table and the query must be given.")
+        self._database = database
+        self._source = (
+            quote_identifier(table)
+            if query is None
+            else f"({query.strip().rstrip(';')})"
+        )
+        self._metrics = metrics
+
+    @contextmanager
+    def connect(self) -> Iterator[sqlite3.Connection]:
+        """Return a connection to the database, closed on exit if opened here."""
+        if isinstance(self._database, sqlite3.Connection):
+            yield self._database
+            return
+        connection = sqlite3.connect(f"file:{self._database}?mode=ro", uri=True)
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    @property
+    def column_names(self) -> List[str]:
+        """Return the names of the columns of the table."""
+        with self.connect() as connection:
+            cursor = connection.execute(f"SELECT * FROM {self._source} LIMIT 0")
+            return [description[0] for description in cursor.description]
+
+    def screen(self, groupby: List[str], skip_constant_columns: bool) -> List[str]:
+        """Return the plottable metrics, screened with a single query.
+
+        As in barplots, the columns with missing or non numeric values are
+        skipped, together with the ones counting the rows and, optionally,
+        the constant ones. SQLite has no boolean type, so the booleans are
+        stored as integers and screened as such.
+
+        Parameters
+        ----------
+        groupby: List[str]
+            The columns the rows are grouped by.
+        skip_constant_columns: bool
+            Whether to skip the columns with constant values.
+        """
+        candidates = [
+            column
+            for column in (
+                self.column_names if self._metrics is None else self._metrics
+            )
+            if column not in groupby
+        ]
+        if not candidates:
+            return []
+
+        selections = ["COUNT(*)"]
+        for column in map(quote_identifier, candidates):
+            selections += [
+                f"SUM(typeof({column}) NOT IN ('integer', 'real'))",
+                f"MIN({column})",
+                f"MAX({column})",
+                f"COUNT(DISTINCT {column})",
+            ]
+
+        with self.connect() as connection:
+            row = connection.execute(
+                f"SELECT {', '.join(selections)} FROM {self._source}"
+            ).fetchone()
+
+        rows = row[0]
+        metrics = []
+        for position, column in enumerate(candidates):
+            non_numeric, minimum, maximum, distinct = row[
+                1 + 4 * position : 5 + 4 * position
+            ]
+            if rows == 0 or non_numeric > 0:
+                continue
+            # The columns with the values from zero to the number of rows
+            # minus one are counting the rows.
+            if minimum == 0 and maximum == rows - 1 and distinct == rows:
+                continue
+            if skip_constant_columns and minimum == maximum:
+                continue
+            metrics.append(column)
+        return metrics
+
+    def aggregate(
+        self,
+        groupby: List[str],
+        metrics: List[str],
+        statistics: Sequence[str],
+    ) -> Dict[str, list]:
+        """Return the statistics of the given metrics, aggregated by SQLite.
+
+        The variance is computed in a single pass from the sums of the
+        values shifted by their mean over the whole table, which avoids
+        the cancellation of the sums of the raw values.
+
+        Parameters
+        ----------
+        groupby: List[str]
+            The columns to group the rows by.
+        metrics: List[str]
+            The metrics to aggregate.
+        statistics: Sequence[str]
+            The statistics to compute, among "mean", "std" and "count".
+
+        Returns
+        -------
+        The group keys, by column, and the statistics, named as "metric/statistic".
+        """
+        keys = ", ".join(map(quote_identifier, groupby))
+        with self.connect() as connection:
+            shifts = (
+                connection.execute(
+                    "SELECT "
+                    + ", ".join(
+                        f"AVG({quote_identifier(metric)})" for metric in metrics
+                    )
+                    + f" FROM {self._source}"
+                ).fetchone()
+                if metrics
+                else ()
+            )
+            selections = [keys]
+            for metric, shift in zip(map(quote_identifier, metrics), shifts):
+                shifted = f"({metric} - {float(shift)!r})"
+                selections += [
+                    f"COUNT({metric})",
+                    f"SUM({shifted})",
+                    f"SUM({shifted} * {shifted})",
+                ]
+            rows = connection.execute(
+                f"SELECT {', '.join(selections)} FROM {self._source} GROUP BY {keys}"
+            ).fetchall()
+
+        columns: Dict[str, list] = {
+            column: [row[position] for row in rows]
+            for position, column in enumerate(groupby)
+        }
+        for position, (metric, shift) in enumerate(zip(metrics, shifts)):
+            offset = len(groupby) + 3 * position
+            means, stds, counts = [], [], []
+            for row in rows:
+                count, total, squares = row[offset : offset + 3]
+                means.append(shift + total / count)
+                stds.append(
+                    math.sqrt(max(squares - total * total / count, 0.0) / (count - 1))
+                    if count > 1
+                    else math.nan
+                )
+                counts.append(count)
+            statistic_values = {"mean": means, "std": stds, "count": counts}
+            for statistic in statistics:
+                columns[f"{metric}/{statistic}"] = statistic_values[statistic]
+        return columns
+
+    def to_pandas(self) -> pd.DataFrame:
+        """Return all the rows of the table as a pandas dataframe."""
+        with self.connect() as connection:
+            return pd.read_sql_query(f"SELECT * FROM {self._source}", connection)
@@ -0,0 +1,77 @@
+"""Read the rows appended to a CSV or TSV file since the last read."""
+
+import io
+import os
+from typing import List, Optional, Tuple
+import pandas as pd
+
+
+class TableTail:
+    """Reader of the rows appended to a CSV or TSV file.
+
+    Only the complete lines are read, so that a row being written is read
+    once completed. When the file is truncated or replaced by a shorter
+    one, the reading restarts from its beginning.
+    """
+
+    def __init__(self, path: str, columns: Optional[List[str]] = None):
+        """Create a new reader of the given file.
+
+        Parameters
+        ----------
+        path: str
+            Path of the file, which may not exist yet.
+        columns: Optional[List[str]] = None
+            The columns to be loaded. By default, all the columns are loaded.
+        """
+        self._path = path
+        self._columns = columns
+        self._separator = "\t" if path.lower().endswith(".tsv") else ","
+        self._offset = 0
+        self._header: Optional[bytes] = None
+
+    def read_new_rows(self) -> Tuple[Optional[pd.DataFrame], bool]:
+        """Return the rows appended since the last read, if any.
+
+        Returns
+        -------
+        Tuple with the new rows, or None if there are none, and whether the
+        reading restarted from the beginning of the file, in which case the
+        previously read rows are no longer in the file.
+        """
+        if not os.path.exists(self._path):
+            return None, False
+
+        restarted = False
+        if os.path.getsize(self._path) < self._offset:
+            self._offset = 0
+            self._header = None
+            restarted = True
+
+        with open(self._path, "rb") as file:
+            file.seek(self._offset)
+            chunk = file.read()
+
+        # The last line may still be being written.
+        end = chunk.rfind(b"\n")
+        if end == -1:
+            return None, restarted
+        chunk = chunk[: end + 1]
+        self._offset += len(chunk)
+
+        if self._header is None:
+            header_end = chunk.find(b"\n") + 1
+            self._header = chunk[:header_end]
+            chunk = chunk[header_end:]
+
+        if not chunk.strip():
+            return None, restarted
+
+        return (
+            pd.read_csv(
+                io.BytesIO(self._header + chunk),
+                usecols=self._columns,
+                sep=self._separator,
+            ),
+            restarted,
+        )
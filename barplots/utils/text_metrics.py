@@ -0,0 +1,74 @@
+"""Estimation of the text extents from the cached advance widths of the glyphs."""
+
+from functools import lru_cache
+from typing import Dict, Iterable, List
+from matplotlib.font_manager import FontProperties, findfont, get_font
+
+
+@lru_cache(maxsize=None)
+def get_glyph_advances(size: float, weight: str = "normal") -> Dict[str, float]:
+    """Return the cache of the glyph advance widths for the given font size and weight.
+
+    The returned dictionary is filled lazily by get_text_width, and is shared
+    by all the measurements with the same font size and weight.
+
+    Parameters
+    ----------
+    size: float
+        The font size, in points.
+    weight: str = "normal"
+        The font weight.
+    """
+    return {}
+
+
+@lru_cache(maxsize=None)
+def get_font_path(weight: str) -> str:
+    """Return the path of the default font file with the given weight."""
+    return findfont(FontProperties(weight=weight))
+
+
+def get_text_width(text: str, size: float, weight: str = "normal") -> float:
+    """Return the estimated width of the given text in points.
+
+    The width is the sum of the advance widths of the glyphs of the default
+    font, which ignores the kerning but requires no rendering. The advance
+    widths are loaded from the font file once per glyph, size and weight.
+
+    Parameters
+    ----------
+    text: str
+        The text to measure.
+    size: float
+        The font size, in points.
+    weight: str = "normal"
+        The font weight.
+    """
+    advances = get_glyph_advances(size, weight)
+    width = 0.0
+    for character in text:
+        advance = advances.get(character)
+        if advance is None:
+            font = get_font(get_font_path(weight))
+            font.set_size(size, 72)
+            advance = font.load_char(ord(character)).linearHoriAdvance / 65536
+            advances[character] = advance
+        width += advance
+    return width
+
+
+def get_text_widths(
+    texts: Iterable[str], size: float, weight: str = "normal"
+) -> List[float]:
+    """Return the estimated widths of the given texts in points.
+
+    Parameters
+    ----------
+    texts: Iterable[str]
+        The texts to measure.
+    size: float
+        The font size, in points.
+    weight: str = "normal"
+        The font weight.
+    """
+    return [get_text_width(str(text), size, weight) for text in texts]
@@ -1,25 +1,27 @@
-from typing import Generator
+from typing import Generator, Union
+import numpy as np
 import pandas as pd
-from barplots.utils.get_jumps import get_jumps
-from barplots.utils.bar_positions import bar_positions
+from barplots.utils.bar_positions import get_bar_geometry
+from barplots.utils.compact_table import CompactTable, as_compact_table
 
 
 def text_positions(
-    df: pd.DataFrame, bar_width: float, space_width: float, index_level: int
+    df: Union[pd.DataFrame, CompactTable],
+    bar_width: float,
+    space_width: float,
+    index_level: int,
 ) -> Generator:
-    positions = bar_positions(df, bar_width, space_width)
-    old_index = None
-    previous_jump_position = 0
-    last_position = 0
+    table = as_compact_table(df)
+    x, _, _, _ = get_bar_geometry(table, bar_width, space_width)
+    jumps = np.flatnonzero(table.get_jumps()[:, index_level])
 
-    for (index, _), position in zip(df.iterrows(), positions):
-        if not isinstance(index, (list, tuple)):
-            index = (index,)
-        jumps = get_jumps(index, old_index)
-        if jumps[index_level] and old_index is not None:
-            yield (previous_jump_position + last_position) / 2, old_index[index_level]
-            previous_jump_position = position[0] - bar_width / 2
+    # Each label is centered on the bars from the previous jump to the
+    # last bar before the following one, and the first starts from zero.
+    starts = np.concatenate(([0.0], x[jumps] - bar_width / 2))
+    lasts = np.concatenate((jumps - 1, [len(table) - 1]))
+    ends = x[lasts] + bar_width / 2
+    codes = table.codes[index_level][lasts]
+    labels = table.labels[index_level]
 
-        last_position = position[0] + bar_width / 2
-        old_index = index
-    yield (previous_jump_position + last_position) / 2, old_index[index_level]
+    for start, end, code in zip(starts.tolist(), ends.tolist(), codes.tolist()):
+        yield (start + end) / 2, labels[code]
@@ -0,0 +1,120 @@
+"""Update in place the bars plotted for a dataframe with the same index."""
+
+from typing import List, Union
+import pandas as pd
+from matplotlib.axes import Axes
+from matplotlib.container import BarContainer
+from barplots.utils.bar_positions import bar_positions
+from barplots.utils.compact_table import CompactTable
+from barplots.utils.get_error_extents import get_error_extents
+
+
+def update_bars(
+    axes: Axes,
+    df: Union[pd.DataFrame, CompactTable],
+    bar_width: float,
+    space_width: float,
+    vertical: bool,
+    min_std: float,
+) -> List[BarContainer]:
+    """Update the bars of the given axes with the values of the given dataframe.
+
+    The bars must have been plotted by plot_bars for a dataframe with the
+    same index, so that the bars are in the same positions and order.
+    Only the lengths of the bars and their error bars are updated: the
+    error bars below the minimum standard deviation are hidden, and the
+    missing ones are created. The bars whose values did not change are
+    left untouched.
+
+    Parameters
+    ----------
+    axes: Axes,
+        The axes where the bars were plotted.
+    df: Union[pd.DataFrame, CompactTable],
+        The dataframe, or its compact table, from where to extract the data.
+    bar_width: float,
+        The width of the bars, used also for spacing.
+    space_width: float,
+        Width of spaces between spaces.
+    vertical: bool,
+        Whetever the bars are vertical or horizontal.
+    min_std: float,
+        Minimum standard deviation to be shown.
+
+    Raises
+    ------
+    ValueError
+        If the number of bars of the axes does not match the dataframe.
+
+    Returns
+    -------
+    List of the bars that were updated.
+    """
+    bars = [
+        container
+        for container in axes.containers
+        if isinstance(container, BarContainer)
+    ]
+
+    if len(bars) != len(df):
+        raise ValueError(
+            f"The axes have {len(bars)} bars, but the provided "
+            f"dataframe has {len(df)} rows."
+        )
+
+    updated = []
+
+    for bar, (x, y, std, _) in zip(bars, bar_positions(df, bar_width, space_width)):
+        rectangle = bar.patches[0]
+        below, above = get_error_extents(std)
+        show_std = max(below, above) > min_std
+
+        if vertical:
+            ends = ((x, y - below), (x, y + above))
+            length = rectangle.get_height()
+        else:
+            ends = ((y - below, x), (y + above, x))
+            length = rectangle.get_width()
+
+        error_lines = None if bar.errorbar is None else bar.errorbar.lines[2][0]
+        shown_std = error_lines is not None and error_lines.get_visible()
+
+        if (
+            length == y
+            and shown_std == show_std
+            and (not show_std or (error_lines.get_segments()[0] == ends).all())
+        ):
+            continue
+
+        updated.append(bar)
+
+        if vertical:
+            rectangle.set_height(y)
+        else:
+            rectangle.set_width(y)
+
+        if bar.errorbar is None:
+            if not show_std:
+                continue
+            bar.errorbar = axes.errorbar(
+                *((x, y) if vertical else (y, x)),
+                **(
+                    {"yerr": [[below], [above]]}
+                    if vertical
+                    else {"xerr": [[below], [above]]}
+                ),
+                fmt="none",
+                ecolor="k",
+                capsize=7 * bar_width / 0.3,
+                label="_nolegend_",
+            )
+
+        _, caplines, barlinecols = bar.errorbar.lines
+        for barlinecol in barlinecols:
+            barlinecol.set_segments([ends])
+            barlinecol.set_visible(show_std)
+        for capline, (end_x, end_y) in zip(caplines, ends):
+            capline.set_data([end_x], [end_y])
+            capline.set_visible(show_std)
+
+    return updated
@@ -0,0 +1,43 @@
+"""Function to update the data label shown on the value axis."""
+
+from typing import Dict, List, Optional
+from matplotlib.axes import Axes
+from barplots.utils.sanitize_labels import sanitize_labels
+
+
+def update_data_label(
+    axes: Axes,
+    vertical: bool,
+    data_label: Optional[str],
+    sanitize_metrics: bool,
+    custom_defaults: Dict[str, List[str]],
+):
+    """Replace the data label of the value axis, if it is shown.
+
+    Parameters
+    ----------
+    axes: Axes
+        The axes whose data label is to be replaced.
+    vertical: bool
+        Whetever the bars are vertical or horizontal.
+    data_label: Optional[str]
+        The new data label. None for hiding the data label.
+    sanitize_metrics: bool
+        Whetever to sanitize the data label or not.
+    custom_defaults: Dict[str, List[str]]
+        The defaults for normalizing the data label.
+    """
+    value_axis = axes.yaxis if vertical else axes.xaxis
+
+    # The data label hidden in the subplots sharing it is left hidden.
+    if not value_axis.get_label_text():
+        return
+
+    if data_label is None:
+        value_axis.set_label_text("")
+    else:
+        value_axis.set_label_text(
+            sanitize_labels(data_label, custom_defaults=custom_defaults)
+            if sanitize_metrics
+            else data_label
+        )
@@ -0,0 +1,74 @@
+"""Validate the options of a barplot that do not depend on the data."""
+
+from functools import lru_cache
+from typing import Union
+
+
+def validate_barplot_options(
+    orientation: str,
+    plots_per_row: Union[int, str],
+    layout: str,
+):
+    """Raise an error if the given barplot options are not valid.
+
+    Parameters
+    ----------
+    orientation: str
+        Orientation of the bars.
+    plots_per_row: Union[int, str]
+        Number of subplots per row.
+    layout: str
+        How to lay out the figure.
+
+    Raises
+    ------
+    ValueError:
+        If the given orientation is nor "vertical" nor "horizontal".
+    ValueError:
+        If the given plots_per_row is nor "auto" or a positive integer.
+    ValueError:
+        If the given layout is nor "tight" nor "single_pass".
+    """
+    try:
+        hash((orientation, plots_per_row, layout))
+    except TypeError as error:
+        raise ValueError(f"The barplot options are not valid: {error}") from error
+    validate_hashable_barplot_options(orientation, plots_per_row, layout)
+
+
+@lru_cache(maxsize=256, typed=True)
+def validate_hashable_barplot_options(
+    orientation: str,
+    plots_per_row: Union[int, str],
+    layout: str,
+):
+    """Raise an error if the given barplot options are not valid.
+
+    The valid combinations of options are cached, so that the options of
+    a spec, validated when building it, are not validated again when
+    rendering each of its barplots.
+
+    Parameters
+    ----------
+    orientation: str
+        Orientation of the bars.
+    plots_per_row: Union[int, str]
+        Number of subplots per row.
+    layout: str
+        How to lay out the figure.
+    """
+    if orientation not in ("vertical", "horizontal"):
+        raise ValueError(f'Given orientation "{orientation}" is not supported.')
+
+    if (
+        not isinstance(plots_per_row, int)
+        and plots_per_row != "auto"
+        or isinstance(plots_per_row, int)
+        and plots_per_row < 1
+    ):
+        raise ValueError(
+            f"Given plots_per_row \"{plots_per_row}\" is not 'auto' or a positive integer."
+        )
+
+    if layout not in ("tight", "single_pass"):
+        raise ValueError(f'Given layout "{layout}" is not supported.')
@@ -0,0 +1,168 @@
+"""Module implementing the incremental rendering of the barplots of a growing table."""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+import pandas as pd
+import matplotlib.pyplot as plt
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+from barplots.barplot import barplot
+from barplots.utils import RunningAggregates, TableTail, sanitize_labels
+
+
+def watch_barplots(
+    table_path: str,
+    groupby: List[str],
+    metrics: Optional[List[str]] = None,
+    title: Optional[str] = "{feature}",
+    data_label: Optional[str] = "{feature}",
+    path: str = "barplots/{feature}.png",
+    debounce: float = 1.0,
+    poll_interval: float = 0.25,
+    stop: Optional[threading.Event] = None,
+    on_render: Optional[Callable[[str, Figure, Axes], None]] = None,
+    **kwargs: Any,
+):
+    """Keep the barplots of the given CSV or TSV file current as rows are appended.
+
+    Only the appended rows are read, and their statistics are pooled with
+    the running aggregates of their groups. Once no row has been appended
+    for the debounce interval, the barplots of the features whose means
+    or standard deviations changed are rendered again, so that a burst of appended
+    rows causes a single rendering. When the groups of a feature did not
+    change, its figure is updated in place, leaving untouched the bars
+    whose values did not change.
+
+    Parameters
+    ----------
+    table_path: str
+        Path of the CSV or TSV file to watch, which may not exist yet.
+    groupby: List[str]
+        Columns to group the rows by.
+    metrics: Optional[List[str]] = None
+        Metrics to be plotted. By default, the columns of the file except
+        for the groupby ones. As in barplots, the metrics with missing, not
+        numeric or boolean values, the ones counting the rows and the
+        constant ones are skipped.
+    title: Optional[str] = "{feature}"
+        Title of the barplots, with the "{feature}" placeholder.
+        If None, the barplots have no title.
+    data_label: Optional[str] = "{feature}"
+        Label of the values of the barplots, with the "{feature}" placeholder.
+        If None, the values have no label.
+    path: str = "barplots/{feature}.png"
+        Path of the barplots, with the "{feature}" placeholder.
+    debounce: float = 1.0
+        Seconds without appended rows to wait before rendering.
+    poll_interval: float = 0.25
+        Seconds between the checks of the file.
+    stop: Optional[threading.Event] = None
+        Event stopping the watch once set. By default, the file is watched
+        until the process is interrupted.
+    on_render: Optional[Callable[[str, Figure, Axes], None]] = None
+        Callable called with the name, figure and axes of each rendered feature.
+    kwargs: Any
+        Parameters to be passed to barplot. As in barplots, the top index
+        level is split into subplots by default when grouping by four columns.
+
+    Raises
+    ------
+    ValueError
+        If the groupby columns are empty.
+    """
+    if len(groupby) == 0:
+        raise ValueError("The provided list of columns to execute groupby on is empty.")
+
+    if stop is None:
+        stop = threading.Event()
+
+    # The defaults of barplots, which differ from the ones of barplot.
+    kwargs = {"subplots": len(groupby) == 4, "unique_minor_labels": True, **kwargs}
+
+    tail = TableTail(table_path, columns=None if metrics is None else groupby + metrics)
+    aggregates: Optional[RunningAggregates] = None
+    features: Dict[str, str] = {}
+    figures: Dict[str, Tuple[Figure, Axes, pd.Index]] = {}
+    changed: Set[str] = set()
+    last_change = 0.0
+
+    try:
+        while not stop.is_set():
+            rows, restarted = tail.read_new_rows()
+
+            if restarted:
+                aggregates = None
+                changed = set()
+
+            if rows is not None:
+                if aggregates is None:
+                    aggregates = RunningAggregates(
+                        groupby,
+                        (
+                            [column for column in rows.columns if column not in groupby]
+                            if metrics is None
+                            else metrics
+                        ),
+                    )
+                changed |= aggregates.update(rows)
+                last_change = time.monotonic()
+
+            if changed and time.monotonic() - last_change >= debounce:
+                plottable = aggregates.get_plottable_metrics()
+                # The names of the features are sanitized together, as barplots
+                # does, once the metrics it would skip are screened out.
+                renamed = dict(
+                    zip(
+                        plottable,
+                        (
+                            sanitize_labels(plottable)
+                            if kwargs.get("sanitize_metrics", True)
+                            else plottable
+                        ),
+                    )
+                )
+                for metric in list(figures):
+                    if metric not in renamed:
+                        plt.close(figures.pop(metric)[0])
+                changed = {
+                    metric
+                    for metric in plottable
+                    if metric in changed or features.get(metric) != renamed[metric]
+                }
+                features = renamed
+                for metric in sorted(changed):
+                    feature = features[metric]
+                    feature_df = aggregates.get_feature_df(metric)
+                    template = None
+                    if metric in figures:
+                        figure, axes, index = figures.pop(metric)
+                        if index.equals(feature_df.index) and "sort_bars" not in kwargs:
+                            template = (figure, axes)
+                        else:
+                            plt.close(figure)
+                    figure, axes = barplot(
+                        feature_df,
+                        title=(
+                            None
+                            if title is None
+                            else title.format(feature=feature.replace("_", " "))
+                        ),
+                        data_label=(
+                            None
+                            if data_label is None
+                            else data_label.format(feature=feature.replace("_", " "))
+                        ),
+                        path=path.format(feature=feature).replace(" ", "_").lower(),
+                        template=template,
+                        **kwargs,
+                    )
+                    figures[metric] = (figure, axes, feature_df.index)
+                    if on_render is not None:
+                        on_render(feature, figure, axes)
+                changed = set()
+
+            stop.wait(poll_interval)
+    finally:
+        for figure, _, _ in figures.values():
+            plt.close(figure)
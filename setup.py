@@ -40,6 +40,8 @@ test_deps = [
 
 extras = {
     "test": test_deps,
+    "arrow": ["pyarrow"],
+    "polars": ["polars"],
 }
 
 setup(
@@ -72,4 +74,10 @@ setup(
         "sanitize_ml_labels>=1.0.47",
     ],
     extras_require=extras,
+    entry_points={
+        "console_scripts": [
+            "barplots=barplots.cli:main",
+            "barplots-server=barplots.server:main",
+        ],
+    },
 )
@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+import pytest
+import matplotlib.pyplot as plt
+from barplots import barplots
+from barplots.utils import normalize_aggregated_table, pool_aggregated_tables
+
+
+def aggregate(df: pd.DataFrame, groupby) -> pd.DataFrame:
+    aggregated = df.groupby(groupby)["val_auroc"].agg(["mean", "std", "count"])
+    aggregated.columns = ["val_auroc_mean", "val_auroc_std", "val_auroc_count"]
+    return aggregated.reset_index()
+
+
+def test_pool_aggregated_tables():
+    df = pd.read_csv("tests/test_case.csv")
+    groupby = ["cell_line", "task", "model"]
+    reference = df[groupby + ["val_auroc"]].groupby(groupby)
+    reference = reference.agg(("mean", "std", "count")).sort_index()
+    tables = [aggregate(df.iloc[::3], groupby), aggregate(df.iloc[1::3], groupby)]
+    tables.append(aggregate(df.iloc[2::3], groupby))
+
+    pooled = pool_aggregated_tables(tables, groupby=groupby)
+    assert pooled.columns.tolist() == reference.columns.tolist()
+    assert pooled.index.equals(reference.index)
+    assert np.allclose(pooled.values, reference.values.astype(float))
+
+    barplots(
+        tables,
+        groupby=groupby,
+        aggregated=True,
+        path="test_barplots/aggregated/{feature}.png",
+    )
+    plt.close()
+
+
+def test_normalize_aggregated_table():
+    df = pd.DataFrame(
+        {
+            "model": ["a", "b"],
+            "loss_mean": [1.0, 2.0],
+            "loss_sem": [0.5, 0.25],
+            "loss_count": [4, 16],
+            "loss_weight": [1.0, 3.0],
+        }
+    )
+    normalized = normalize_aggregated_table(df, groupby=["model"])
+    assert normalized.columns.tolist() == [
+        ("loss", "mean"),
+        ("loss", "std"),
+        ("loss", "count"),
+        ("loss", "weight"),
+    ]
+    assert normalized[("loss", "std")].tolist() == [1.0, 1.0]
+
+    # The weights are used in place of the counts when pooling.
+    pooled = pool_aggregated_tables(
+        [df.iloc[:1], df.iloc[1:].assign(model="a")], ["model"]
+    )
+    assert pooled[("loss", "mean")].tolist() == [1.75]
+    assert pooled[("loss", "count")].tolist() == [20]
+
+
+def test_pool_weighted_aggregated_tables():
+    df = pd.DataFrame(
+        {
+            "model": ["a", "a"],
+            "loss_mean": [1.0, 2.0],
+            "loss_std": [1.0, 1.0],
+            "loss_count": [10, 10],
+        }
+    )
+    unweighted = pool_aggregated_tables([df.iloc[:1], df.iloc[1:]], ["model"])
+    weighted = pool_aggregated_tables(
+        [df.iloc[:1].assign(loss_weight=0.5), df.iloc[1:].assign(loss_weight=1.5)],
+        ["model"],
+    )
+    # The weights change the pooled means, but not the standard deviations,
+    # which depend only on the counts of the samples.
+    assert weighted[("loss", "mean")].tolist() == [1.75]
+    assert np.allclose(weighted[("loss", "std")], unweighted[("loss", "std")])
+    assert np.allclose(weighted[("loss", "std")], np.sqrt(23.0 / 19.0))
+
+    with pytest.raises(ValueError):
+        pool_aggregated_tables(
+            [
+                table.drop(columns="loss_count").assign(loss_weight=0.5)
+                for table in (df.iloc[:1], df.iloc[1:])
+            ],
+            ["model"],
+        )
+
+
+def test_wrong_aggregated_tables():
+    df = pd.DataFrame({"model": ["a"], "loss_mean": [1.0], "loss_sem": [0.5]})
+    with pytest.raises(ValueError):
+        normalize_aggregated_table(df, groupby=["model"])
+    with pytest.raises(ValueError):
+        normalize_aggregated_table(df.assign(loss_std=1.0, loss_count=2), ["model"])
+    with pytest.raises(ValueError):
+        normalize_aggregated_table(df.rename(columns={"loss_sem": "loss"}), ["model"])
+    with pytest.raises(ValueError):
+        normalize_aggregated_table(
+            df[["model", "loss_sem"]].assign(loss_count=1), ["model"]
+        )
+    with pytest.raises(ValueError):
+        normalize_aggregated_table(df.assign(loss_count=0), groupby=["model"])
+    with pytest.raises(ValueError):
+        pool_aggregated_tables([df[["model", "loss_mean"]]] * 2, groupby=["model"])
+    with pytest.raises(ValueError):
+        pool_aggregated_tables([])
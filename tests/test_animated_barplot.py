@@ -0,0 +1,72 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from PIL import Image
+from matplotlib import animation
+from barplots import animated_barplot, barplot
+from barplots.animated_barplot import render_frames, write_gif
+import matplotlib.pyplot as plt
+
+
+def test_animated_barplot():
+    root = "test_barplots"
+    df = pd.read_csv("tests/test_case.csv")
+    groups_df = (
+        df.groupby(["task", "model"])[["val_auroc"]].agg(("mean", "std")).sort_index()
+    )
+    frames = [groups_df * scale for scale in np.linspace(0.5, 1, 4)]
+    path = "{root}/animated.gif".format(root=root)
+    animated_barplot(
+        frames, path, frame_labels=[f"Epoch {i}" for i in range(len(frames))]
+    )
+    with Image.open(path) as gif:
+        assert gif.n_frames == len(frames)
+    plt.close()
+
+    with pytest.raises(ValueError):
+        animated_barplot([], path)
+
+    with pytest.raises(ValueError):
+        animated_barplot(frames, path, frame_labels=["Epoch 0"])
+
+    with pytest.raises(ValueError):
+        animated_barplot(frames, path, writer="pinco")
+
+    with pytest.raises(ValueError):
+        animated_barplot(
+            [frames[0], frames[1].rename(columns={"val_auroc": "val_auprc"})], path
+        )
+
+    if not animation.writers.is_available("ffmpeg"):
+        with pytest.raises(ValueError):
+            animated_barplot(frames, "{root}/animated.mp4".format(root=root))
+
+
+def test_gif_frames_written_one_at_a_time():
+    df = pd.read_csv("tests/test_case.csv")
+    groups_df = (
+        df.groupby(["task", "model"])[["val_auroc"]].agg(("mean", "std")).sort_index()
+    )
+    frames = [groups_df * scale for scale in np.linspace(0.5, 1, 5)]
+    path = "test_barplots/streamed.gif"
+    os.makedirs("test_barplots", exist_ok=True)
+    figure, axes = barplot(frames[0], min_value=0, max_value=1)
+    sizes = []
+
+    def figures():
+        for position, frame in enumerate(
+            render_frames(figure, axes, frames, None, {"min_value": 0, "max_value": 1})
+        ):
+            # The previous frames are written before the following one is rendered.
+            if position > 0:
+                sizes.append(os.path.getsize(path))
+            yield frame
+
+    write_gif(path, figures(), fps=2)
+    assert sizes == sorted(set(sizes)) and len(sizes) == len(frames) - 1
+    with Image.open(path) as gif:
+        assert gif.n_frames == len(frames)
+        assert gif.info["duration"] == 500
+        assert gif.info["loop"] == 0
+    plt.close(figure)
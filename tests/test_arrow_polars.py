@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+import matplotlib.pyplot as plt
+from barplots import barplots
+from barplots.utils import aggregate_table
+
+
+def get_test_case() -> pd.DataFrame:
+    """Return the test case, with constant, boolean and range columns."""
+    df = pd.read_csv("tests/test_case.csv")
+    df["flag"] = df.val_auroc > 0.5
+    df["constant"] = 1.0
+    df["identifier"] = np.arange(len(df))
+    return df
+
+
+def get_reference(df: pd.DataFrame, groupby) -> pd.DataFrame:
+    """Return the aggregation of the pandas path of barplots."""
+    df = df[groupby + ["val_auroc"]].copy()
+    for column in groupby:
+        df[column] = df[column].astype(str)
+    return df.groupby(groupby).agg(("mean", "std")).sort_index()
+
+
+def test_polars_frames():
+    pl = pytest.importorskip("polars")
+    df = get_test_case()
+    groupby = ["cell_line", "task", "model"]
+    reference = get_reference(df, groupby)
+    for frame in (pl.from_pandas(df), pl.from_pandas(df).lazy()):
+        groups_df = aggregate_table(frame, groupby, ("mean", "std"))
+        assert groups_df.columns.tolist() == reference.columns.tolist()
+        assert groups_df.index.equals(reference.index)
+        assert np.allclose(groups_df.values, reference.values)
+    barplots(
+        pl.from_pandas(df).lazy(),
+        groupby=groupby,
+        path="test_barplots/polars/{feature}.png",
+    )
+    plt.close()
+
+
+def test_arrow_tables():
+    pa = pytest.importorskip("pyarrow")
+    df = get_test_case()
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    reference = get_reference(df, ["task"])
+    groups_df = aggregate_table(table, ["task"], ("mean", "std"))
+    assert groups_df.columns.tolist() == reference.columns.tolist()
+    assert groups_df.index.equals(reference.index)
+    assert np.allclose(groups_df.values, reference.values)
+    figures_and_axes = barplots(
+        table,
+        groupby=["cell_line", "task", "model"],
+        path="test_barplots/arrow/{feature}.png",
+    )
+    assert len(figures_and_axes) == len(
+        barplots(
+            df,
+            groupby=["cell_line", "task", "model"],
+            path="test_barplots/arrow/{feature}.png",
+        )
+    )
+    plt.close()
+
+
+def test_arrow_and_polars_screening_and_missing_keys():
+    pa = pytest.importorskip("pyarrow")
+    pl = pytest.importorskip("polars")
+    df = get_test_case()
+    # The shuffled row numbers are not a spurious index, as in pandas.
+    df["shuffled"] = np.random.RandomState(42).permutation(len(df))
+    df.loc[df.cell_line == "K562", "cell_line"] = np.nan
+    reference = get_reference(df, ["cell_line"])
+    for table in (
+        pa.Table.from_pandas(df, preserve_index=False),
+        pl.from_pandas(df),
+    ):
+        groups_df = aggregate_table(table, ["cell_line"], ("mean", "std"))
+        assert groups_df.index.equals(reference.index)
+        assert "nan" in groups_df.index
+        assert groups_df.columns.levels[0].tolist() == ["shuffled", "val_auroc"]
+
+
+def test_aggregate_table_rejects_pandas():
+    with pytest.raises(ValueError):
+        aggregate_table(get_test_case(), ["task"], ("mean",))
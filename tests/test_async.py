@@ -0,0 +1,189 @@
+import asyncio
+import threading
+import numpy as np
+import pandas as pd
+import pytest
+from barplots import abarplot, abarplots, barplots
+from barplots.utils import configure_render_executor
+import matplotlib.pyplot as plt
+
+
+def get_groups_df():
+    df = pd.read_csv("tests/test_case.csv")
+    return (
+        df.groupby(["cell_line", "task", "model"])[["val_auroc"]]
+        .agg(("mean", "std"))
+        .sort_index()
+    )
+
+
+def test_abarplot():
+    stages = []
+    figure, axes = asyncio.run(
+        abarplot(
+            get_groups_df(),
+            path="test_barplots/async/barplot.png",
+            checkpoint=stages.append,
+        )
+    )
+    assert len(axes) == 1
+    assert stages == ["drawing", "layout", "encoding"]
+    assert figure.number not in plt.get_fignums()
+
+
+def test_abarplots():
+    df = pd.read_csv("tests/test_case.csv")
+    df["val_auprc"] = np.random.RandomState(42).uniform(size=len(df))
+    df["val_accuracy"] = np.random.RandomState(43).uniform(size=len(df))
+
+    async def collect():
+        return [
+            figure_and_axes
+            async for figure_and_axes in abarplots(
+                df,
+                groupby=["cell_line", "task", "model"],
+                path="test_barplots/async/{feature}.png",
+                verbose=False,
+            )
+        ]
+
+    open_figures = plt.get_fignums()
+    figures_and_axes = asyncio.run(collect())
+    assert len(figures_and_axes) == 3
+    assert plt.get_fignums() == open_figures
+    assert len(figures_and_axes) == len(
+        barplots(
+            df,
+            groupby=["cell_line", "task", "model"],
+            path="test_barplots/async/{feature}.png",
+            verbose=False,
+        )
+    )
+    plt.close("all")
+
+
+def test_abarplot_cancellation():
+    started = threading.Event()
+    resume = threading.Event()
+    stages = []
+
+    def checkpoint(stage: str):
+        stages.append(stage)
+        started.set()
+        resume.wait()
+
+    async def cancel():
+        task = asyncio.ensure_future(abarplot(get_groups_df(), checkpoint=checkpoint))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait)
+        task.cancel()
+        resume.set()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel())
+    # The rendering stopped before laying out the figure.
+    assert stages == ["drawing"]
+    plt.close("all")
+
+
+def test_abarplots_interrupted():
+    df = pd.read_csv("tests/test_case.csv")
+    random_state = np.random.RandomState(42)
+    for position in range(10):
+        df[f"feature_{position}"] = random_state.uniform(size=len(df))
+    stages = []
+    interrupted = threading.Event()
+
+    def checkpoint(stage: str):
+        stages.append(stage)
+        # The rendering is held at the second barplot until the iteration stops.
+        if stages.count("drawing") == 2:
+            interrupted.wait()
+
+    async def first():
+        iterator = abarplots(
+            df,
+            groupby=["cell_line", "task", "model"],
+            checkpoint=checkpoint,
+            verbose=False,
+        )
+        async for figure_and_axes in iterator:
+            break
+        interrupted.set()
+        await iterator.aclose()
+        return figure_and_axes
+
+    open_figures = plt.get_fignums()
+    asyncio.run(first())
+    # The rendering stopped well before drawing all the barplots.
+    assert 1 <= stages.count("drawing") <= 3
+    assert plt.get_fignums() == open_figures
+
+
+def test_abarplots_backpressure():
+    df = pd.read_csv("tests/test_case.csv")
+    random_state = np.random.RandomState(42)
+    for position in range(6):
+        df[f"feature_{position}"] = random_state.uniform(size=len(df))
+    stages = []
+
+    async def consume_slowly():
+        iterator = abarplots(
+            df,
+            groupby=["cell_line", "task", "model"],
+            checkpoint=stages.append,
+            max_pending=1,
+            verbose=False,
+        )
+        async for _ in iterator:
+            break
+        # The rendering waits for the slow consumer.
+        await asyncio.sleep(8)
+        drawn = stages.count("drawing")
+        await iterator.aclose()
+        return drawn
+
+    # At most the consumed barplot, the pending one and the one waiting
+    # to be handed off were drawn.
+    assert asyncio.run(consume_slowly()) <= 3
+
+    async def iterate(**kwargs):
+        async for _ in abarplots(df, groupby=["cell_line", "task", "model"], **kwargs):
+            pass
+
+    with pytest.raises(ValueError):
+        asyncio.run(iterate(template=True, verbose=False))
+    with pytest.raises(ValueError):
+        asyncio.run(iterate(max_pending=0, verbose=False))
+
+
+def test_in_flight_limit():
+    running = []
+    peak = []
+
+    def checkpoint(stage: str):
+        if stage == "drawing":
+            running.append(stage)
+            peak.append(len(running))
+        if stage == "layout":
+            running.pop()
+
+    async def render():
+        await asyncio.gather(
+            *(abarplot(get_groups_df(), checkpoint=checkpoint) for _ in range(3))
+        )
+
+    configure_render_executor(max_workers=2, max_in_flight=1)
+    try:
+        asyncio.run(render())
+    finally:
+        configure_render_executor()
+    assert max(peak) == 1
+    plt.close("all")
+
+
+def test_wrong_executor_configuration():
+    with pytest.raises(ValueError):
+        configure_render_executor(max_workers=0)
+    with pytest.raises(ValueError):
+        configure_render_executor(max_in_flight=0)
@@ -1,5 +1,6 @@
 from barplots.utils.bar_positions import bar_positions
 import pandas as pd
+import pytest
 
 
 def execute_test(df, ground_truth):
@@ -43,3 +44,19 @@ def test_bar_positions():
     )
     execute_test(df2, [0.25, 0.75, 2.25, 2.75, 4.25, 4.75, 6.25, 6.75, 8.25, 8.75])
     execute_test(df3, [0.25, 1.25, 2.25, 3.25, 4.25])
+
+
+def test_bar_positions_statistics():
+    df = pd.read_csv("tests/test_case.csv")
+    df = df.groupby(["cell_line", "model"])["val_auroc"].agg(("mean", "std", "sem"))
+
+    with pytest.raises(ValueError):
+        list(bar_positions(df, 0.5, 0.5))
+
+    interval = df[["mean"]].assign(
+        upper=df["mean"] + df["sem"], lower=df["mean"] - 2 * df["sem"]
+    )
+    for (_, y, (below, above), _), sem in zip(
+        bar_positions(interval, 0.5, 0.5), df["sem"]
+    ):
+        assert below == pytest.approx(2 * sem) and above == pytest.approx(sem)
@@ -0,0 +1,54 @@
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+import matplotlib.pyplot as plt
+from barplots import barplots
+from barplots.utils import bootstrap_confidence_intervals
+
+
+def test_bootstrap_confidence_intervals(monkeypatch):
+    generator = np.random.default_rng(0)
+    codes = generator.integers(0, 3, size=3000)
+    values = generator.normal(codes[:, None] * [1.0, 10.0], [1.0, 2.0])
+
+    lower, upper = bootstrap_confidence_intervals(
+        values, codes, resamples=2000, random_state=42
+    )
+    assert lower.shape == upper.shape == (3, 2)
+
+    for code in range(3):
+        samples = values[codes == code]
+        sem = samples.std(axis=0, ddof=1) / np.sqrt(len(samples))
+        assert np.allclose(lower[code], samples.mean(axis=0) - 1.96 * sem, atol=sem / 3)
+        assert np.allclose(upper[code], samples.mean(axis=0) + 1.96 * sem, atol=sem / 3)
+
+    # The intervals are reproducible, also when computed in batches.
+    module = sys.modules[bootstrap_confidence_intervals.__module__]
+    monkeypatch.setattr(module, "MAX_RESAMPLED_VALUES", values.size * 7)
+    same_lower, same_upper = bootstrap_confidence_intervals(
+        values, codes, resamples=2000, random_state=42
+    )
+    assert (same_lower == lower).all() and (same_upper == upper).all()
+
+    with pytest.raises(ValueError):
+        bootstrap_confidence_intervals(values, codes, resamples=0)
+    with pytest.raises(ValueError):
+        bootstrap_confidence_intervals(values, codes, confidence=1.0)
+
+
+def test_bootstrap_barplots():
+    df = pd.read_csv("tests/test_case.csv")
+    barplots(
+        df,
+        groupby=["cell_line", "task", "model"],
+        error_bars="bootstrap",
+        bootstrap_resamples=200,
+        path="test_barplots/bootstrap/{feature}.png",
+    )
+    plt.close()
+
+    with pytest.raises(ValueError):
+        barplots(df, groupby=["task", "model"], error_bars="sem")
+    with pytest.raises(ValueError):
+        barplots(df, groupby=["task", "model"], error_bars="bootstrap", top_k=2)
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+import matplotlib.pyplot as plt
+from barplots import barplot, barplots
+from barplots.utils import QuantileSketch, aggregate_boxplot_statistics
+from barplots.utils.aggregate_boxplot_statistics import sketch_groups
+
+
+def test_quantile_sketch():
+    generator = np.random.default_rng(0)
+    samples = generator.normal(1.0, 3.0, size=100000)
+    sketch = QuantileSketch(relative_accuracy=0.01).update(samples[:50000])
+    sketch.merge(QuantileSketch(relative_accuracy=0.01).update(samples[50000:]))
+
+    quantiles = (0.0, 0.25, 0.5, 0.75, 1.0)
+    expected = np.quantile(samples, quantiles)
+    assert np.allclose(sketch.quantiles(quantiles), expected, rtol=0.02)
+    assert sketch.count == len(samples)
+    assert np.isclose(sketch.mean, samples.mean())
+
+    with pytest.raises(ValueError):
+        QuantileSketch(relative_accuracy=0)
+    with pytest.raises(ValueError):
+        QuantileSketch().quantiles((0.5,))
+    with pytest.raises(ValueError):
+        sketch.merge(QuantileSketch(relative_accuracy=0.05))
+
+
+def test_sketch_groups_in_chunks():
+    generator = np.random.default_rng(1)
+    samples = generator.normal(size=200000)
+    codes = generator.integers(0, 3, size=len(samples))
+    quantiles = (0.0, 0.25, 0.5, 0.75, 1.0)
+    for code, sketch in enumerate(sketch_groups(samples, codes)):
+        expected = QuantileSketch().update(samples[codes == code])
+        assert sketch.count == expected.count
+        assert np.isclose(sketch.mean, expected.mean)
+        assert np.array_equal(
+            sketch.quantiles(quantiles), expected.quantiles(quantiles)
+        )
+
+
+def test_boxplots():
+    df = pd.read_csv("tests/test_case.csv")
+    groupby = ["cell_line", "task", "model"]
+    statistics = aggregate_boxplot_statistics(df[groupby + ["val_auroc"]], groupby)
+    medians = df.groupby(groupby)["val_auroc"].median().sort_index()
+    assert statistics.index.equals(medians.index)
+    assert np.allclose(statistics[("val_auroc", "med")], medians, rtol=0.05)
+
+    for orientation in ("vertical", "horizontal"):
+        barplots(
+            df,
+            groupby=groupby,
+            boxplot=True,
+            orientation=orientation,
+            path=f"test_barplots/boxplots/{orientation}_{{feature}}.png",
+        )
+        plt.close()
+
+    with pytest.raises(ValueError):
+        barplots(df, groupby=groupby, boxplot=True, top_k=2)
+    with pytest.raises(ValueError):
+        barplots(
+            df.assign(val_auprc=np.random.RandomState(42).uniform(size=len(df))),
+            groupby=groupby,
+            boxplot=True,
+            template=True,
+        )
+    with pytest.raises(ValueError):
+        barplot(df.groupby(groupby)[["val_auroc"]].agg(("mean",)), boxplot=True)
@@ -0,0 +1,115 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from barplots.cli import main
+
+
+def test_cli(capsys):
+    arguments = [
+        "tests/test_case.csv",
+        "--groupby",
+        "cell_line",
+        "task",
+        "model",
+        "--output",
+        "test_barplots/cli/{feature}.png",
+        "--cache",
+        "test_barplots/cli/cache.json",
+    ]
+    assert main(arguments) == 0
+    assert os.path.exists("test_barplots/cli/val_auroc.png")
+    assert "Rendered 1 of 1 barplots" in capsys.readouterr().out
+
+    # The unchanged barplots are not rendered again.
+    assert main(arguments) == 0
+    output = capsys.readouterr().out
+    assert "cached" in output
+    assert "Rendered 0 of 1 barplots" in output
+
+    # Changing the options renders the barplots again.
+    assert main(arguments + ["--spec", '{"orientation":"horizontal"}']) == 0
+    assert "Rendered 1 of 1 barplots" in capsys.readouterr().out
+
+    # The options equal to the defaults of barplot are passed as well.
+    assert main(arguments + ["--spec", '{"unique_minor_labels":false}']) == 0
+    assert "Rendered 1 of 1 barplots" in capsys.readouterr().out
+    assert main(arguments + ["--spec", '{"title":null,"path":null}']) == 0
+    assert "Rendered 1 of 1 barplots" in capsys.readouterr().out
+
+
+def test_cli_jobs(capsys):
+    df = pd.read_csv("tests/test_case.csv")
+    df["val_auprc"] = np.random.RandomState(42).uniform(size=len(df))
+    os.makedirs("test_barplots/cli_jobs", exist_ok=True)
+    df.to_csv("test_barplots/cli_jobs/table.csv", index=False)
+
+    assert (
+        main(
+            [
+                "test_barplots/cli_jobs/table.csv",
+                "-g",
+                "cell_line",
+                "task",
+                "model",
+                "-m",
+                "val_auroc",
+                "val_auprc",
+                "-o",
+                "test_barplots/cli_jobs/{feature}.png",
+                "--jobs",
+                "2",
+                "--no-cache",
+            ]
+        )
+        == 0
+    )
+    assert os.path.exists("test_barplots/cli_jobs/val_auroc.png")
+    assert os.path.exists("test_barplots/cli_jobs/val_auprc.png")
+    assert "Rendered 2 of 2 barplots" in capsys.readouterr().out
+
+
+def test_cli_wrong_arguments():
+    with pytest.raises(SystemExit):
+        main(["tests/test_case.xlsx", "-g", "model"])
+    with pytest.raises(SystemExit):
+        main(["tests/test_case.csv", "-g", "model", "--jobs", "0"])
+    with pytest.raises(SystemExit):
+        main(["tests/test_case.csv", "-g", "model", "--spec", '{"layout":"loose"}'])
+    with pytest.raises(SystemExit):
+        main(["tests/test_case.parquet", "-g", "model", "--watch"])
+
+
+def test_cli_wrong_spec_options(capsys):
+    for spec in ('{"unit":"s"}', '{"letter":"A"}'):
+        with pytest.raises(SystemExit) as exit_info:
+            main(
+                [
+                    "tests/test_case.csv",
+                    "-g",
+                    "cell_line",
+                    "task",
+                    "model",
+                    "-o",
+                    "test_barplots/cli_wrong/{feature}.png",
+                    "--no-cache",
+                    "--spec",
+                    spec,
+                ]
+            )
+        assert exit_info.value.code == 1
+        error = capsys.readouterr().err
+        assert "Traceback" not in error
+        assert "units" in error or "letters" in error
+
+
+def test_cli_output_over_spec_path():
+    arguments = ["tests/test_case.csv", "-g", "cell_line", "task", "model"]
+    spec = ["--spec", '{"path":"test_barplots/cli_spec/{feature}.png"}']
+    assert main(arguments + spec + ["--no-cache", "-q"]) == 0
+    assert os.path.exists("test_barplots/cli_spec/val_auroc.png")
+
+    # The output given on the command line replaces the path of the spec.
+    output = ["-o", "test_barplots/cli_output/{feature}.png"]
+    assert main(arguments + spec + output + ["--no-cache", "-q"]) == 0
+    assert os.path.exists("test_barplots/cli_output/val_auroc.png")
@@ -0,0 +1,32 @@
+import pickle
+import numpy as np
+import pandas as pd
+from barplots.utils import CompactTable, text_positions
+from barplots.utils.bar_positions import bar_positions
+
+
+def test_compact_table():
+    df = pd.read_csv("tests/test_case.csv")
+    groups_df = (
+        df.groupby(["cell_line", "task", "model"])[["val_auroc"]]
+        .agg(("mean", "std"))
+        .sort_index()
+    )
+    table = CompactTable.from_dataframe(groups_df)
+
+    assert len(table) == len(groups_df)
+    assert table.statistics == ("mean", "std")
+    assert all(codes.dtype == np.int32 for codes in table.codes)
+    assert [table.get_index(row) for row in range(len(table))] == list(groups_df.index)
+
+    restored = pickle.loads(pickle.dumps(table))
+    assert (restored.values == table.values).all()
+
+    # The table is laid out as the dataframe it was built from.
+    assert list(bar_positions(table, 0.3, 0.2)) == list(
+        bar_positions(groups_df, 0.3, 0.2)
+    )
+    for level in range(3):
+        assert list(text_positions(table, 0.3, 0.2, level)) == list(
+            text_positions(groups_df, 0.3, 0.2, level)
+        )
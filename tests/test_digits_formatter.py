@@ -0,0 +1,58 @@
+import numpy as np
+from barplots.utils.digits_formatter import DigitsFormatter, sanitize_digits, factors
+from barplots.utils.sanitize_labels import sanitize_labels
+
+
+def linear_sanitize_digits(digit, unit, normalized):
+    unit = "" if unit is None else unit
+    absolute_digit = abs(digit)
+    if (
+        not normalized
+        and digit != 0.0
+        and (absolute_digit <= 1e-3 or absolute_digit >= 1e3)
+    ):
+        for (lower_factor, lower_value), (higher_factor, higher_value) in zip(
+            factors[:-1],
+            factors[1:],
+        ):
+            if absolute_digit < higher_value:
+                if lower_factor == "_":
+                    denominator = higher_value
+                    factor = higher_factor
+                else:
+                    denominator = lower_value
+                    factor = lower_factor
+                digit /= denominator
+                unit = factor + unit
+                break
+
+    return sanitize_labels(digit) + unit
+
+
+def test_digits_formatter():
+    values = [
+        0.0,
+        1e-30,
+        -1e-3,
+        2.5e-4,
+        0.5,
+        -0.75,
+        1.0,
+        999.0,
+        1e3,
+        -12345.0,
+        3e9,
+        1e24,
+        5e27,
+    ]
+    for unit in (None, "s"):
+        for normalized in (True, False):
+            formatter = DigitsFormatter(unit, normalized)
+            expected = [
+                linear_sanitize_digits(value, unit, normalized) for value in values
+            ]
+            assert [
+                sanitize_digits(value, unit, normalized) for value in values
+            ] == expected
+            assert [formatter(value) for value in values] == expected
+            assert formatter.format_ticks(np.array(values)) == expected
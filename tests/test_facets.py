@@ -0,0 +1,32 @@
+import pandas as pd
+import pytest
+from barplots import barplots
+import matplotlib.pyplot as plt
+
+
+def test_facets():
+    root = "test_barplots"
+    df = pd.read_csv("tests/test_case.csv")
+    df["mcc"] = df.val_auroc * 2 - 1
+    results = barplots(
+        df,
+        ["task", "model"],
+        path="{root}/{{feature}}.png".format(root=root),
+        facets=True,
+        units={"mcc": "u"},
+        letters={"mcc": "B"},
+        verbose=False,
+    )
+    assert len(results) == 1
+    _, axes = results[0]
+    assert len(axes) == 2
+    plt.close()
+
+    with pytest.raises(ValueError):
+        barplots(
+            df,
+            ["cell_line", "task", "model"],
+            path="{root}/{{feature}}.png".format(root=root),
+            facets=True,
+            subplots=True,
+        )
@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+from barplots.utils.label_collisions import (
+    get_colliding_labels,
+    thin_colliding_labels,
+    get_auto_rotation,
+)
+from barplots.utils.get_label_layout import get_label_layout
+
+
+def test_label_collisions():
+    random_state = np.random.RandomState(42)
+    for _ in range(20):
+        positions = random_state.uniform(0, 10, size=50)
+        extents = random_state.uniform(0, 0.5, size=50)
+        starts, ends = positions - extents / 2, positions + extents / 2
+        expected = [
+            any(
+                starts[i] < ends[j] and starts[j] < ends[i]
+                for j in range(len(positions))
+                if j != i
+            )
+            for i in range(len(positions))
+        ]
+        assert list(get_colliding_labels(positions, extents)) == expected
+
+        kept = thin_colliding_labels(positions, extents)
+        assert kept.any()
+        assert not get_colliding_labels(positions[kept], extents[kept]).any()
+
+
+def test_auto_rotation():
+    positions = np.arange(10, dtype=float)
+    rotation, shown = get_auto_rotation(positions, [0.5] * 10, 0.2, True)
+    assert rotation == 0 and shown.all()
+    rotation, shown = get_auto_rotation(positions, [2.0] * 10, 0.2, True)
+    assert rotation == 90 and shown.all()
+    rotation, shown = get_auto_rotation(positions, [2.0] * 10, 2.0, True)
+    assert 0 < shown.sum() < 10
+
+
+def test_label_layout_thinning():
+    df = pd.DataFrame(
+        {"value": np.arange(2000)},
+        index=pd.Index([f"label {i}" for i in range(2000)], name="label"),
+    )
+    positions, labels, _, rotation = get_label_layout(
+        df, 0.01, 0.0, 0, 1, False, "auto", "auto", None, False
+    )
+    assert 0 < len(labels) < 2000
+    assert len(positions) == len(labels)
+    assert rotation == 0
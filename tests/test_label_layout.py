@@ -0,0 +1,21 @@
+import pandas as pd
+from barplots.utils import get_text_widths
+from barplots.utils.get_label_layout import get_label_layout, MINOR_LABEL_SIZE
+
+
+def test_label_layout_cache():
+    df = pd.read_csv("tests/test_case.csv")
+    df = df.groupby(["cell_line", "task", "model"])[["val_auroc"]].mean()
+    cache = {}
+    layouts = [
+        get_label_layout(
+            df.loc[cell_line], 0.3, 0.2, 1, 2, True, "auto", "auto", None, True, cache
+        )
+        for cell_line in df.index.levels[0]
+    ]
+    assert len(cache) == 1
+    assert all(layout is layouts[0] for layout in layouts)
+
+    positions, labels, max_label_width, rotation = layouts[0]
+    assert len(positions) == len(labels) == len(df.loc["HelaS3"])
+    assert max_label_width == max(get_text_widths(labels, MINOR_LABEL_SIZE))
@@ -0,0 +1,58 @@
+import pandas as pd
+import pytest
+from barplots import barplots
+import matplotlib.pyplot as plt
+
+
+def test_single_pass_layout():
+    root = "test_barplots"
+    df = pd.read_csv("tests/test_case.csv")
+    barplots(
+        df,
+        ["cell_line", "task", "model"],
+        path="{root}/single_pass_{{feature}}.png".format(root=root),
+        layout="single_pass",
+        letters={"val_auroc": "A"},
+        subplots=True,
+        verbose=False,
+    )
+    plt.close()
+
+    with pytest.raises(ValueError):
+        barplots(
+            df,
+            ["task", "model"],
+            path="{root}/{{feature}}.png".format(root=root),
+            layout="pinco",
+        )
+
+
+def test_single_pass_layout_fits_content():
+    root = "test_barplots"
+    df = pd.read_csv("tests/test_case.csv")
+    for name, kwargs in (
+        ("single", {"groupby": "cell_line"}),
+        ("subplots", {"groupby": ["cell_line", "task", "model"], "subplots": True}),
+    ):
+        sizes = {}
+        for layout in ("tight", "single_pass"):
+            path = "{root}/{name}_{layout}.png".format(
+                root=root, name=name, layout=layout
+            )
+            figure, _ = barplots(
+                df,
+                path=path.replace(".png", "_{feature}.png"),
+                layout=layout,
+                verbose=False,
+                **kwargs,
+            )[0]
+            sizes[layout] = plt.imread(path.replace(".png", "_val_auroc.png")).shape
+            if layout == "single_pass":
+                content = figure.get_tightbbox(figure.canvas.get_renderer())
+                width, height = figure.get_size_inches()
+                assert content.x0 >= 0 and content.y0 >= 0
+                assert content.x1 <= width and content.y1 <= height
+            plt.close()
+
+        assert abs(sizes["tight"][0] - sizes["single_pass"][0]) <= 2
+        assert abs(sizes["tight"][1] - sizes["single_pass"][1]) <= 2
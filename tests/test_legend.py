@@ -0,0 +1,35 @@
+import pandas as pd
+import matplotlib.pyplot as plt
+from barplots import barplots
+from barplots.utils import plot_legend
+
+
+def test_plot_legend():
+    figure, axes = plt.subplots()
+    leaf_styles = {
+        "MLP": {"alpha": 0.5, "color": "red", "edgecolor": None, "hatch": None},
+        "CNN": {"alpha": 0.9, "color": "blue", "edgecolor": "white", "hatch": "x"},
+    }
+    legend = plot_legend(axes, leaf_styles, "best", "model", 8, 9, True, False, None)
+    assert [text.get_text() for text in legend.get_texts()] == ["MLP", "CNN"]
+    assert legend.get_title().get_text() == "model"
+    assert [handle.get_alpha() for handle in legend.legend_handles] == [0.5, 0.9]
+    assert legend.legend_handles[1].get_hatch() == "x"
+    plt.close(figure)
+
+
+def test_shared_legend():
+    root = "test_barplots"
+    df = pd.read_csv("tests/test_case.csv")
+    ((figure, axes),) = barplots(
+        df,
+        ["cell_line", "task", "model"],
+        path="{root}/shared_legend_{{feature}}.png".format(root=root),
+        subplots=True,
+        shared_legend=True,
+        verbose=False,
+    )
+    assert len(figure.legends) == 1
+    assert all(ax.get_legend() is None for ax in axes)
+    assert len(figure.legends[0].get_texts()) == df.model.nunique()
+    plt.close()
@@ -0,0 +1,94 @@
+import pickle
+import pandas as pd
+import pytest
+from barplots import PlotSpec, barplot, barplots
+import matplotlib.pyplot as plt
+
+
+def test_plot_spec():
+    spec = PlotSpec(orientation="horizontal", colors={"simple": "red"})
+    same = PlotSpec(colors={"simple": "red"}, orientation="horizontal")
+
+    assert spec == same
+    assert hash(spec) == hash(same)
+    assert spec.digest == same.digest
+    assert spec != spec.replace(dpi=100)
+    # The given options are kept even when equal to the defaults of barplot.
+    assert spec != spec.replace(dpi=200)
+    assert PlotSpec(unique_minor_labels=False).to_kwargs(only_given=True) == {
+        "unique_minor_labels": False
+    }
+    assert PlotSpec(title=None).to_kwargs(only_given=True) == {"title": None}
+    assert spec.to_json() == '{"colors":{"simple":"red"},"orientation":"horizontal"}'
+    assert PlotSpec.from_json(spec.to_json()) == spec
+    assert pickle.loads(pickle.dumps(spec)) == spec
+    assert spec.to_kwargs()["bar_width"] == 0.3
+
+    with pytest.raises(AttributeError):
+        spec.dpi = 100
+
+    # The options cannot be changed through the returned values.
+    spec.to_kwargs()["colors"]["simple"] = "blue"
+    assert spec.colors == {"simple": "red"}
+
+    # The serialization is lossless, as the tuples are stored as lists.
+    letters = PlotSpec(letter_per_subplot=("A", "B"))
+    assert letters.letter_per_subplot == ["A", "B"]
+    assert pickle.loads(pickle.dumps(letters)).letter_per_subplot == ["A", "B"]
+
+
+def test_wrong_plot_spec():
+    with pytest.raises(ValueError):
+        PlotSpec(orientation="diagonal")
+    with pytest.raises(ValueError):
+        PlotSpec(plots_per_row=0)
+    with pytest.raises(ValueError):
+        PlotSpec(layout="loose")
+    with pytest.raises(ValueError):
+        PlotSpec(template=None)
+    with pytest.raises(ValueError):
+        PlotSpec(colors={"simple": object()})
+    with pytest.raises(ValueError):
+        PlotSpec(colors={1: "red"})
+
+
+def test_barplot_with_plot_spec():
+    df = pd.read_csv("tests/test_case.csv")
+    groups_df = (
+        df.groupby(["cell_line", "task", "model"])[["val_auroc"]]
+        .agg(("mean", "std"))
+        .sort_index()
+    )
+    spec = PlotSpec(orientation="horizontal", subplots=True, height=7)
+    figure, axes = barplot(groups_df, spec=spec)
+    expected_figure, expected_axes = barplot(
+        groups_df, orientation="horizontal", subplots=True, height=7
+    )
+    assert len(axes) == len(expected_axes)
+    assert (figure.get_size_inches() == expected_figure.get_size_inches()).all()
+    plt.close("all")
+
+    results = barplots(
+        df,
+        ["cell_line", "task", "model"],
+        spec=PlotSpec(
+            title="{feature} by model", path="test_barplots/spec/{feature}.png"
+        ),
+        verbose=False,
+    )
+    assert results[0][1][0].get_title() == "Val AUROC BY model"
+    plt.close("all")
+
+    # The options equal to the defaults of barplot replace the different
+    # defaults of barplots.
+    results = barplots(
+        df,
+        ["cell_line", "task", "model"],
+        spec=PlotSpec(title=None, path=None),
+        verbose=False,
+    )
+    assert results[0][1][0].get_title() == ""
+    plt.close("all")
+
+    with pytest.raises(ValueError):
+        barplots(df, ["cell_line", "task", "model"], spec=PlotSpec(unit="s"))
@@ -0,0 +1,30 @@
+import os
+import pandas as pd
+import pytest
+from barplots import RenderPool
+
+
+def test_render_pool():
+    df = pd.read_csv("tests/test_case.csv")
+    groups_df = (
+        df.groupby(["cell_line", "task", "model"])[["val_auroc"]]
+        .agg(("mean", "std"))
+        .sort_index()
+    )
+    spec = {"subplots": True, "title": "AUROC"}
+    with RenderPool(processes=2) as pool:
+        saved = pool.submit(spec, groups_df, path="test_barplots/pool/auroc.png")
+        rendered = pool.submit(spec, groups_df)
+        hela_df = groups_df.loc[["HelaS3"]]
+        hela_df.index = hela_df.index.remove_unused_levels()
+        svg = pool.submit(spec, hela_df, format="svg")
+
+        assert saved.result() == "test_barplots/pool/auroc.png"
+        assert os.path.exists("test_barplots/pool/auroc.png")
+        assert rendered.result().startswith(b"\x89PNG")
+        assert b"<svg" in svg.result()
+
+
+def test_wrong_render_pool():
+    with pytest.raises(ValueError):
+        RenderPool(processes=0)
@@ -0,0 +1,23 @@
+from sanitize_ml_labels import sanitize_ml_labels
+from barplots.utils import (
+    sanitize_labels,
+    get_sanitization_cache_info,
+    clear_sanitization_cache,
+)
+
+
+def test_sanitize_labels():
+    clear_sanitization_cache()
+    custom_defaults = {"P": "promoters", "E": ["enhancers"]}
+    labels = ["vanilla_mlp", "vanilla_cnn", "active_promoters"]
+
+    for _ in range(3):
+        assert sanitize_labels(labels, custom_defaults) == sanitize_ml_labels(
+            labels, custom_defaults=custom_defaults
+        )
+        assert sanitize_labels("val_auroc") == sanitize_ml_labels("val_auroc")
+        assert sanitize_labels(0.5) == sanitize_ml_labels(0.5)
+
+    info = get_sanitization_cache_info()
+    assert info.misses == 3
+    assert info.hits == 6
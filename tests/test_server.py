@@ -0,0 +1,69 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+import pytest
+from barplots.server import RenderServer
+
+
+def post(server, payload):
+    request = urllib.request.Request(
+        f"http://127.0.0.1:{server.server_address[1]}/render",
+        data=json.dumps(payload).encode("utf8"),
+        headers={"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(request, timeout=120) as response:
+        return response.read(), response.headers
+
+
+def test_server():
+    server = RenderServer(("127.0.0.1", 0), root="tests", processes=1, cache_size=2)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    try:
+        payload = {
+            "path": "test_case.csv",
+            "groupby": ["cell_line", "task", "model"],
+            "metric": "val_auroc",
+            "spec": {"subplots": True},
+        }
+
+        results = []
+        requests = [
+            threading.Thread(target=lambda: results.append(post(server, payload)))
+            for _ in range(4)
+        ]
+        for request in requests:
+            request.start()
+        for request in requests:
+            request.join()
+
+        # The identical requests are rendered once.
+        assert server.renders == 1
+        assert len(results) == 4
+        assert all(picture == results[0][0] for picture, _ in results)
+        assert results[0][0].startswith(b"\x89PNG")
+        assert {headers["X-Barplots-Cache"] for _, headers in results} <= {
+            "miss",
+            "coalesced",
+            "hit",
+        }
+
+        picture, headers = post(server, {**payload, "format": "svg"})
+        assert b"<svg" in picture
+        assert headers["Content-Type"] == "image/svg+xml"
+        assert server.renders == 2
+
+        for wrong_payload, status in (
+            ({**payload, "format": "gif"}, 400),
+            ({**payload, "path": "../setup.py"}, 400),
+            ({**payload, "path": "missing.csv"}, 404),
+            ({**payload, "spec": {"orientation": "diagonal"}}, 400),
+        ):
+            with pytest.raises(urllib.error.HTTPError) as error:
+                post(server, wrong_payload)
+            assert error.value.code == status
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
@@ -0,0 +1,50 @@
+import os
+import sqlite3
+import numpy as np
+import pandas as pd
+import pytest
+import matplotlib.pyplot as plt
+from barplots import barplots, sql_barplots
+from barplots.utils import SQLiteTable, aggregate_table
+
+
+def test_sql_barplots():
+    df = pd.read_csv("tests/test_case.csv")
+    df["identifier"] = np.arange(len(df))
+    os.makedirs("test_barplots/sql", exist_ok=True)
+    database = "test_barplots/sql/runs.sqlite"
+    if os.path.exists(database):
+        os.remove(database)
+    with sqlite3.connect(database) as connection:
+        df.to_sql("runs", connection, index=False)
+    connection.close()
+
+    groupby = ["cell_line", "task", "model"]
+    reference = df[groupby + ["val_auroc"]].astype({column: str for column in groupby})
+    reference = reference.groupby(groupby).agg(("mean", "std", "count")).sort_index()
+    groups_df = aggregate_table(
+        SQLiteTable(database, query="SELECT * FROM runs"),
+        groupby,
+        ("mean", "std", "count"),
+    )
+    assert groups_df.columns.tolist() == reference.columns.tolist()
+    assert groups_df.index.equals(reference.index)
+    assert np.allclose(groups_df.values, reference.values.astype(float))
+
+    figures_and_axes = sql_barplots(
+        database,
+        groupby=groupby,
+        table="runs",
+        path="test_barplots/sql/{feature}.png",
+    )
+    assert len(figures_and_axes) == len(
+        barplots(df, groupby=groupby, path="test_barplots/sql/{feature}.png")
+    )
+    plt.close()
+
+
+def test_wrong_sql_barplots():
+    with pytest.raises(ValueError):
+        SQLiteTable(":memory:")
+    with pytest.raises(ValueError):
+        SQLiteTable(":memory:", table="runs", query="SELECT * FROM runs")
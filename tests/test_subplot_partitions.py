@@ -0,0 +1,15 @@
+import pandas as pd
+from barplots.utils import get_subplot_partitions
+
+
+def test_subplot_partitions():
+    df = pd.read_csv("tests/test_case.csv")
+    df = df.groupby(["cell_line", "task", "model"])[["val_auroc"]].mean()
+
+    for shuffled in (df, df.sample(frac=1, random_state=42)):
+        partitions = get_subplot_partitions(shuffled)
+        assert list(partitions.keys()) == list(df.index.levels[0])
+        for cell_line, partition in partitions.items():
+            pd.testing.assert_frame_equal(
+                partition.sort_index(), df.loc[cell_line].sort_index()
+            )
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+from matplotlib.container import BarContainer
+from barplots import barplots
+import matplotlib.pyplot as plt
+
+
+def test_template():
+    root = "test_barplots"
+    df = pd.read_csv("tests/test_case.csv")
+    df["val_auprc"] = np.random.RandomState(42).uniform(size=len(df)) * 100
+    results = barplots(
+        df,
+        ["cell_line", "task", "model"],
+        path="{root}/template_{{feature}}.png".format(root=root),
+        subplots=True,
+        template=True,
+        verbose=False,
+    )
+    assert len(results) == 2
+    figure, axes = results[-1]
+    assert all(result[0] is figure for result in results)
+
+    # The figure shows the bars of the last rendered feature.
+    ax = axes[0]
+    heights = [
+        container.patches[0].get_height()
+        for container in ax.containers
+        if isinstance(container, BarContainer)
+    ]
+    means = (
+        df.groupby(["cell_line", "task", "model"])[["val_auroc", "val_auprc"]]
+        .mean()
+        .loc[ax.get_title()]
+    )
+    assert any(np.allclose(heights, means[column]) for column in means.columns)
+    plt.close()
+
+    with pytest.raises(ValueError):
+        barplots(
+            df,
+            ["cell_line", "task", "model"],
+            path="{root}/{{feature}}.png".format(root=root),
+            template=True,
+            sort_bars=lambda df: df,
+        )
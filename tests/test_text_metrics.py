@@ -0,0 +1,24 @@
+import numpy as np
+from matplotlib.font_manager import FontProperties
+from matplotlib.textpath import TextToPath
+from barplots.utils import get_text_width, get_text_widths
+from barplots.utils.text_metrics import get_glyph_advances
+
+
+def test_text_width():
+    renderer = TextToPath()
+    for text in ("MLP", "Random Forest", "val_auroc", "CNN 1D"):
+        for weight in ("normal", "bold"):
+            expected, _, _ = renderer.get_text_width_height_descent(
+                text, FontProperties(size=10, weight=weight), ismath=False
+            )
+            assert np.isclose(get_text_width(text, 10, weight), expected, rtol=0.05)
+
+    assert get_text_width("", 10) == 0
+    assert get_text_width("WWW", 10) > get_text_width("iii", 10)
+    assert np.isclose(get_text_width("ab", 20), 2 * get_text_width("ab", 10))
+    assert get_text_widths(["a", "ab"], 9) == [
+        get_text_width("a", 9),
+        get_text_width("ab", 9),
+    ]
+    assert set("ab") <= set(get_glyph_advances(9, "normal"))
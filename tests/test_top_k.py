@@ -0,0 +1,51 @@
+import pandas as pd
+import numpy as np
+import pytest
+from barplots import barplots
+from barplots.utils import keep_top_k_leaves
+import matplotlib.pyplot as plt
+
+
+def test_keep_top_k_leaves():
+    df = pd.read_csv("tests/test_case.csv")
+    groups_df = (
+        df.groupby(["cell_line", "task", "model"])[["val_auroc"]]
+        .agg(("mean", "std", "count"))
+        .sort_index()
+    )
+    reduced = keep_top_k_leaves(groups_df, 2)
+
+    for (cell_line, task), group in reduced.groupby(level=[0, 1], sort=False):
+        models = list(group.index.get_level_values(-1))
+        assert len(models) == 3
+        assert models[-1] == "Other"
+        rest = df[
+            (df.cell_line == cell_line)
+            & (df.task == task)
+            & ~df.model.isin(models[:-1])
+        ].val_auroc
+        other = group.iloc[-1]["val_auroc"]
+        assert np.isclose(other["mean"], rest.mean())
+        assert np.isclose(other["std"], rest.std())
+        assert other["count"] == len(rest)
+
+    assert list(reduced.index.levels[-1]).count("Other") == 1
+
+    with pytest.raises(ValueError):
+        keep_top_k_leaves(groups_df, 0)
+
+    with pytest.raises(ValueError):
+        keep_top_k_leaves(groups_df.drop(columns=[("val_auroc", "count")]), 2)
+
+
+def test_top_k_barplots():
+    root = "test_barplots"
+    df = pd.read_csv("tests/test_case.csv")
+    barplots(
+        df,
+        ["cell_line", "task", "model"],
+        path="{root}/top_k_{{feature}}.png".format(root=root),
+        top_k=2,
+        verbose=False,
+    )
+    plt.close()
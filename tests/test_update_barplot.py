@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+from matplotlib.container import BarContainer
+from barplots import barplot, update_barplot
+from barplots.utils import update_bars, save_picture
+import matplotlib.pyplot as plt
+
+
+def get_heights(ax):
+    return [
+        container.patches[0].get_height()
+        for container in ax.containers
+        if isinstance(container, BarContainer)
+    ]
+
+
+def test_update_barplot():
+    df = pd.read_csv("tests/test_case.csv")
+    groups_df = (
+        df.groupby(["cell_line", "task", "model"])[["val_auroc"]]
+        .agg(("mean", "std"))
+        .sort_index()
+    )
+    figure, axes = barplot(groups_df, subplots=True)
+
+    new_df = groups_df.copy()
+    new_df.iloc[0] = (0.5, 0.1)
+    # A bar without error bar gets one.
+    new_df.iloc[-1] = (0.25, 0.05)
+
+    for blit in (False, True):
+        update_barplot(figure, axes, new_df, subplots=True, blit=blit)
+        for ax, (_, sub_df) in zip(axes, new_df.groupby(level=0)):
+            assert np.allclose(get_heights(ax), sub_df[("val_auroc", "mean")])
+
+    # Only the bars whose values changed are updated.
+    first_df = new_df.loc[groups_df.index[0][0]]
+    assert update_bars(axes[0], first_df, 0.3, 0.2, True, 0) == []
+    first_df.iloc[0] = (0.75, 0.1)
+    assert len(update_bars(axes[0], first_df, 0.3, 0.2, True, 0)) == 1
+
+    save_picture("test_barplots/update_barplot.png", figure)
+
+    with pytest.raises(ValueError):
+        update_barplot(figure, axes, new_df.iloc[1:], subplots=True)
+
+    plt.close()
+
+
+def test_update_barplot_limits():
+    df = pd.DataFrame(
+        {"value": [1.0, 2.0, 3.0]},
+        index=pd.Index(["a", "b", "c"], name="letter"),
+    )
+    figure, axes = barplot(df)
+    update_barplot(figure, axes, df * 10, blit=True)
+    assert axes[0].get_ylim()[1] == pytest.approx(30.3)
+    assert get_heights(axes[0]) == [10.0, 20.0, 30.0]
+    plt.close()
@@ -0,0 +1,135 @@
+import os
+import threading
+import time
+import pandas as pd
+import pytest
+from barplots import watch_barplots
+from barplots.utils import RunningAggregates, TableTail
+import matplotlib.pyplot as plt
+
+
+def test_running_aggregates():
+    df = pd.read_csv("tests/test_case.csv")
+    groupby = ["cell_line", "task", "model"]
+    aggregates = RunningAggregates(groupby, ["val_auroc"])
+    assert aggregates.update(df.iloc[:100]) == {"val_auroc"}
+    aggregates.update(df.iloc[100:101])
+    aggregates.update(df.iloc[101:])
+
+    expected = df.groupby(groupby)[["val_auroc"]].agg(("mean", "std")).sort_index()
+    pd.testing.assert_frame_equal(aggregates.get_feature_df("val_auroc"), expected)
+
+    with pytest.raises(ValueError):
+        RunningAggregates(groupby, ["val_auprc"]).get_feature_df("val_auprc")
+
+
+def test_running_aggregates_changes_and_screening():
+    aggregates = RunningAggregates(
+        ["model"], ["score", "other", "index", "constant", "flag", "name"]
+    )
+    rows = pd.DataFrame(
+        {
+            "model": ["A", "A", "B", "B"],
+            "score": [1.0, 1.0, 2.0, 2.0],
+            "other": [1.0, 2.0, 3.0, 4.0],
+            "index": [0, 1, 2, 3],
+            "constant": [5, 5, 5, 5],
+            "flag": [True, False, True, False],
+            "name": ["a", "b", "c", "d"],
+        }
+    )
+    assert aggregates.update(rows) == {
+        "score",
+        "other",
+        "index",
+        "constant",
+        "flag",
+        "name",
+    }
+    assert aggregates.get_plottable_metrics() == ["score", "other"]
+
+    # The metrics whose means and deviations did not change are not changed.
+    assert aggregates.update(rows.iloc[[0, 2]].assign(index=[4, 5])) == {
+        "other",
+        "index",
+    }
+    assert aggregates.get_plottable_metrics() == ["score", "other"]
+
+    # The metrics with missing values are skipped, as barplots does.
+    assert aggregates.update(rows.iloc[[1]].assign(score=None, index=6)) == {
+        "score",
+        "other",
+        "index",
+    }
+    assert aggregates.get_plottable_metrics() == ["other"]
+
+
+def test_table_tail():
+    os.makedirs("test_barplots/tail", exist_ok=True)
+    path = "test_barplots/tail/table.csv"
+    with open(path, "w") as file:
+        file.write("model,score\nA,1\nB,")
+
+    tail = TableTail(path)
+    rows, restarted = tail.read_new_rows()
+    assert rows.to_dict("list") == {"model": ["A"], "score": [1]}
+    assert not restarted
+
+    # The last row is read once completed.
+    with open(path, "a") as file:
+        file.write("2\n")
+    rows, _ = tail.read_new_rows()
+    assert rows.to_dict("list") == {"model": ["B"], "score": [2]}
+    assert tail.read_new_rows() == (None, False)
+
+    with open(path, "w") as file:
+        file.write("model,score\nC,3\n")
+    rows, restarted = tail.read_new_rows()
+    assert rows.to_dict("list") == {"model": ["C"], "score": [3]}
+    assert restarted
+
+
+def test_watch_barplots():
+    df = pd.read_csv("tests/test_case.csv")
+    os.makedirs("test_barplots/watch", exist_ok=True)
+    path = "test_barplots/watch/results.csv"
+    df.iloc[:200].to_csv(path, index=False)
+
+    rendered = []
+    stop = threading.Event()
+    watcher = threading.Thread(
+        target=watch_barplots,
+        args=(path, ["cell_line", "task", "model"]),
+        kwargs={
+            "path": "test_barplots/watch/{feature}.png",
+            "debounce": 0.5,
+            "poll_interval": 0.05,
+            "stop": stop,
+            "on_render": lambda feature, figure, axes: rendered.append(
+                (feature, figure)
+            ),
+        },
+    )
+    watcher.start()
+    try:
+        deadline = time.monotonic() + 60
+        while not rendered and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert [feature for feature, _ in rendered] == ["Val AUROC"]
+        assert os.path.exists("test_barplots/watch/val_auroc.png")
+
+        # A burst of appended rows causes a single rendering.
+        for start in range(200, len(df), 20):
+            df.iloc[start : start + 20].to_csv(
+                path, mode="a", header=False, index=False
+            )
+            time.sleep(0.01)
+        deadline = time.monotonic() + 60
+        while len(rendered) < 2 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        time.sleep(1)
+        assert len(rendered) == 2
+    finally:
+        stop.set()
+        watcher.join()
+    plt.close("all")